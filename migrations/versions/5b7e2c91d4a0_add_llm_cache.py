@@ -0,0 +1,38 @@
+"""Add llm_cache table
+
+Revision ID: 5b7e2c91d4a0
+Revises: 11ad3a852579
+Create Date: 2026-10-17 10:12:41.530218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2c91d4a0'
+down_revision: Union[str, Sequence[str], None] = '11ad3a852579'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'llm_cache',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=128), nullable=False),
+        sa.Column('response', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(op.f('ix_llm_cache_expires_at'), 'llm_cache', ['expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_llm_cache_expires_at'), table_name='llm_cache')
+    op.drop_table('llm_cache')
@@ -0,0 +1,30 @@
+"""Track report inputs for reuse
+
+Revision ID: 8c3f0d6e2b17
+Revises: 5b7e2c91d4a0
+Create Date: 2026-10-17 11:03:09.114527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3f0d6e2b17'
+down_revision: Union[str, Sequence[str], None] = '5b7e2c91d4a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reports', sa.Column('article_ids', sa.JSON(), nullable=True))
+    op.add_column('reports', sa.Column('reference_price', sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('reports', 'reference_price')
+    op.drop_column('reports', 'article_ids')
@@ -0,0 +1,45 @@
+"""Add ticker trigram search indexes
+
+Revision ID: a9c5e1f7b3d2
+Revises: f3a8d2b6c914
+Create Date: 2026-10-17 15:08:41.203517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9c5e1f7b3d2'
+down_revision: Union[str, Sequence[str], None] = 'f3a8d2b6c914'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_tickers_symbol_trgm',
+        'tickers',
+        ['symbol'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'symbol': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_tickers_name_trgm',
+        'tickers',
+        ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tickers_name_trgm', table_name='tickers')
+    op.drop_index('ix_tickers_symbol_trgm', table_name='tickers')
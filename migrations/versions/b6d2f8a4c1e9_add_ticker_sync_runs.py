@@ -0,0 +1,42 @@
+"""Add ticker_sync_runs table
+
+Revision ID: b6d2f8a4c1e9
+Revises: a9c5e1f7b3d2
+Create Date: 2026-10-17 15:47:12.884203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6d2f8a4c1e9'
+down_revision: Union[str, Sequence[str], None] = 'a9c5e1f7b3d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'ticker_sync_runs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('exchange', sa.String(length=32), nullable=False),
+        sa.Column('total', sa.Integer(), nullable=False),
+        sa.Column('inserted', sa.Integer(), nullable=False),
+        sa.Column('updated', sa.Integer(), nullable=False),
+        sa.Column('deactivated', sa.Integer(), nullable=False),
+        sa.Column('unchanged', sa.Integer(), nullable=False),
+        sa.Column('duration_ms', sa.Integer(), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_ticker_sync_runs_finished_at'), 'ticker_sync_runs', ['finished_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ticker_sync_runs_finished_at'), table_name='ticker_sync_runs')
+    op.drop_table('ticker_sync_runs')
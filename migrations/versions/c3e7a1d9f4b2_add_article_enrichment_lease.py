@@ -0,0 +1,28 @@
+"""Add article enrichment lease column
+
+Revision ID: c3e7a1d9f4b2
+Revises: b6d2f8a4c1e9
+Create Date: 2026-10-18 10:12:35.418902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e7a1d9f4b2'
+down_revision: Union[str, Sequence[str], None] = 'b6d2f8a4c1e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('enriching_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('articles', 'enriching_at')
@@ -0,0 +1,37 @@
+"""Add symbol_digests table
+
+Revision ID: d41a9e7c5f30
+Revises: 8c3f0d6e2b17
+Create Date: 2026-10-17 12:20:47.308815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41a9e7c5f30'
+down_revision: Union[str, Sequence[str], None] = '8c3f0d6e2b17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'symbol_digests',
+        sa.Column('symbol', sa.String(length=32), nullable=False),
+        sa.Column('article_ids', sa.JSON(), nullable=False),
+        sa.Column('sentiment', sa.Integer(), nullable=False),
+        sa.Column('one_liner', sa.Text(), nullable=False),
+        sa.Column('themes', sa.JSON(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('symbol'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('symbol_digests')
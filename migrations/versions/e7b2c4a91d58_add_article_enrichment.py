@@ -0,0 +1,41 @@
+"""Add article enrichment columns
+
+Revision ID: e7b2c4a91d58
+Revises: d41a9e7c5f30
+Create Date: 2026-10-17 13:41:26.902184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c4a91d58'
+down_revision: Union[str, Sequence[str], None] = 'd41a9e7c5f30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('articles', sa.Column('digest', sa.Text(), nullable=True))
+    op.add_column('articles', sa.Column('sentiment', sa.Integer(), nullable=True))
+    op.add_column('articles', sa.Column('enriched_at', sa.DateTime(timezone=True), nullable=True))
+    # Keeps the enricher's backlog scan cheap once most rows are enriched.
+    op.create_index(
+        'ix_articles_unenriched_created_at',
+        'articles',
+        ['created_at'],
+        unique=False,
+        postgresql_where=sa.text('enriched_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_unenriched_created_at', table_name='articles')
+    op.drop_column('articles', 'enriched_at')
+    op.drop_column('articles', 'sentiment')
+    op.drop_column('articles', 'digest')
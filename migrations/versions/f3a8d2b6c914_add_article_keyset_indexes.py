@@ -0,0 +1,40 @@
+"""Add article keyset pagination indexes
+
+Revision ID: f3a8d2b6c914
+Revises: e7b2c4a91d58
+Create Date: 2026-10-17 14:22:53.617040
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a8d2b6c914'
+down_revision: Union[str, Sequence[str], None] = 'e7b2c4a91d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_articles_symbol_published_id',
+        'articles',
+        ['symbol', sa.text('published_at DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+    )
+    op.create_index(
+        'ix_articles_published_id',
+        'articles',
+        [sa.text('published_at DESC NULLS LAST'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_articles_published_id', table_name='articles')
+    op.drop_index('ix_articles_symbol_published_id', table_name='articles')
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Optional, Sequence, Set
+import json
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence, Set
 
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response, status
-from sqlalchemy import delete, func, or_, select, update
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Row, Select, delete, func, or_, select, tuple_, union_all, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,30 +16,61 @@ from ..db.models import Article, Report, Ticker, WatchedSymbol
 from ..schemas import (
     ArticleOut,
     BodyBackfillResult,
+    BodyPipelineStats,
+    EnrichmentStats,
+    LLMCacheStats,
+    LLMGatewayStats,
+    ReadinessOut,
     RefreshRequest,
     SymbolOut,
     TickerOut,
     TickerSyncResult,
     WatchlistRequest,
     ReportCreate,
+    ReportJobCreate,
+    ReportJobOut,
     ReportOut,
     MarketSummaryOut,
 )
 from ..services.tickers import sync_tickers_from_finnhub
-from ..util import ensure_list, normalize_symbol, parse_symbols
+from ..util import decode_cursor, encode_cursor, ensure_list, normalize_symbol, parse_symbols
 from ..services.reports import AISummaryService, ReportGenerationError
+from ..services.report_jobs import ReportJobQueue
 from ..services.price_service import PriceService
 
 
 router = APIRouter(prefix="/api", tags=["stock-news"])
 settings = get_settings()
 
+# List endpoints select only these columns (never ``Article.body``) and
+# serialise through pydantic-core directly instead of FastAPI's encoder.
+ARTICLE_OUT_COLUMNS = [getattr(Article, name) for name in ArticleOut.model_fields]
+ARTICLE_LIST = TypeAdapter(List[ArticleOut])
+REPORT_LIST = TypeAdapter(List[ReportOut])
+
+
+def _json_response(adapter: TypeAdapter, items: Sequence[Any]) -> Response:
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
 
 @router.get("/health")
 async def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/ready", response_model=ReadinessOut)
+async def ready(request: Request, response: Response) -> ReadinessOut:
+    warmup = getattr(request.app.state, "warmup", None)
+    if warmup is None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return ReadinessOut(ready=False, subsystems={})
+    if not warmup.ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return ReadinessOut(
+        ready=warmup.ready, subsystems=warmup.status(), errors=dict(warmup.errors)
+    )
+
+
 @router.get("/watchlist", response_model=List[SymbolOut])
 async def get_watchlist(session: AsyncSession = Depends(get_session)) -> List[SymbolOut]:
     result = await session.execute(select(WatchedSymbol).order_by(WatchedSymbol.symbol))
@@ -88,21 +122,79 @@ async def list_news(
         default=None,
         description="Comma separated ticker symbols to filter on.",
     ),
-    limit: int = Query(default=50, le=200),
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque cursor from a previous page's X-Next-Cursor header.",
+    ),
     session: AsyncSession = Depends(get_session),
-) -> List[ArticleOut]:
-    query = select(Article).order_by(
-        Article.published_at.desc().nullslast(), Article.id.desc()
-    )
-    if symbols:
-        selected = parse_symbols(symbols)
-        if selected:
-            query = query.where(Article.symbol.in_(selected))
-
-    query = query.limit(limit)
-    result = await session.execute(query)
-    rows = result.scalars().all()
-    return [ArticleOut.model_validate(row) for row in rows]
+) -> Response:
+    """Newest first by ``(published_at, id)``; pages are fetched by keyset."""
+    position = None
+    if cursor:
+        try:
+            position = decode_cursor(cursor)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail="잘못된 커서입니다.") from exc
+
+    base = select(*ARTICLE_OUT_COLUMNS)
+    selected = parse_symbols(symbols) if symbols else []
+
+    # Dated rows come first (NULLS LAST), so a page is the dated rows below
+    # the cursor, topped up from undated rows once those run out. Each part
+    # is a bounded range scan on the (published_at, id) indexes.
+    rows: List[Row] = []
+    if position is None or position[0] is not None:
+        dated = base.where(Article.published_at.is_not(None))
+        if position is not None:
+            dated = dated.where(tuple_(Article.published_at, Article.id) < tuple_(*position))
+        result = await session.execute(
+            _newest_first(
+                dated,
+                selected,
+                lambda c: (c.published_at.desc().nullslast(), c.id.desc()),
+                limit,
+            )
+        )
+        rows.extend(result.all())
+    if len(rows) < limit:
+        undated = base.where(Article.published_at.is_(None))
+        if position is not None and position[0] is None:
+            undated = undated.where(Article.id < position[1])
+        result = await session.execute(
+            _newest_first(undated, selected, lambda c: (c.id.desc(),), limit - len(rows))
+        )
+        rows.extend(result.all())
+
+    response = _json_response(ARTICLE_LIST, ARTICLE_LIST.validate_python(rows, from_attributes=True))
+    if len(rows) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].published_at, rows[-1].id)
+    return response
+
+
+def _newest_first(
+    stmt: Select,
+    symbols: Sequence[str],
+    order: Callable[[Any], Sequence[Any]],
+    limit: int,
+) -> Select:
+    """``stmt`` ordered by ``order`` and limited, one index range per symbol.
+
+    ``symbol IN (...)`` cannot walk ``ix_articles_symbol_published_id`` in
+    order, so with several symbols each gets its own LIMITed branch and only
+    the branches' heads (at most ``limit`` rows each) are merged and sorted.
+    """
+    if len(symbols) <= 1:
+        if symbols:
+            stmt = stmt.where(Article.symbol == symbols[0])
+        return stmt.order_by(*order(Article)).limit(limit)
+    branches = union_all(
+        *(
+            stmt.where(Article.symbol == symbol).order_by(*order(Article)).limit(limit)
+            for symbol in symbols
+        )
+    ).subquery()
+    return select(*branches.c).order_by(*order(branches.c)).limit(limit)
 
 
 @router.post("/news/refresh", response_model=List[ArticleOut])
@@ -153,22 +245,56 @@ async def backfill_article_bodies(
     return BodyBackfillResult(processed=len(rows), updated=updated)
 
 
+@router.get("/news/body-pipeline", response_model=BodyPipelineStats)
+async def body_pipeline_stats(request: Request) -> BodyPipelineStats:
+    pipeline = getattr(request.app.state, "body_pipeline", None)
+    if pipeline is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Body pipeline is not available.",
+        )
+    return BodyPipelineStats(**pipeline.stats())
+
+
+@router.get("/news/enrichment", response_model=EnrichmentStats)
+async def enrichment_stats(request: Request) -> EnrichmentStats:
+    enricher = getattr(request.app.state, "article_enricher", None)
+    if enricher is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Article enricher is not available.",
+        )
+    return EnrichmentStats(**enricher.stats())
+
+
 @router.get("/tickers", response_model=List[TickerOut])
 async def list_tickers(
+    request: Request,
     query: Optional[str] = Query(default=None, description="Symbol or name search"),
-    limit: int = Query(default=1000, le=10000),
+    limit: int = Query(default=1000, ge=1, le=10000),
     session: AsyncSession = Depends(get_session),
 ) -> List[TickerOut]:
+    index = getattr(request.app.state, "ticker_search", None)
+    if index is not None and index.ready:
+        index.reload_if_stale()
+        return index.search(query, limit) if query else index.list(limit)
+
+    # Cold start: the in-memory index is still loading. The pg_trgm GIN
+    # indexes keep these ILIKE scans off a sequential scan.
     stmt = select(Ticker).where(Ticker.is_active.is_(True)).order_by(Ticker.symbol).limit(limit)
     if query:
-        pattern = f"%{query}%"
-        prefix_pattern = f"{query}%"
+        term = query.strip()
+        pattern = f"%{term}%"
+        prefix_pattern = f"{term}%"
         stmt = (
             select(Ticker)
             .where(Ticker.is_active.is_(True))
-            .where(Ticker.symbol.ilike(pattern))
+            .where(or_(Ticker.symbol.ilike(pattern), Ticker.name.ilike(pattern)))
             .order_by(
+                (func.upper(Ticker.symbol) == term.upper()).desc(),
                 Ticker.symbol.ilike(prefix_pattern).desc(),
+                Ticker.name.ilike(prefix_pattern).desc(),
+                func.length(Ticker.symbol),
                 Ticker.symbol,
             )
             .limit(limit)
@@ -179,13 +305,19 @@ async def list_tickers(
 
 
 @router.post("/tickers/sync", response_model=TickerSyncResult)
-async def sync_tickers(session: AsyncSession = Depends(get_session)) -> TickerSyncResult:
+async def sync_tickers(
+    request: Request, session: AsyncSession = Depends(get_session)
+) -> TickerSyncResult:
     if not settings.finnhub_api_key:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="FINNHUB_API_KEY is required to sync tickers.",
         )
-    return await sync_tickers_from_finnhub(session)
+    result = await sync_tickers_from_finnhub(session)
+    index = getattr(request.app.state, "ticker_search", None)
+    if index is not None:
+        await index.refresh()
+    return result
 
 
 async def _ensure_symbols_exist(
@@ -221,11 +353,74 @@ async def generate_report(
     service = _get_report_service(request)
     try:
         # Always use SMART_BRIEFING regardless of payload.type for now, or let service default
-        return await service.generate_report(payload.symbol, limit=payload.limit)
+        return await service.generate_report(
+            payload.symbol, limit=payload.limit, force=payload.force
+        )
     except ReportGenerationError as exc:
         raise HTTPException(status_code=exc.status_code, detail=str(exc)) from exc
 
 
+@router.post("/reports/generate/stream")
+async def stream_report(payload: ReportCreate, request: Request) -> StreamingResponse:
+    """Server-sent events: ``delta`` chunks, then the stored ``report``."""
+    service = _get_report_service(request)
+    try:
+        events = await service.open_report_stream(
+            payload.symbol, limit=payload.limit, force=payload.force
+        )
+    except ReportGenerationError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc)) from exc
+
+    async def event_source() -> AsyncIterator[str]:
+        async for event, data in events:
+            if event == "report":
+                body = data.model_dump_json()
+            else:
+                body = json.dumps({"text": data}, ensure_ascii=False)
+            yield f"event: {event}\ndata: {body}\n\n"
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _get_report_jobs(request: Request) -> ReportJobQueue:
+    jobs = getattr(request.app.state, "report_jobs", None)
+    if jobs is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Report job queue is not configured.",
+        )
+    return jobs
+
+
+@router.post(
+    "/reports/jobs",
+    response_model=ReportJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_report_job(payload: ReportJobCreate, request: Request) -> ReportJobOut:
+    """Queue a report; identical requests in flight share one job."""
+    jobs = _get_report_jobs(request)
+    try:
+        job = jobs.submit(
+            payload.kind, payload.symbol, limit=payload.limit, force=payload.force
+        )
+    except ReportGenerationError as exc:
+        raise HTTPException(status_code=exc.status_code, detail=str(exc)) from exc
+    return ReportJobOut.model_validate(job)
+
+
+@router.get("/reports/jobs/{job_id}", response_model=ReportJobOut)
+async def get_report_job(job_id: str, request: Request) -> ReportJobOut:
+    job = _get_report_jobs(request).get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="리포트 작업을 찾을 수 없습니다.")
+    return ReportJobOut.model_validate(job)
+
+
 @router.get("/reports/{report_id}", response_model=ReportOut)
 async def get_report(report_id: int, request: Request) -> ReportOut:
     service = _get_report_service(request)
@@ -240,9 +435,9 @@ async def list_reports(
     request: Request,
     symbol: Optional[str] = Query(default=None),
     limit: int = Query(default=10, ge=1, le=50),
-) -> List[ReportOut]:
+) -> Response:
     service = _get_report_service(request)
-    return await service.list_reports(limit=limit, symbol=symbol)
+    return _json_response(REPORT_LIST, await service.list_reports(limit=limit, symbol=symbol))
 
 
 @router.post("/reports/aggregate", response_model=ReportOut)
@@ -255,6 +450,29 @@ async def generate_aggregate_report(request: Request) -> ReportOut:
         raise HTTPException(status_code=exc.status_code, detail=str(exc)) from exc
 
 
+@router.get("/llm/cache", response_model=LLMCacheStats)
+async def llm_cache_stats(request: Request) -> LLMCacheStats:
+    cache = getattr(request.app.state, "llm_cache", None)
+    if cache is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM cache is not enabled.",
+        )
+    return LLMCacheStats(**cache.stats())
+
+
+@router.get("/llm/gateway", response_model=List[LLMGatewayStats])
+async def llm_gateway_stats(request: Request) -> List[LLMGatewayStats]:
+    """Per-provider gateway metrics, in configuration order."""
+    llm_router = getattr(request.app.state, "llm_router", None)
+    if llm_router is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM gateway is not configured.",
+        )
+    return [LLMGatewayStats(**stats) for stats in llm_router.stats()]
+
+
 def _get_price_service(request: Request) -> PriceService:
     service = getattr(request.app.state, "price_service", None)
     if service is None:
@@ -1,10 +1,20 @@
 from functools import lru_cache
 from typing import Dict, List, Optional
 
-from pydantic import Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 from pydantic_settings import BaseSettings
 
 
+class LLMProviderSettings(BaseModel):
+    """An additional OpenAI-compatible backend (hosted API, vLLM, llama.cpp)."""
+
+    name: str
+    base_url: str
+    model: str
+    api_key: Optional[str] = None
+    max_in_flight: Optional[int] = Field(default=None, ge=1)
+
+
 class Settings(BaseSettings):
     """Application configuration loaded from environment variables or .env."""
 
@@ -12,6 +22,7 @@ class Settings(BaseSettings):
     database_url: str = Field(
         default="postgresql+asyncpg://postgres:postgres@db:5432/stockapp"
     )
+    db_create_all: bool = True
     finnhub_api_key: Optional[str] = None
     finnhub_api_base_url: HttpUrl = Field(
         default="https://finnhub.io/api/v1/company-news"
@@ -21,17 +32,78 @@ class Settings(BaseSettings):
     )
     finnhub_quote_url: HttpUrl = Field(default="https://finnhub.io/api/v1/quote")
     finnhub_symbol_exchange: str = Field(default="US")
+    finnhub_calls_per_minute: int = Field(default=60, ge=1)
+    finnhub_burst: int = Field(default=10, ge=1)
+    finnhub_max_retries: int = Field(default=3, ge=0)
+    ticker_sync_interval_hours: float = Field(default=24.0, ge=0)
+    quote_cache_ttl_seconds: float = Field(default=15.0, ge=0)
+    quote_cache_stale_seconds: float = Field(default=60.0, ge=0)
+    quote_cache_max_entries: int = Field(default=5000, ge=1)
+    trade_stream_enabled: bool = False
+    finnhub_ws_url: str = Field(default="wss://ws.finnhub.io")
+    trade_tick_interval_seconds: float = Field(default=1.0, gt=0)
+    trade_price_max_age_seconds: float = Field(default=300.0, gt=0)
     fetch_interval_seconds: int = Field(default=60, ge=15)
     fetch_daily_hour: Optional[int] = Field(default=9, ge=0, le=23)
     fetch_timezone: str = Field(default="Asia/Seoul")
+    adaptive_polling: bool = False
+    poll_base_interval_seconds: float = Field(default=300.0, gt=0)
+    poll_min_interval_seconds: float = Field(default=30.0, gt=0)
+    poll_max_interval_seconds: float = Field(default=3600.0, gt=0)
+    watchlist_refresh_seconds: float = Field(default=60.0, gt=0)
     initial_fetch_on_startup: bool = True
+    poller_election_enabled: bool = True
+    poller_lock_key: int = Field(default=7301, ge=0, le=2**31 - 1)
+    poller_shard_count: int = Field(default=1, ge=1)
+    poller_election_retry_seconds: float = Field(default=10.0, gt=0)
+    poller_orphan_grace_seconds: float = Field(default=30.0, ge=0)
     max_articles_per_symbol: int = Field(default=50, ge=1)
+    dispatch_concurrency: int = Field(default=8, ge=1)
+    body_worker_count: int = Field(default=4, ge=1)
+    body_queue_size: int = Field(default=1000, ge=1)
+    body_write_batch_size: int = Field(default=20, ge=1)
+    body_flush_interval_seconds: float = Field(default=2.0, gt=0)
+    ws_send_queue_size: int = Field(default=64, ge=1)
+    broadcast_backend: str = Field(default="memory")
+    broadcast_channel: str = Field(default="news_articles")
     allowed_origins: List[str] = Field(default_factory=lambda: ["*"])
     llm_api_key: Optional[str] = Field(default=None)
     llm_model: str = Field(default="gpt-4o-mini")
     llm_base_url: Optional[HttpUrl] = Field(default="https://api.openai.com/v1")
     llm_provider: str = Field(default="openai")
+    llm_max_in_flight: int = Field(default=8, ge=1)
+    llm_max_retries: int = Field(default=3, ge=0)
+    llm_timeout_seconds: float = Field(default=60.0, gt=0)
+    llm_breaker_failure_threshold: int = Field(default=5, ge=1)
+    llm_breaker_reset_seconds: float = Field(default=30.0, gt=0)
+    llm_providers: List[LLMProviderSettings] = Field(default_factory=list)
+    llm_hedging_enabled: bool = False
+    llm_hedge_min_delay_seconds: float = Field(default=1.0, gt=0)
+    llm_latency_prior_seconds: float = Field(default=5.0, ge=0)
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: float = Field(default=3600.0, gt=0)
+    llm_cache_max_entries: int = Field(default=512, ge=1)
+    enrich_batch_size: int = Field(default=20, ge=1, le=50)
+    enrich_interval_seconds: float = Field(default=60.0, gt=0)
+    enrich_settle_seconds: float = Field(default=20.0, ge=0)
+    enrich_body_chars: int = Field(default=1500, ge=200)
+    enrich_lease_seconds: float = Field(default=600.0, gt=0)
     report_article_lookback_days: int = Field(default=3, ge=1, le=14)
+    report_reuse_price_threshold_percent: float = Field(default=1.0, ge=0)
+    report_reuse_max_age_minutes: int = Field(default=720, ge=0)
+    report_context_token_budget: int = Field(default=3000, ge=200)
+    report_context_token_budgets: Dict[str, int] = Field(default_factory=dict)
+    report_summary_max_tokens: int = Field(default=120, ge=20)
+    report_duplicate_similarity: float = Field(default=0.8, gt=0, le=1)
+    digest_context_token_budget: int = Field(default=800, ge=100)
+    digest_concurrency: int = Field(default=8, ge=1)
+    briefing_times: List[str] = Field(default_factory=list)
+    briefing_lead_minutes: int = Field(default=15, ge=0)
+    briefing_concurrency: int = Field(default=2, ge=1)
+    briefing_weekdays_only: bool = True
+    report_job_workers: int = Field(default=2, ge=1)
+    report_job_queue_size: int = Field(default=100, ge=1)
+    report_job_ttl_seconds: float = Field(default=900.0, gt=0)
     market_indices: List[str] = Field(
         default_factory=lambda: ["^IXIC", "^GSPC"]
     )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Index, String, Text, UniqueConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .session import Base
@@ -22,6 +22,22 @@ class Ticker(Base):
     )
 
 
+class TickerSyncRun(Base):
+    __tablename__ = "ticker_sync_runs"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    exchange: Mapped[str] = mapped_column(String(32))
+    total: Mapped[int] = mapped_column()
+    inserted: Mapped[int] = mapped_column()
+    updated: Mapped[int] = mapped_column()
+    deactivated: Mapped[int] = mapped_column()
+    unchanged: Mapped[int] = mapped_column()
+    duration_ms: Mapped[int] = mapped_column()
+    finished_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
+
+
 class WatchedSymbol(Base):
     __tablename__ = "watched_symbols"
 
@@ -42,6 +58,18 @@ class Article(Base):
     __tablename__ = "articles"
     __table_args__ = (
         UniqueConstraint("symbol", "external_id", name="uq_symbol_external"),
+        # Keyset pagination on /api/news walks these in (published_at, id) order.
+        Index(
+            "ix_articles_symbol_published_id",
+            "symbol",
+            text("published_at DESC NULLS LAST"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_articles_published_id",
+            text("published_at DESC NULLS LAST"),
+            text("id DESC"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -55,6 +83,10 @@ class Article(Base):
     external_id: Mapped[str | None] = mapped_column(String(256))
     published_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     body: Mapped[str | None] = mapped_column(Text())
+    digest: Mapped[str | None] = mapped_column(Text())
+    sentiment: Mapped[int | None] = mapped_column()
+    enriched_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    enriching_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -71,6 +103,34 @@ class Report(Base):
     )
     type: Mapped[str] = mapped_column(String(32))
     content: Mapped[str] = mapped_column(Text())
+    # Inputs the report was built from, used to skip regeneration when unchanged.
+    article_ids: Mapped[list[int] | None] = mapped_column(JSON)
+    reference_price: Mapped[float | None] = mapped_column(Float)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+
+class LLMCacheEntry(Base):
+    __tablename__ = "llm_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(String(128))
+    response: Mapped[str] = mapped_column(Text())
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+
+
+class SymbolDigest(Base):
+    __tablename__ = "symbol_digests"
+
+    symbol: Mapped[str] = mapped_column(String(32), primary_key=True)
+    article_ids: Mapped[list[int]] = mapped_column(JSON)
+    sentiment: Mapped[int] = mapped_column()
+    one_liner: Mapped[str] = mapped_column(Text())
+    themes: Mapped[list[str]] = mapped_column(JSON, default=list)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
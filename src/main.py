@@ -7,15 +7,25 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import get_settings
-from .db.session import SessionLocal, init_db
+from .db.session import SessionLocal
+from .streaming.broadcast import build_broadcast_backend
 from .streaming.dispatcher import ConnectionManager, NewsDispatcher
+from .streaming.trades import PriceTable, TradeStreamIngestor
 from .news.fetcher import NewsFetcher, NewsStreamLoop, ArticleBodyFetcher
-from .services.tickers import sync_tickers_from_finnhub
+from .news.body_pipeline import ArticleBodyPipeline
+from .news.enricher import ArticleEnricher
+from .news.leader import PollerElection
+from .services.ticker_search import TickerSearchIndex
 from .api.routes import router
 from .util import parse_symbols
-from .services.llm_service import LLMService
+from .services.llm_cache import CachedLLMService
+from .services.llm_router import build_llm_router
+from .services.finnhub import get_finnhub_client
 from .services.price_service import PriceService
+from .services.briefings import BriefingScheduler
+from .services.report_jobs import ReportJobQueue
 from .services.reports import AISummaryService
+from .services.startup import StartupWarmup
 
 
 settings = get_settings()
@@ -30,49 +40,98 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 connection_manager = ConnectionManager()
+broadcaster = build_broadcast_backend(connection_manager, SessionLocal)
 news_fetcher = NewsFetcher()
 article_body_fetcher = ArticleBodyFetcher()
+body_pipeline = ArticleBodyPipeline(SessionLocal, article_body_fetcher)
+llm_router = build_llm_router()
+article_enricher = ArticleEnricher(SessionLocal, llm_router)
 dispatcher = NewsDispatcher(
-    SessionLocal, news_fetcher, connection_manager, article_body_fetcher
+    SessionLocal, news_fetcher, broadcaster, body_pipeline, enricher=article_enricher
 )
 stream_loop = NewsStreamLoop(news_fetcher, dispatcher)
 app.state.dispatcher = dispatcher
 app.state.body_fetcher = article_body_fetcher
-llm_base_url = str(settings.llm_base_url) if settings.llm_base_url else None
-llm_service = LLMService(settings.llm_api_key, llm_base_url, settings.llm_model)
-price_service = PriceService()
-ai_summary_service = AISummaryService(SessionLocal, llm_service, price_service)
+app.state.body_pipeline = body_pipeline
+app.state.article_enricher = article_enricher
+ticker_search = TickerSearchIndex(SessionLocal)
+app.state.ticker_search = ticker_search
+llm_cache = (
+    CachedLLMService(llm_router, SessionLocal) if settings.llm_cache_enabled else None
+)
+live_prices = PriceTable() if settings.trade_stream_enabled else None
+price_service = PriceService(live_prices=live_prices)
+trade_ingestor = (
+    TradeStreamIngestor(SessionLocal, live_prices, broadcaster)
+    if live_prices is not None
+    else None
+)
+# One upstream trade subscription per deployment, held by shard 0's process.
+poller_election = PollerElection(
+    stream_loop, dispatcher, singletons=[trade_ingestor] if trade_ingestor else ()
+)
+app.state.poller_election = poller_election
+ai_summary_service = AISummaryService(
+    SessionLocal, llm_cache or llm_router, price_service
+)
+report_jobs = ReportJobQueue(ai_summary_service, notifier=broadcaster)
+stream_loop.briefings = BriefingScheduler(
+    ai_summary_service, dispatcher, stream_loop.timezone
+)
 app.state.ai_summary_service = ai_summary_service
+app.state.report_jobs = report_jobs
 app.state.price_service = price_service
+app.state.llm_cache = llm_cache
+app.state.llm_router = llm_router
+
+
+async def start_services() -> None:
+    await body_pipeline.start()
+    await article_enricher.start()
+    await broadcaster.start()
+    await report_jobs.start()
+    if settings.poller_election_enabled:
+        await poller_election.start()
+    else:
+        await stream_loop.start()
+        if trade_ingestor:
+            await trade_ingestor.start()
+
+
+# Chromium and the OpenAI client are created on first use, not here.
+warmup = StartupWarmup(
+    SessionLocal,
+    ticker_search,
+    start_services=start_services,
+    probes={
+        "body_fetcher": lambda: article_body_fetcher.warm,
+        "llm_client": lambda: llm_router.warm,
+    },
+)
+app.state.warmup = warmup
 
 
 @app.on_event("startup")
 async def startup_event() -> None:
-    await init_db()
-    if settings.finnhub_api_key:
-        async with SessionLocal() as session:
-            try:
-                result = await sync_tickers_from_finnhub(session)
-                if result.inserted_or_updated:
-                    logger.info(
-                        "Synced %s tickers (payload %s)",
-                        result.inserted_or_updated,
-                        result.total,
-                    )
-            except Exception as exc:  # pragma: no cover
-                logger.warning("Ticker sync failed: %s", exc)
-    else:
-        logger.warning("FINNHUB_API_KEY missing; ticker sync skipped.")
-    await article_body_fetcher.start()
-    await stream_loop.start()
+    await warmup.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event() -> None:
+    await warmup.stop()
+    await poller_election.stop()
     await stream_loop.stop()
+    if trade_ingestor:
+        await trade_ingestor.stop()
+    await report_jobs.stop()
+    await get_finnhub_client().close()
+    await broadcaster.stop()
+    await article_enricher.stop()
+    await body_pipeline.stop()
     await article_body_fetcher.stop()
 
 
@@ -88,6 +147,6 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
             symbols = message.get("symbols")
             if symbols:
                 await connection_manager.subscribe(websocket, symbols)
-                await websocket.send_json({"ack": list(symbols)})
+                await connection_manager.send(websocket, {"ack": list(symbols)})
     except WebSocketDisconnect:
         await connection_manager.disconnect(websocket)
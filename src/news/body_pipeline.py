@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import get_settings
+from ..db.models import Article
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BodyJob:
+    article_id: int
+    url: str
+
+
+class ArticleBodyPipeline:
+    """Extracts article bodies off the polling path with a pool of workers.
+
+    Newly inserted articles are queued by the dispatcher; workers drain the
+    queue through the shared ``ArticleBodyFetcher`` page pool and the
+    extracted bodies are written back in batches.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        body_fetcher,
+        *,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        self._sessions = session_factory
+        self._fetcher = body_fetcher
+        self._worker_count = workers or settings.body_worker_count
+        self._batch_size = batch_size or settings.body_write_batch_size
+        self._flush_interval = flush_interval or settings.body_flush_interval_seconds
+        self._queue: asyncio.Queue[BodyJob] = asyncio.Queue(
+            maxsize=queue_size or settings.body_queue_size
+        )
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._tasks: List[asyncio.Task[None]] = []
+        self._busy = 0
+        self._processed = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._dropped = 0
+        self._written = 0
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+        ]
+        self._tasks.append(asyncio.create_task(self._flush_loop()))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+    def submit(self, articles: Sequence[Any]) -> int:
+        """Queue articles (anything with ``id`` and ``url``) without blocking."""
+        accepted = dropped = 0
+        for article in articles:
+            if not article.url:
+                continue
+            try:
+                self._queue.put_nowait(BodyJob(article.id, str(article.url)))
+                accepted += 1
+            except asyncio.QueueFull:
+                dropped += 1
+        if dropped:
+            self._dropped += dropped
+            logger.warning("Body queue full; dropped %s article(s)", dropped)
+        return accepted
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+            try:
+                async with self._sessions() as session:
+                    await session.execute(update(Article), rows)
+                    await session.commit()
+            except Exception as exc:
+                logger.warning("Writing %s article bodies failed: %s", len(rows), exc)
+                return 0
+            self._written += len(rows)
+            return len(rows)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "workers": self._worker_count,
+            "busy_workers": self._busy,
+            "utilisation": self._busy / self._worker_count,
+            "processed": self._processed,
+            "succeeded": self._succeeded,
+            "failed": self._failed,
+            "dropped": self._dropped,
+            "pending_writes": len(self._pending),
+            "written": self._written,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self._busy += 1
+            try:
+                body = await self._fetcher.fetch(job.url)
+            except Exception:
+                body = None
+            finally:
+                self._busy -= 1
+                self._processed += 1
+                self._queue.task_done()
+            if not body:
+                self._failed += 1
+                continue
+            self._succeeded += 1
+            self._pending.append({"id": job.article_id, "body": body})
+            if len(self._pending) >= self._batch_size:
+                await self.flush()
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
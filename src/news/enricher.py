@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import get_settings
+from ..db.models import Article
+from ..services.limits import Priority
+from ..services.llm_gateway import llm_priority_scope
+from ..services.llm_service import LLMServiceError
+from ..services.prompts import PromptManager
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class ArticleEnricher:
+    """Summarises new articles once, in batches, and stores the result.
+
+    Articles without ``enriched_at`` are claimed ``batch_size`` at a time by
+    stamping an ``enriching_at`` lease in a short transaction (``SKIP
+    LOCKED`` keeps concurrent instances apart), sent to the LLM with no
+    transaction or row lock open, and written back in a second transaction
+    with a compact Korean ``digest`` and a 0-100 ``sentiment``. A lease
+    older than ``lease_seconds`` (a crashed instance) can be claimed again.
+    Articles are left for ``settle_seconds`` after insert so the body
+    pipeline can fill ``body``, and only those inserted within the report
+    lookback window are claimed, so the historical backlog is never sent.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        llm_service,
+        *,
+        batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+        settle_seconds: Optional[float] = None,
+        body_chars: Optional[int] = None,
+        lease_seconds: Optional[float] = None,
+    ) -> None:
+        self._sessions = session_factory
+        self._llm = llm_service
+        self._batch_size = batch_size or settings.enrich_batch_size
+        self._interval = interval or settings.enrich_interval_seconds
+        self._settle = timedelta(
+            seconds=settle_seconds if settle_seconds is not None else settings.enrich_settle_seconds
+        )
+        self._body_chars = body_chars or settings.enrich_body_chars
+        self._lease = timedelta(seconds=lease_seconds or settings.enrich_lease_seconds)
+        self._lookback = timedelta(days=settings.report_article_lookback_days)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._batches = 0
+        self._enriched = 0
+        self._skipped = 0
+        self._failed_batches = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is not None or not self._llm.enabled:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def notify(self) -> None:
+        """Called after new articles are inserted; never blocks the caller."""
+        self._wakeup.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "batches": self._batches,
+            "enriched": self._enriched,
+            "skipped": self._skipped,
+            "failed_batches": self._failed_batches,
+        }
+
+    async def enrich_next_batch(self) -> int:
+        """Claim and enrich one batch; returns the number of articles claimed."""
+        rows = await self._claim()
+        if not rows:
+            return 0
+        try:
+            with llm_priority_scope(Priority.BACKGROUND):
+                content = await self._llm.complete(
+                    system_prompt=PromptManager.build_system_prompt(),
+                    user_prompt=PromptManager.build_article_batch_prompt(
+                        [self._excerpt(row) for row in rows]
+                    ),
+                    temperature=0.1,
+                    max_tokens=100 * len(rows) + 100,
+                )
+            parsed = self._parse(content)
+            if not parsed:
+                raise ValueError("response contained no article summaries")
+        except (LLMServiceError, ValueError) as exc:
+            # Rows go back to the backlog and are picked up by a later pass.
+            self._failed_batches += 1
+            logger.warning("Article enrichment batch failed: %s", exc)
+            await self._release([row.id for row in rows])
+            return 0
+
+        now = datetime.now(timezone.utc)
+        updates = []
+        for row in rows:
+            # Articles the model left out are marked too, so each one is
+            # sent at most once; reports fall back to the raw summary.
+            item = parsed.get(row.id)
+            if item is None:
+                self._skipped += 1
+            else:
+                self._enriched += 1
+            updates.append(
+                {
+                    "id": row.id,
+                    "digest": item["summary"] if item else None,
+                    "sentiment": item["sentiment"] if item else None,
+                    "enriched_at": now,
+                    "enriching_at": None,
+                }
+            )
+        async with self._sessions() as session:
+            await session.execute(update(Article), updates)
+            await session.commit()
+        self._batches += 1
+        return len(rows)
+
+    async def _claim(self) -> Sequence[Any]:
+        """Lease a batch in its own short transaction and return its rows."""
+        now = datetime.now(timezone.utc)
+        candidates = (
+            select(Article.id)
+            .where(Article.enriched_at.is_(None))
+            .where(Article.created_at <= now - self._settle)
+            # Older rows never reach a report prompt; enriching them would
+            # only burn LLM calls after the column is first added.
+            .where(Article.created_at >= now - self._lookback)
+            .where(
+                or_(
+                    Article.enriching_at.is_(None),
+                    Article.enriching_at < now - self._lease,
+                )
+            )
+            .order_by(Article.created_at.desc())
+            .limit(self._batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        async with self._sessions() as session:
+            result = await session.execute(
+                update(Article)
+                .where(Article.id.in_(candidates.scalar_subquery()))
+                .values(enriching_at=now)
+                .returning(Article.id, Article.headline, Article.summary, Article.body)
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+            await session.commit()
+        return rows
+
+    async def _release(self, ids: Sequence[int]) -> None:
+        async with self._sessions() as session:
+            await session.execute(
+                update(Article)
+                .where(Article.id.in_(ids))
+                .values(enriching_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                claimed = await self.enrich_next_batch()
+            except Exception:
+                logger.exception("Article enrichment failed")
+                claimed = 0
+            if claimed >= self._batch_size:
+                continue
+            self._wakeup.clear()
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._interval)
+            # Give the body pipeline a head start on freshly inserted rows.
+            await asyncio.sleep(self._settle.total_seconds())
+
+    def _excerpt(self, row: Any) -> Dict[str, Any]:
+        text = (row.body or row.summary or "").strip()
+        return {"id": row.id, "headline": row.headline, "text": text[: self._body_chars]}
+
+    @staticmethod
+    def _parse(content: str) -> Dict[int, Dict[str, Any]]:
+        content = content.strip()
+        if content.startswith("```"):
+            content = content.strip("`").removeprefix("json").strip()
+        document = json.loads(content)
+        items = document.get("articles", []) if isinstance(document, dict) else document
+        parsed: Dict[int, Dict[str, Any]] = {}
+        for item in items:
+            try:
+                article_id = int(item["id"])
+                summary = str(item["summary"]).strip()
+                sentiment = max(0, min(100, int(item.get("sentiment", 50))))
+            except (KeyError, TypeError, ValueError):
+                continue
+            if summary:
+                parsed[article_id] = {"summary": summary, "sentiment": sentiment}
+        return parsed
+
@@ -2,23 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import logging
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-import httpx
-
 from ..config import get_settings
+from ..services.finnhub import FinnhubClient, get_finnhub_client
+from ..services.limits import Priority
+from .scheduler import AdaptivePollScheduler
 
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class NewsFetcher:
     """Fetches stock-related news from a third-party API."""
 
-    def __init__(self) -> None:
-        self._client = httpx.AsyncClient(timeout=15)
+    def __init__(self, client: Optional[FinnhubClient] = None) -> None:
+        self._client = client or get_finnhub_client()
 
     async def fetch(
         self, symbol: str, since: Optional[datetime] = None, limit: int = 10
@@ -36,15 +40,13 @@ class NewsFetcher:
             "symbol": symbol.upper(),
             "from": start.date().isoformat(),
             "to": now.date().isoformat(),
-            "token": settings.finnhub_api_key,
         }
 
-        response = await self._client.get(
+        data = await self._client.get(
             str(settings.finnhub_api_base_url),
-            params=params,
+            params,
+            priority=Priority.BACKGROUND,
         )
-        response.raise_for_status()
-        data = response.json()
         articles = []
         for item in data:
             if not item.get("url"):
@@ -65,9 +67,6 @@ class NewsFetcher:
             )
         return articles[:limit]
 
-    async def close(self) -> None:
-        await self._client.aclose()
-
     def _mock_payload(self, symbol: str, limit: int) -> List[Dict[str, Any]]:
         now = datetime.now(timezone.utc)
         articles = []
@@ -95,30 +94,55 @@ class NewsFetcher:
 class NewsStreamLoop:
     """Background task that polls for news and notifies observers."""
 
-    def __init__(self, fetcher: NewsFetcher, dispatcher: "NewsDispatcher") -> None:
+    def __init__(
+        self,
+        fetcher: NewsFetcher,
+        dispatcher: "NewsDispatcher",
+        briefings: Optional["BriefingScheduler"] = None,
+    ) -> None:
         self.fetcher = fetcher
         self.dispatcher = dispatcher
+        self.briefings = briefings
         self._task: Optional[asyncio.Task[None]] = None
         self._running = False
         self._timezone = self._resolve_timezone(settings.fetch_timezone)
+        self.scheduler: Optional[AdaptivePollScheduler] = (
+            AdaptivePollScheduler() if settings.adaptive_polling else None
+        )
+
+    @property
+    def timezone(self) -> ZoneInfo:
+        return self._timezone
+
+    @property
+    def running(self) -> bool:
+        return self._running
 
     async def start(self) -> None:
         if self._running:
             return
         self._running = True
         self._task = asyncio.create_task(self._poll_loop())
+        if self.briefings is not None:
+            await self.briefings.start()
 
     async def stop(self) -> None:
         if not self._running:
             return
         self._running = False
+        if self.briefings is not None:
+            await self.briefings.stop()
         if self._task:
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
-        await self.fetcher.close()
+            self._task = None
 
     async def _poll_loop(self) -> None:
+        if self.scheduler is not None:
+            await self._adaptive_loop(self.scheduler)
+            return
+
         if settings.initial_fetch_on_startup:
             await self.dispatcher.broadcast_latest()
 
@@ -129,6 +153,33 @@ class NewsStreamLoop:
                 break
             await self.dispatcher.broadcast_latest()
 
+    async def _adaptive_loop(self, scheduler: AdaptivePollScheduler) -> None:
+        refresh_every = settings.watchlist_refresh_seconds
+        next_refresh = datetime.now(timezone.utc)
+        while self._running:
+            now = datetime.now(timezone.utc)
+            if now >= next_refresh:
+                try:
+                    scheduler.sync(await self.dispatcher.list_symbols(), now)
+                except Exception as exc:
+                    logger.warning("Watchlist refresh failed: %s", exc)
+                next_refresh = now + timedelta(seconds=refresh_every)
+
+            due = scheduler.due(now)
+            if due:
+                articles = await self.dispatcher.broadcast_latest(due)
+                counts = Counter(article.symbol for article in articles)
+                finished = datetime.now(timezone.utc)
+                for symbol in due:
+                    scheduler.record(symbol, counts[symbol], finished)
+
+            now = datetime.now(timezone.utc)
+            wait_seconds = (next_refresh - now).total_seconds()
+            until_due = scheduler.seconds_until_next(now)
+            if until_due is not None:
+                wait_seconds = min(wait_seconds, until_due)
+            await asyncio.sleep(max(wait_seconds, 0.0))
+
     def _seconds_until_next_run(self) -> float:
         if settings.fetch_daily_hour is None:
             return float(settings.fetch_interval_seconds)
@@ -151,12 +202,21 @@ class NewsStreamLoop:
 
 
 class ArticleBodyFetcher:
-    """Fetches raw article body text via Playwright."""
+    """Fetches raw article body text via a pool of reusable Playwright pages.
+
+    The browser is launched by the first ``fetch``, not at startup.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, pool_size: Optional[int] = None) -> None:
         self._playwright = None
         self._browser: Optional[Any] = None
         self._lock = asyncio.Lock()
+        self._pool_size = pool_size or settings.body_worker_count
+        self._pages: asyncio.Queue[Any] = asyncio.Queue()
+
+    @property
+    def warm(self) -> bool:
+        return self._browser is not None
 
     async def start(self) -> None:
         from playwright.async_api import async_playwright
@@ -165,6 +225,8 @@ class ArticleBodyFetcher:
             return
         self._playwright = await async_playwright().start()
         self._browser = await self._playwright.chromium.launch(headless=True)
+        for _ in range(self._pool_size):
+            self._pages.put_nowait(await self._new_page())
 
     async def stop(self) -> None:
         if self._browser:
@@ -173,6 +235,7 @@ class ArticleBodyFetcher:
             await self._playwright.stop()
         self._browser = None
         self._playwright = None
+        self._pages = asyncio.Queue()
 
     async def fetch(self, url: str) -> Optional[str]:
         if not url:
@@ -180,8 +243,7 @@ class ArticleBodyFetcher:
         async with self._lock:
             if not self._browser:
                 await self.start()
-        assert self._browser is not None
-        page = await self._browser.new_page()
+        page = await self._pages.get()
         try:
             await page.goto(url, wait_until="domcontentloaded", timeout=20000)
             content = await page.inner_text("body")
@@ -189,5 +251,20 @@ class ArticleBodyFetcher:
         except Exception:
             return None
         finally:
-            await page.close()
+            await self._release(page)
 
+    async def _new_page(self) -> Any:
+        assert self._browser is not None
+        # One context per page keeps cookies and storage isolated between sites.
+        context = await self._browser.new_context()
+        return await context.new_page()
+
+    async def _release(self, page: Any) -> None:
+        if page.is_closed() and self._browser:
+            with contextlib.suppress(Exception):
+                await page.context.close()
+            # Keep the pool size stable: if a replacement cannot be created the
+            # closed page goes back and the next fetch retries the recycle.
+            with contextlib.suppress(Exception):
+                page = await self._new_page()
+        self._pages.put_nowait(page)
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from typing import Any, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+import asyncpg
+
+from ..config import get_settings
+from ..db.session import asyncpg_dsn
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Second advisory lock key reserved for membership; shards use 0..count-1.
+MEMBER_SLOT = 2**31 - 1
+
+
+class PollerElection:
+    """Runs the news poller only while this process holds an advisory lock.
+
+    Each shard is a Postgres session-level advisory lock ``(lock_key, shard)``
+    held on a dedicated connection. Every live process also holds a shared
+    ``(lock_key, MEMBER_SLOT)`` lock, so ``pg_locks`` doubles as a membership
+    table that Postgres cleans up when a connection dies. On every probe a
+    process claims free shards up to its fair share,
+    ``ceil(shard_count / members)``, and releases any above it so newcomers
+    can take them. A shard nobody picks up within ``orphan_grace_seconds``
+    is claimed regardless of share, so none goes unpolled while at least one
+    process is alive. With ``shard_count > 1`` each holder polls only the
+    symbols hashing to its shards. ``singletons`` (services that must run in
+    exactly one process, such as the Finnhub trade subscription) run in
+    whichever process holds shard 0.
+    """
+
+    def __init__(
+        self,
+        stream_loop,
+        dispatcher,
+        *,
+        lock_key: Optional[int] = None,
+        shard_count: Optional[int] = None,
+        retry_seconds: Optional[float] = None,
+        orphan_grace_seconds: Optional[float] = None,
+        singletons: Sequence[Any] = (),
+    ) -> None:
+        self._loop = stream_loop
+        self._dispatcher = dispatcher
+        self._lock_key = lock_key if lock_key is not None else settings.poller_lock_key
+        self._shard_count = shard_count or settings.poller_shard_count
+        self._retry_seconds = retry_seconds or settings.poller_election_retry_seconds
+        self._grace = (
+            orphan_grace_seconds
+            if orphan_grace_seconds is not None
+            else settings.poller_orphan_grace_seconds
+        )
+        self._orphaned_since: Dict[int, float] = {}
+        self._adopted: Set[int] = set()
+        self._singletons = list(singletons)
+        self._singletons_running = False
+        self._members = 0
+        self._task: Optional[asyncio.Task[None]] = None
+        self.shards: Set[int] = set()
+
+    @property
+    def is_leader(self) -> bool:
+        return bool(self.shards)
+
+    async def start(self) -> None:
+        if self._task:
+            return
+        self._task = asyncio.create_task(self._campaign())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _campaign(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(asyncpg_dsn())
+                await self._hold(connection)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Poller election attempt failed: %s", exc)
+            finally:
+                await self._step_down()
+                if connection is not None and not connection.is_closed():
+                    # Closing the session releases any advisory lock it holds.
+                    with contextlib.suppress(Exception):
+                        await connection.close()
+            await asyncio.sleep(self._retry_seconds)
+
+    async def _hold(self, connection: asyncpg.Connection) -> None:
+        await connection.execute(
+            "SELECT pg_advisory_lock_shared($1, $2)", self._lock_key, MEMBER_SLOT
+        )
+        while True:
+            await self._rebalance(connection)
+            await asyncio.sleep(self._retry_seconds)
+            # Probe the lock connection; losing it means losing every lock.
+            await connection.execute("SELECT 1")
+
+    async def _rebalance(self, connection: asyncpg.Connection) -> None:
+        members, locked = await self._census(connection)
+        if members != self._members:
+            # Membership changed: adopted shards are up for rebalancing again.
+            self._members = members
+            self._adopted.clear()
+        share = math.ceil(self._shard_count / max(members, 1))
+        # Shards adopted past the grace period are kept, or a member that
+        # never claims would make them bounce between release and adoption.
+        excess = sorted(self.shards - self._adopted)[share:]
+        if excess:
+            await self._release(connection, excess)
+        claimed = await self._acquire(connection, locked, share)
+        if claimed:
+            await self._lead(claimed)
+
+    async def _census(self, connection: asyncpg.Connection) -> Tuple[int, Set[int]]:
+        """Live members and the shards locked by anyone, from ``pg_locks``."""
+        rows = await connection.fetch(
+            "SELECT objid FROM pg_locks WHERE locktype = 'advisory' "
+            "AND classid = $1 AND objsubid = 2 AND granted",
+            self._lock_key,
+        )
+        slots = [row["objid"] for row in rows]
+        members = sum(1 for slot in slots if slot == MEMBER_SLOT)
+        return members, {slot for slot in slots if slot < self._shard_count}
+
+    async def _acquire(
+        self, connection: asyncpg.Connection, locked: Set[int], share: int
+    ) -> Set[int]:
+        """Lock free shards up to ``share``, or beyond it once past the grace period."""
+        now = time.monotonic()
+        orphaned = [shard for shard in range(self._shard_count) if shard not in locked]
+        self._orphaned_since = {
+            shard: self._orphaned_since.get(shard, now) for shard in orphaned
+        }
+        claimed: Set[int] = set()
+        for shard in orphaned:
+            overdue = now - self._orphaned_since[shard] >= self._grace
+            if len(self.shards) + len(claimed) >= share and not overdue:
+                continue
+            acquired = await connection.fetchval(
+                "SELECT pg_try_advisory_lock($1, $2)", self._lock_key, shard
+            )
+            if acquired:
+                claimed.add(shard)
+                del self._orphaned_since[shard]
+                if overdue:
+                    self._adopted.add(shard)
+        return claimed
+
+    async def _lead(self, claimed: Set[int]) -> None:
+        logger.info(
+            "Acquired news poller shards %s/%s", sorted(claimed), self._shard_count
+        )
+        self.shards |= claimed
+        self._dispatcher.assign_shard(self.shards, self._shard_count)
+        await self._loop.start()
+        await self._sync_singletons()
+
+    async def _release(self, connection: asyncpg.Connection, shards: Iterable[int]) -> None:
+        shards = list(shards)
+        logger.info("Handing over news poller shards %s", shards)
+        for shard in shards:
+            await connection.execute(
+                "SELECT pg_advisory_unlock($1, $2)", self._lock_key, shard
+            )
+        self.shards -= set(shards)
+        self._adopted -= set(shards)
+        if self.shards:
+            self._dispatcher.assign_shard(self.shards, self._shard_count)
+        else:
+            self._dispatcher.assign_shard(None)
+            await self._loop.stop()
+        await self._sync_singletons()
+
+    async def _step_down(self) -> None:
+        if not self.shards:
+            return
+        logger.info("Releasing news poller shards %s", sorted(self.shards))
+        self.shards = set()
+        self._adopted.clear()
+        self._members = 0
+        self._dispatcher.assign_shard(None)
+        await self._loop.stop()
+        await self._sync_singletons()
+
+    async def _sync_singletons(self) -> None:
+        wanted = 0 in self.shards
+        if wanted == self._singletons_running:
+            return
+        self._singletons_running = wanted
+        for service in self._singletons:
+            await (service.start() if wanted else service.stop())
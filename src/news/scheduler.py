@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from ..config import get_settings
+
+
+settings = get_settings()
+US_MARKET_TZ = ZoneInfo("America/New_York")
+
+
+@dataclass
+class SymbolCadence:
+    due: datetime
+    rate: float = 0.0  # smoothed new articles per hour
+    last_polled: Optional[datetime] = None
+
+
+def market_session_factor(moment: datetime) -> float:
+    """Interval multiplier for the US trading session ``moment`` falls in."""
+    local = moment.astimezone(US_MARKET_TZ)
+    if local.weekday() >= 5:
+        return 6.0
+    clock = local.time()
+    if time(9, 30) <= clock < time(16, 0):
+        return 0.5
+    if time(4, 0) <= clock < time(20, 0):
+        return 1.0
+    return 3.0
+
+
+class AdaptivePollScheduler:
+    """Priority queue of symbols keyed by their next-due poll time.
+
+    Each symbol's interval shrinks with its recent article arrival rate and
+    is scaled by the US market session, so busy tickers are polled often
+    during trading hours while quiet ones back off overnight and at weekends.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_interval: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        max_interval: Optional[float] = None,
+        smoothing: float = 0.3,
+    ) -> None:
+        self._base = base_interval or settings.poll_base_interval_seconds
+        self._min = min_interval or settings.poll_min_interval_seconds
+        self._max = max_interval or settings.poll_max_interval_seconds
+        self._smoothing = smoothing
+        self._cadence: Dict[str, SymbolCadence] = {}
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._cadence)
+
+    def sync(self, symbols: Iterable[str], now: datetime) -> None:
+        """Track exactly ``symbols``; newly added ones are due immediately."""
+        wanted = set(symbols)
+        for symbol in list(self._cadence):
+            if symbol not in wanted:
+                # Heap entries for dropped symbols are skipped lazily in ``due``.
+                del self._cadence[symbol]
+        for symbol in wanted - self._cadence.keys():
+            self._cadence[symbol] = SymbolCadence(due=now)
+            self._push(symbol, now)
+
+    def due(self, now: datetime) -> List[str]:
+        ready: List[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            due, _, symbol = heapq.heappop(self._heap)
+            cadence = self._cadence.get(symbol)
+            if cadence is not None and cadence.due == due:
+                ready.append(symbol)
+        return ready
+
+    def seconds_until_next(self, now: datetime) -> Optional[float]:
+        while self._heap:
+            due, _, symbol = self._heap[0]
+            cadence = self._cadence.get(symbol)
+            if cadence is not None and cadence.due == due:
+                return max((due - now).total_seconds(), 0.0)
+            heapq.heappop(self._heap)
+        return None
+
+    def record(self, symbol: str, new_articles: int, now: datetime) -> datetime:
+        """Fold a poll result into the symbol's rate and schedule its next poll."""
+        cadence = self._cadence.get(symbol)
+        if cadence is None:
+            return now
+        if cadence.last_polled is not None:
+            elapsed_hours = max((now - cadence.last_polled).total_seconds() / 3600, 1 / 60)
+            observed = new_articles / elapsed_hours
+            cadence.rate += self._smoothing * (observed - cadence.rate)
+        cadence.last_polled = now
+        cadence.due = now + timedelta(seconds=self.interval_for(symbol, now))
+        self._push(symbol, cadence.due)
+        return cadence.due
+
+    def interval_for(self, symbol: str, now: datetime) -> float:
+        cadence = self._cadence.get(symbol)
+        rate = cadence.rate if cadence else 0.0
+        interval = self._base * market_session_factor(now) / (1.0 + rate)
+        return min(max(interval, self._min), self._max)
+
+    def _push(self, symbol: str, due: datetime) -> None:
+        heapq.heappush(self._heap, (due, next(self._sequence), symbol))
+
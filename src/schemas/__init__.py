@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -44,6 +44,10 @@ class TickerOut(BaseModel):
 class TickerSyncResult(BaseModel):
     total: int
     inserted_or_updated: int
+    inserted: int = 0
+    updated: int = 0
+    deactivated: int = 0
+    unchanged: int = 0
 
 
 class BodyBackfillResult(BaseModel):
@@ -51,12 +55,68 @@ class BodyBackfillResult(BaseModel):
     updated: int
 
 
+class ReadinessOut(BaseModel):
+    ready: bool
+    subsystems: Dict[str, bool]
+    errors: Dict[str, str] = Field(default_factory=dict)
+
+
+class BodyPipelineStats(BaseModel):
+    queue_depth: int
+    queue_capacity: int
+    workers: int
+    busy_workers: int
+    utilisation: float
+    processed: int
+    succeeded: int
+    failed: int
+    dropped: int
+    pending_writes: int
+    written: int
+
+
+class EnrichmentStats(BaseModel):
+    running: bool
+    batches: int
+    enriched: int
+    skipped: int
+    failed_batches: int
+
+
+class LLMCacheStats(BaseModel):
+    entries: int
+    memory_hits: int
+    db_hits: int
+    misses: int
+    hit_rate: float
+
+
+class LLMGatewayStats(BaseModel):
+    provider: str
+    calls: int
+    failures: int
+    retries: int
+    rejected: int
+    in_flight: int
+    waiting: int
+    circuit_state: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_p50_ms: float
+    latency_p95_ms: float
+    error_rate: float
+    hedges: int = 0
+    hedge_wins: int = 0
+
+
 class ArticleOut(BaseModel):
     id: int
     symbol: str
     headline: str
     url: HttpUrl
     summary: Optional[str] = None
+    digest: Optional[str] = None
+    sentiment: Optional[int] = None
     source: Optional[str] = None
     published_at: Optional[datetime] = None
 
@@ -81,6 +141,10 @@ class ReportCreate(BaseModel):
     symbol: str = Field(..., examples=["AAPL"])
     type: ReportType = Field(default=ReportType.SMART_BRIEFING)
     limit: int = Field(default=20, ge=5, le=100)
+    force: bool = Field(
+        default=False,
+        description="Regenerate even if nothing changed since the latest report.",
+    )
 
 
 class ReportOut(BaseModel):
@@ -91,3 +155,31 @@ class ReportOut(BaseModel):
     created_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class ReportJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class ReportJobCreate(BaseModel):
+    kind: Literal["symbol", "aggregate"] = "symbol"
+    symbol: Optional[str] = Field(default=None, examples=["AAPL"])
+    limit: int = Field(default=20, ge=5, le=100)
+    force: bool = False
+
+
+class ReportJobOut(BaseModel):
+    id: str
+    kind: str
+    symbol: Optional[str] = None
+    status: ReportJobStatus
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    report: Optional[ReportOut] = None
+    error: Optional[str] = None
+
+    model_config = {"from_attributes": True}
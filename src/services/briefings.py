@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, time, timedelta, tzinfo
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+from ..config import get_settings
+from .limits import Priority
+from .llm_gateway import llm_priority_scope
+from .reports import AISummaryService, ReportGenerationError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..streaming.dispatcher import NewsDispatcher
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+AGGREGATE_SYMBOL = "WATCHLIST"
+
+
+def parse_briefing_times(values: Sequence[str]) -> List[time]:
+    times = []
+    for value in values:
+        hour, _, minute = value.strip().partition(":")
+        times.append(time(int(hour), int(minute or 0)))
+    return sorted(times)
+
+
+def next_run_at(
+    now: datetime,
+    times: Sequence[time],
+    lead: timedelta,
+    weekdays_only: bool = True,
+) -> Optional[datetime]:
+    """Earliest ``briefing time - lead`` strictly after ``now`` (in ``now``'s zone)."""
+    if not times:
+        return None
+    for day in range(8):
+        date = (now + timedelta(days=day)).date()
+        if weekdays_only and date.weekday() >= 5:
+            continue
+        for at in times:
+            run = datetime.combine(date, at, tzinfo=now.tzinfo) - lead
+            if run > now:
+                return run
+    return None
+
+
+class BriefingScheduler:
+    """Pre-generates symbol and ``WATCHLIST`` briefings ahead of peak times.
+
+    Runs alongside ``NewsStreamLoop`` so only the elected poller does the
+    work, at background LLM priority. Reports are generated without
+    ``force``, so symbols whose inputs have not changed reuse their latest
+    report and cost nothing.
+    """
+
+    def __init__(
+        self,
+        service: AISummaryService,
+        dispatcher: "NewsDispatcher",
+        timezone: tzinfo,
+        *,
+        times: Optional[Sequence[str]] = None,
+        lead_minutes: Optional[int] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        self._service = service
+        self._dispatcher = dispatcher
+        self._timezone = timezone
+        self._times = parse_briefing_times(
+            times if times is not None else settings.briefing_times
+        )
+        self._lead = timedelta(
+            minutes=lead_minutes if lead_minutes is not None else settings.briefing_lead_minutes
+        )
+        self._concurrency = concurrency or settings.briefing_concurrency
+        self._task: Optional[asyncio.Task[None]] = None
+        self.last_run: Optional[datetime] = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._times)
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def run_once(self) -> int:
+        """Generate every briefing this process owns; returns how many succeeded."""
+        symbols = [
+            symbol
+            for symbol in await self._dispatcher.list_symbols()
+            if symbol != AGGREGATE_SYMBOL
+        ]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def generate(symbol: str) -> bool:
+            async with semaphore:
+                try:
+                    await self._service.generate_report(symbol)
+                    return True
+                except ReportGenerationError as exc:
+                    logger.info("Skipped briefing for %s: %s", symbol, exc)
+                except Exception:
+                    logger.exception("Briefing for %s failed", symbol)
+                return False
+
+        with llm_priority_scope(Priority.BACKGROUND):
+            results = await asyncio.gather(*(generate(symbol) for symbol in symbols))
+            generated = sum(results)
+            if self._dispatcher.owns(AGGREGATE_SYMBOL):
+                try:
+                    await self._service.generate_aggregate_report()
+                    generated += 1
+                except ReportGenerationError as exc:
+                    logger.info("Skipped watchlist briefing: %s", exc)
+                except Exception:
+                    logger.exception("Watchlist briefing failed")
+        self.last_run = datetime.now(self._timezone)
+        logger.info("Pre-generated %s briefings", generated)
+        return generated
+
+    async def _loop(self) -> None:
+        while True:
+            now = datetime.now(self._timezone)
+            run_at = next_run_at(now, self._times, self._lead, settings.briefing_weekdays_only)
+            if run_at is None:
+                return
+            await asyncio.sleep((run_at - now).total_seconds())
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Briefing pre-generation failed")
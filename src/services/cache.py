@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, Optional, Set, Tuple, TypeVar
+
+
+V = TypeVar("V")
+
+
+@dataclass
+class _Entry(Generic[V]):
+    value: V
+    stored_at: float
+
+
+class SingleFlightCache(Generic[V]):
+    """Bounded in-process LRU cache with TTL and stale-while-revalidate.
+
+    Fresh entries are returned directly. Entries past ``ttl`` but within
+    ``stale_ttl`` are returned immediately while one background refresh runs.
+    Concurrent misses for the same key share a single in-flight load.
+
+    Callers that cannot hand over a loader coroutine (a streamed response,
+    say) use ``lookup`` plus ``begin``/``finish`` for the same behaviour.
+    """
+
+    def __init__(self, *, ttl: float, stale_ttl: float = 0.0, max_entries: int = 1024) -> None:
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, _Entry[V]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future[V]] = {}
+        self._background: Set[asyncio.Task[V]] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[V]]) -> V:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.stored_at
+            if age < self._ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if age < self._ttl + self._stale_ttl:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    task = self._start_load(key, loader)
+                    self._background.add(task)
+                    task.add_done_callback(self._finish_background)
+                return entry.value
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._start_load(key, loader)
+        # Shield so one cancelled caller does not cancel the shared load.
+        return await asyncio.shield(task)
+
+    def lookup(self, key: str) -> Optional[V]:
+        """Return a fresh value and count the hit, or ``None`` without counting."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.stored_at >= self._ttl:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def begin(self, key: str) -> Tuple["asyncio.Future[V]", bool]:
+        """Join the in-flight load of ``key`` or start one.
+
+        Returns the shared future and whether the caller leads the load; the
+        leader must ``finish`` it, everyone else awaits the future.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return future, False
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future, True
+
+    def finish(
+        self,
+        key: str,
+        future: "asyncio.Future[V]",
+        value: Optional[V] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Resolve a load started with ``begin``, storing ``value`` on success."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+            # Waiters still see the error; this only silences the
+            # "exception was never retrieved" warning when there are none.
+            future.exception()
+            return
+        self.put(key, value)
+        future.set_result(value)
+
+    def peek(self, key: str, max_age: Optional[float] = None) -> Optional[V]:
+        """Return the stored value (ignoring the TTL) without touching stats."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if max_age is not None and time.monotonic() - entry.stored_at > max_age:
+            return None
+        return entry.value
+
+    def put(self, key: str, value: V) -> None:
+        self._entries[key] = _Entry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+        }
+
+    def _start_load(self, key: str, loader: Callable[[], Awaitable[V]]) -> asyncio.Task[V]:
+        async def run() -> V:
+            try:
+                value = await loader()
+                self.put(key, value)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+
+        task = asyncio.create_task(run())
+        self._inflight[key] = task
+        return task
+
+    def _finish_background(self, task: asyncio.Task[V]) -> None:
+        self._background.discard(task)
+        if not task.cancelled():
+            # Failed refreshes keep serving the stale value; just consume the error.
+            task.exception()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from ..config import get_settings
+from ..db.models import Article
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Relative trust in wire services and outlets Finnhub commonly returns.
+SOURCE_WEIGHTS: Dict[str, float] = {
+    "reuters": 1.0,
+    "bloomberg": 1.0,
+    "dow jones": 1.0,
+    "wsj": 1.0,
+    "cnbc": 0.9,
+    "marketwatch": 0.9,
+    "financial times": 0.9,
+    "barron's": 0.9,
+    "seekingalpha": 0.7,
+    "yahoo": 0.7,
+    "benzinga": 0.6,
+    "zacks": 0.5,
+}
+DEFAULT_SOURCE_WEIGHT = 0.6
+RECENCY_HALF_LIFE_HOURS = 24.0
+
+_WORD = re.compile(r"\w+")
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+
+@lru_cache(maxsize=8)
+def _encoder(model: str):
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as exc:
+        # The BPE file is downloaded on first use; offline hosts estimate.
+        logger.warning("tiktoken encoding unavailable, estimating tokens: %s", exc)
+        return None
+
+
+async def preload_encoder(model: Optional[str] = None) -> bool:
+    """Load the tokenizer in a worker thread so no request blocks on the download."""
+    return await asyncio.to_thread(_encoder, model or settings.llm_model) is not None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """Token count from ``tiktoken`` when installed, else a close estimate.
+
+    The estimate charges roughly four ASCII characters per token and one
+    token per non-ASCII character (Hangul, CJK), which errs on the high side.
+    """
+    encoder = _encoder(model or settings.llm_model)
+    if encoder is not None:
+        return len(encoder.encode(text))
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def _shingles(text: str) -> Set[str]:
+    words = _WORD.findall(text.lower())
+    if len(words) < 3:
+        return set(words)
+    return {" ".join(words[i : i + 3]) for i in range(len(words) - 2)}
+
+
+def _similarity(left: Set[str], right: Set[str]) -> float:
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+@dataclass
+class ArticleContext:
+    text: str
+    articles: List[Article]
+    tokens: int
+    dropped_duplicates: int
+
+
+class ArticleContextBuilder:
+    """Fits ranked article headlines and summaries into a token budget.
+
+    Articles are scored by recency and source weight, near-identical
+    syndicated copies are dropped, long summaries are cut at sentence
+    boundaries and, once the budget is tight, articles fall back to their
+    headline alone.
+    """
+
+    def __init__(
+        self,
+        *,
+        model: Optional[str] = None,
+        budget_tokens: Optional[int] = None,
+        summary_max_tokens: Optional[int] = None,
+        duplicate_similarity: Optional[float] = None,
+        tokenizer: Optional[Callable[[str], int]] = None,
+    ) -> None:
+        self._model = model or settings.llm_model
+        self._budget = budget_tokens or settings.report_context_token_budgets.get(
+            self._model, settings.report_context_token_budget
+        )
+        self._summary_max = summary_max_tokens or settings.report_summary_max_tokens
+        self._duplicate_similarity = (
+            duplicate_similarity or settings.report_duplicate_similarity
+        )
+        self._count = tokenizer or (lambda text: count_tokens(text, self._model))
+
+    @property
+    def budget(self) -> int:
+        return self._budget
+
+    def build(
+        self, articles: Sequence[Article], now: Optional[datetime] = None
+    ) -> ArticleContext:
+        now = now or datetime.now(timezone.utc)
+        ranked = sorted(articles, key=lambda article: self.score(article, now), reverse=True)
+
+        kept: List[Article] = []
+        seen: List[Set[str]] = []
+        dropped = 0
+        for article in ranked:
+            shingles = _shingles(f"{article.headline} {article.summary or article.digest or ''}")
+            if any(_similarity(shingles, other) >= self._duplicate_similarity for other in seen):
+                dropped += 1
+                continue
+            seen.append(shingles)
+            kept.append(article)
+
+        lines: List[str] = []
+        used: List[Article] = []
+        total = 0
+        for article in kept:
+            # Prefer the ingest-time digest: short, already in Korean, and
+            # never the boilerplate Finnhub sometimes puts in ``summary``.
+            summary = article.digest or article.summary or "요약 없음"
+            line = self._render(article, self._trim(summary))
+            cost = self._count(line) + 1
+            if total + cost > self._budget:
+                line = self._render(article, None)
+                cost = self._count(line) + 1
+                if total + cost > self._budget:
+                    break
+            lines.append(line)
+            used.append(article)
+            total += cost
+        return ArticleContext("\n".join(lines), used, total, dropped)
+
+    @staticmethod
+    def score(article: Article, now: datetime) -> float:
+        if article.published_at is not None:
+            published = article.published_at
+            if published.tzinfo is None:
+                published = published.replace(tzinfo=timezone.utc)
+            age_hours = max((now - published).total_seconds() / 3600, 0.0)
+            recency = 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+        else:
+            recency = 0.1
+        return recency * source_weight(article.source)
+
+    def _trim(self, summary: str) -> str:
+        if self._count(summary) <= self._summary_max:
+            return summary
+        kept: List[str] = []
+        for sentence in _SENTENCE_END.split(summary):
+            candidate = " ".join(kept + [sentence])
+            if self._count(candidate) > self._summary_max:
+                break
+            kept.append(sentence)
+        if kept:
+            return " ".join(kept)
+        # A single run-on sentence: cut proportionally to the budget.
+        ratio = self._summary_max / self._count(summary)
+        return summary[: max(int(len(summary) * ratio) - 1, 0)].rstrip() + "…"
+
+    @staticmethod
+    def _render(article: Article, summary: Optional[str]) -> str:
+        timestamp = (
+            article.published_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+            if article.published_at
+            else "발행시각 알 수 없음"
+        )
+        line = f"[기사#{article.id}] {article.headline} | 출처: {article.source or '정보 없음'} | {timestamp}"
+        if article.sentiment is not None:
+            line += f" | 감성: {article.sentiment}"
+        if summary is None:
+            return line
+        return f"{line}\n요약: {summary}"
+
+
+def source_weight(source: Optional[str]) -> float:
+    if not source:
+        return DEFAULT_SOURCE_WEIGHT
+    lowered = source.lower()
+    for name, weight in SOURCE_WEIGHTS.items():
+        if name in lowered:
+            return weight
+    return DEFAULT_SOURCE_WEIGHT
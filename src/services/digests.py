@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import get_settings
+from ..db.models import Article, SymbolDigest
+from .context_builder import ArticleContextBuilder
+from .llm_cache import complete_validated
+from .llm_service import LLMService, LLMServiceError
+from .price_service import PriceSnapshot
+from .prompts import PromptManager
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Digest:
+    symbol: str
+    article_ids: List[int]
+    sentiment: int
+    one_liner: str
+    themes: List[str] = field(default_factory=list)
+    fresh: bool = False
+
+
+class SymbolDigestService:
+    """Map step of the aggregate briefing: one short digest per symbol.
+
+    A digest is stored with the ids of the articles it was built from and is
+    reused until that set changes, so a watchlist briefing only pays for the
+    symbols that actually received news.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        *,
+        context_builder: Optional[ArticleContextBuilder] = None,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        self._llm = llm_service
+        self._context_builder = context_builder or ArticleContextBuilder(
+            budget_tokens=settings.digest_context_token_budget
+        )
+        self._concurrency = concurrency or settings.digest_concurrency
+
+    async def digests_for(
+        self,
+        session: AsyncSession,
+        articles_by_symbol: Mapping[str, Sequence[Article]],
+        prices: Mapping[str, PriceSnapshot],
+    ) -> Dict[str, Digest]:
+        stored = await self._load(session, list(articles_by_symbol))
+        digests: Dict[str, Digest] = {}
+        stale: List[str] = []
+        for symbol, articles in articles_by_symbol.items():
+            article_ids = sorted(article.id for article in articles)
+            row = stored.get(symbol)
+            if row is not None and sorted(row.article_ids or []) == article_ids:
+                digests[symbol] = Digest(
+                    symbol, article_ids, row.sentiment, row.one_liner, list(row.themes or [])
+                )
+            else:
+                stale.append(symbol)
+
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def build(symbol: str) -> Digest:
+            async with semaphore:
+                return await self._generate(symbol, articles_by_symbol[symbol], prices[symbol])
+
+        for digest in await asyncio.gather(*(build(symbol) for symbol in stale)):
+            digests[digest.symbol] = digest
+        if stale:
+            logger.info(
+                "Aggregate digests: %s regenerated, %s reused",
+                len(stale),
+                len(digests) - len(stale),
+            )
+        await self._save(session, [digest for digest in digests.values() if digest.fresh])
+        return digests
+
+    async def _generate(
+        self, symbol: str, articles: Sequence[Article], price: PriceSnapshot
+    ) -> Digest:
+        article_ids = sorted(article.id for article in articles)
+        context = self._context_builder.build(articles)
+        try:
+            content = await complete_validated(
+                self._llm,
+                _digest_json,
+                system_prompt=PromptManager.build_system_prompt(),
+                user_prompt=PromptManager.build_digest_prompt(symbol, context.text, price),
+                temperature=0.2,
+                max_tokens=200,
+            )
+            data = _parse_json(content)
+            return Digest(
+                symbol,
+                article_ids,
+                int(data.get("sentiment", 50)),
+                str(data.get("one_liner", "")),
+                [str(theme) for theme in data.get("themes", [])][:3],
+                fresh=True,
+            )
+        except (LLMServiceError, Exception) as exc:
+            logger.warning("Digest for %s failed: %s", symbol, exc)
+            # Not persisted, so the next briefing retries this symbol.
+            headline = articles[0].headline if articles else "최근 기사 없음"
+            return Digest(symbol, article_ids, 50, headline, [])
+
+    @staticmethod
+    async def _load(session: AsyncSession, symbols: List[str]) -> Dict[str, SymbolDigest]:
+        if not symbols:
+            return {}
+        result = await session.execute(
+            select(SymbolDigest).where(SymbolDigest.symbol.in_(symbols))
+        )
+        return {row.symbol: row for row in result.scalars().all()}
+
+    @staticmethod
+    async def _save(session: AsyncSession, digests: List[Digest]) -> None:
+        if not digests:
+            return
+        stmt = insert(SymbolDigest).values(
+            [
+                {
+                    "symbol": digest.symbol,
+                    "article_ids": digest.article_ids,
+                    "sentiment": digest.sentiment,
+                    "one_liner": digest.one_liner,
+                    "themes": digest.themes,
+                }
+                for digest in digests
+            ]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SymbolDigest.symbol],
+            set_={
+                "article_ids": stmt.excluded.article_ids,
+                "sentiment": stmt.excluded.sentiment,
+                "one_liner": stmt.excluded.one_liner,
+                "themes": stmt.excluded.themes,
+                "updated_at": func.now(),
+            },
+        )
+        await session.execute(stmt)
+
+
+def _digest_json(content: str) -> str:
+    """Validator for ``complete_validated``: the digest as a bare JSON object."""
+    return json.dumps(_parse_json(content), ensure_ascii=False)
+
+
+def _parse_json(content: str) -> dict:
+    content = content.strip()
+    if content.startswith("```"):
+        content = content.strip("`").removeprefix("json").strip()
+    data = json.loads(content)
+    if not isinstance(data, dict):
+        raise LLMServiceError("Digest is not a JSON object.")
+    return data
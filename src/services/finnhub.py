@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..config import get_settings
+from .limits import Priority, TokenBucket
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Upper bound for one retry wait, whether from backoff or ``Retry-After``.
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+
+class FinnhubClient:
+    """Single gateway for every Finnhub REST call.
+
+    One pooled keep-alive connection, a token bucket sized to the plan's
+    per-minute quota with interactive calls ahead of background polling, and
+    retries with jittered exponential backoff that honour ``Retry-After``.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        calls_per_minute: Optional[int] = None,
+        burst: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._api_key = api_key if api_key is not None else settings.finnhub_api_key
+        self._bucket = TokenBucket(
+            calls_per_minute or settings.finnhub_calls_per_minute,
+            burst or settings.finnhub_burst,
+        )
+        self._max_retries = (
+            max_retries if max_retries is not None else settings.finnhub_max_retries
+        )
+        self._client = httpx.AsyncClient(
+            timeout=15,
+            limits=httpx.Limits(
+                max_connections=20, max_keepalive_connections=10, keepalive_expiry=60
+            ),
+            transport=transport,
+        )
+        self._calls = 0
+        self._retries = 0
+        self._throttled = 0
+
+    @property
+    def configured(self) -> bool:
+        return bool(self._api_key)
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Priority = Priority.BACKGROUND,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        query = {**(params or {}), "token": self._api_key}
+        request_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+        attempt = 0
+        while True:
+            await self._bucket.acquire(priority)
+            self._calls += 1
+            try:
+                response = await self._client.get(
+                    url, params=query, timeout=request_timeout
+                )
+            except httpx.TransportError:
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRYABLE_STATUS or attempt >= self._max_retries:
+                    response.raise_for_status()
+                    return response.json()
+                delay = self._retry_after(response) or self._backoff(attempt)
+                if response.status_code == 429:
+                    # Everyone shares the quota, so everyone backs off.
+                    self._throttled += 1
+                    self._bucket.pause(delay)
+            attempt += 1
+            self._retries += 1
+            logger.info("Retrying Finnhub call in %.2fs (attempt %s)", delay, attempt)
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self._calls,
+            "retries": self._retries,
+            "throttled": self._throttled,
+            "waiting": self._bucket.waiting,
+        }
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    @staticmethod
+    def _backoff(
+        attempt: int, base: float = 0.5, cap: float = MAX_RETRY_DELAY_SECONDS
+    ) -> float:
+        # Full jitter keeps retrying callers from re-synchronising.
+        return random.uniform(0, min(cap, base * 2**attempt))
+
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        try:
+            delay = float(value) if value is not None else None
+        except ValueError:
+            return None
+        if delay is None:
+            return None
+        # The pause stalls every Finnhub call, so a bogus header cannot be
+        # allowed to park quotes and syncs for hours.
+        return min(max(delay, 0.0), MAX_RETRY_DELAY_SECONDS)
+
+
+@lru_cache
+def get_finnhub_client() -> FinnhubClient:
+    return FinnhubClient()
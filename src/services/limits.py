@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import AsyncIterator, List, Optional, Tuple
+
+
+class Priority(IntEnum):
+    """Lower values are served first when callers queue for capacity."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+class TokenBucket:
+    """Async token bucket with priority lanes.
+
+    Tokens refill continuously at ``rate_per_minute`` up to ``burst``. When
+    callers have to wait, interactive waiters are released before background
+    ones regardless of arrival order.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int) -> None:
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._wakeup: Optional[asyncio.Task[None]] = None
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: Priority = Priority.BACKGROUND) -> None:
+        self._refill()
+        if not self._waiters and self._tokens >= 1 and not self._paused():
+            self._tokens -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        self._schedule()
+        await future
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. after an upstream 429)."""
+        self._tokens = 0.0
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._schedule()
+
+    def _paused(self) -> bool:
+        return time.monotonic() < self._paused_until
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def _schedule(self) -> None:
+        if self._wakeup is None or self._wakeup.done():
+            self._wakeup = asyncio.get_running_loop().create_task(self._release_waiters())
+
+    async def _release_waiters(self) -> None:
+        while self._waiters:
+            self._refill()
+            if self._paused():
+                await asyncio.sleep(self._paused_until - time.monotonic())
+                continue
+            while self._waiters and self._tokens >= 1:
+                *_, future = heapq.heappop(self._waiters)
+                if future.done():  # caller was cancelled while waiting
+                    continue
+                self._tokens -= 1
+                future.set_result(None)
+            if self._waiters:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+class PrioritySemaphore:
+    """Caps concurrent holders; queued interactive callers go first."""
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._held = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def in_use(self) -> int:
+        return self._held
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: Priority = Priority.BACKGROUND) -> None:
+        if self._held < self._limit and not self.waiting:
+            self._held += 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before cancellation.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            *_, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Hand the slot straight to the next waiter.
+                future.set_result(None)
+                return
+        self._held -= 1
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: Priority = Priority.BACKGROUND) -> AsyncIterator[None]:
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import get_settings
+from ..db.models import LLMCacheEntry
+from .cache import SingleFlightCache
+from .llm_service import LLMService, LLMServiceError
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def prompt_fingerprint(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    user_prompt: str,
+) -> str:
+    # ``max_tokens`` is part of the key: a completion truncated at a small
+    # limit must not answer a request that allows a longer one.
+    payload = json.dumps(
+        [model, round(temperature, 4), max_tokens, system_prompt, user_prompt],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+async def complete_validated(
+    llm, validate: Callable[[str], str], *, refresh: bool = False, **kwargs
+) -> str:
+    """``llm.complete`` followed by ``validate`` (which raises on bad output).
+
+    Through a ``CachedLLMService`` the validator runs before anything is
+    stored, so a malformed response is never cached and served again, and
+    ``refresh`` skips cached answers for a fresh provider call.
+    """
+    if isinstance(llm, CachedLLMService):
+        return await llm.complete(validate=validate, refresh=refresh, **kwargs)
+    return validate(await llm.complete(**kwargs))
+
+
+def stream_validated(
+    llm, validate: Callable[[str], str], *, refresh: bool = False, **kwargs
+) -> AsyncIterator[str]:
+    """``llm.stream`` whose joined text a ``CachedLLMService`` validates before storing.
+
+    Deltas pass through unchanged, so callers still validate what they join.
+    """
+    if isinstance(llm, CachedLLMService):
+        return llm.stream(validate=validate, refresh=refresh, **kwargs)
+    return llm.stream(**kwargs)
+
+
+class CachedLLMService:
+    """Caches ``LLMService.complete`` results by prompt fingerprint.
+
+    Lookups go to an in-process LRU first, then to the ``llm_cache`` table,
+    and only then to the provider. Identical prompts in flight at the same
+    time share one provider call. When the caller passes ``validate`` only
+    responses it accepts are stored; ``refresh`` skips both tiers and
+    overwrites them with a new provider answer.
+    """
+
+    def __init__(
+        self,
+        llm: LLMService,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        model: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        self._llm = llm
+        self._sessions = session_factory
+        # Behind an ``LLMRouter`` any provider may answer, so key on the whole
+        # ordered provider set: an answer is only reused under the provider
+        # configuration that produced it, not filed under the primary model.
+        self._model = model or getattr(llm, "fingerprint", None) or settings.llm_model
+        self._ttl = ttl_seconds or settings.llm_cache_ttl_seconds
+        self._memory: SingleFlightCache[str] = SingleFlightCache(
+            ttl=self._ttl, max_entries=max_entries or settings.llm_cache_max_entries
+        )
+        self._db_hits = 0
+        self._provider_calls = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._llm.enabled
+
+    async def complete(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+        validate: Optional[Callable[[str], str]] = None,
+        refresh: bool = False,
+    ) -> str:
+        key = prompt_fingerprint(
+            self._model, temperature, max_tokens, system_prompt, user_prompt
+        )
+
+        async def load() -> str:
+            cached = None if refresh else await self._read(key)
+            if cached is not None:
+                self._db_hits += 1
+                return cached
+            self._provider_calls += 1
+            content = await self._llm.complete(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            # Raising here fails the shared load, so neither tier stores it.
+            if validate is not None:
+                content = validate(content)
+            await self._write(key, content)
+            return content
+
+        if refresh:
+            content = await load()
+            self._memory.put(key, content)
+            return content
+        return await self._memory.get(key, load)
+
+    async def stream(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+        validate: Optional[Callable[[str], str]] = None,
+        refresh: bool = False,
+    ) -> AsyncIterator[str]:
+        """Streaming variant of ``complete``.
+
+        A cache hit is yielded as a single chunk, and so is the result for
+        callers that join an identical stream already in flight.
+        """
+        key = prompt_fingerprint(
+            self._model, temperature, max_tokens, system_prompt, user_prompt
+        )
+        future = None
+        if not refresh:
+            cached = self._memory.lookup(key)
+            if cached is not None:
+                yield cached
+                return
+            future, leader = self._memory.begin(key)
+            if not leader:
+                yield await asyncio.shield(future)
+                return
+        try:
+            cached = None if refresh else await self._read(key)
+            if cached is not None:
+                self._db_hits += 1
+                self._settle(key, future, cached)
+                yield cached
+                return
+            self._provider_calls += 1
+            chunks = []
+            async for delta in self._llm.stream(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ):
+                chunks.append(delta)
+                yield delta
+            content = "".join(chunks).strip()
+            if validate is not None:
+                content = validate(content)
+            await self._write(key, content)
+        except Exception as exc:
+            self._settle(key, future, error=exc)
+            raise
+        except BaseException:
+            # The consumer went away mid-stream; waiters must not hang.
+            self._settle(key, future, error=LLMServiceError("LLM stream was abandoned."))
+            raise
+        self._settle(key, future, content)
+
+    def _settle(
+        self,
+        key: str,
+        future: "Optional[asyncio.Future[str]]",
+        value: Optional[str] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if future is not None:
+            self._memory.finish(key, future, value, error)
+        elif error is None:
+            self._memory.put(key, value)
+
+    def stats(self) -> Dict[str, float]:
+        memory = self._memory.stats()
+        lookups = memory["hits"] + memory["misses"] + memory["coalesced"]
+        hits = memory["hits"] + memory["coalesced"] + self._db_hits
+        return {
+            "entries": memory["entries"],
+            "memory_hits": memory["hits"] + memory["coalesced"],
+            "db_hits": self._db_hits,
+            "misses": self._provider_calls,
+            "hit_rate": hits / lookups if lookups else 0.0,
+        }
+
+    async def _read(self, key: str) -> Optional[str]:
+        try:
+            async with self._sessions() as session:
+                result = await session.execute(
+                    select(LLMCacheEntry.response)
+                    .where(LLMCacheEntry.key == key)
+                    .where(LLMCacheEntry.expires_at > datetime.now(timezone.utc))
+                )
+                return result.scalar_one_or_none()
+        except Exception as exc:
+            logger.warning("LLM cache read failed: %s", exc)
+            return None
+
+    async def _write(self, key: str, content: str) -> None:
+        now = datetime.now(timezone.utc)
+        stmt = insert(LLMCacheEntry).values(
+            key=key,
+            model=self._model[:128],
+            response=content,
+            expires_at=now + timedelta(seconds=self._ttl),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[LLMCacheEntry.key],
+            set_={
+                "response": stmt.excluded.response,
+                "expires_at": stmt.excluded.expires_at,
+                "created_at": now,
+            },
+        )
+        try:
+            async with self._sessions() as session:
+                await session.execute(stmt)
+                await session.execute(
+                    delete(LLMCacheEntry).where(LLMCacheEntry.expires_at <= now)
+                )
+                await session.commit()
+        except Exception as exc:
+            logger.warning("LLM cache write failed: %s", exc)
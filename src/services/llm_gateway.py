@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Deque, Dict, Iterator, Optional
+
+from ..config import get_settings
+from .limits import Priority, PrioritySemaphore
+from .llm_service import LLMService, LLMServiceError
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Upper bound for one retry wait, whether from backoff or ``Retry-After``.
+MAX_RETRY_DELAY_SECONDS = 30.0
+
+# Request handlers run at INTERACTIVE; schedulers wrap their work in
+# ``llm_priority_scope(Priority.BACKGROUND)`` so user-facing calls overtake them.
+llm_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.INTERACTIVE)
+
+
+@contextlib.contextmanager
+def llm_priority_scope(priority: Priority) -> Iterator[None]:
+    token = llm_priority.set(priority)
+    try:
+        yield
+    finally:
+        llm_priority.reset(token)
+
+
+class CircuitOpenError(LLMServiceError):
+    """Raised without contacting the provider while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Opens after consecutive provider failures and probes after a cool-down."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self._threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.state = self.CLOSED
+
+    def before_call(self) -> None:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self._reset_seconds:
+                raise CircuitOpenError("LLM provider is unavailable (circuit open).")
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                raise CircuitOpenError("LLM provider is unavailable (circuit half-open).")
+            self._probing = True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probing = False
+        self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self._failures >= self._threshold:
+            if self.state != self.OPEN:
+                logger.warning("LLM circuit opened after %s failures", self._failures)
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def record_neutral(self) -> None:
+        """Outcome that says nothing about provider health (a 400, a cancel)."""
+        self._probing = False
+
+
+class LLMGateway:
+    """Concurrency, retry and circuit-breaking layer in front of ``LLMService``.
+
+    At most ``max_in_flight`` provider calls run at once and queued
+    interactive calls go before background ones. 429/5xx and connection
+    errors are retried with jittered exponential backoff (``Retry-After``
+    wins when present); sustained failures open the circuit so callers fall
+    back immediately instead of waiting out timeouts.
+    """
+
+    def __init__(
+        self,
+        llm: LLMService,
+        *,
+        name: Optional[str] = None,
+        max_in_flight: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        failure_threshold: Optional[int] = None,
+        reset_seconds: Optional[float] = None,
+    ) -> None:
+        self._llm = llm
+        self.name = name or settings.llm_provider
+        self._slots = PrioritySemaphore(max_in_flight or settings.llm_max_in_flight)
+        self._max_retries = (
+            max_retries if max_retries is not None else settings.llm_max_retries
+        )
+        self._breaker = CircuitBreaker(
+            failure_threshold or settings.llm_breaker_failure_threshold,
+            reset_seconds or settings.llm_breaker_reset_seconds,
+        )
+        self._latencies: Deque[float] = deque(maxlen=512)
+        self._calls = 0
+        self._failures = 0
+        self._retries = 0
+        self._rejected = 0
+        self._prompt_tokens = 0
+        self._completion_tokens = 0
+        self._error_rate = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._llm.enabled
+
+    @property
+    def warm(self) -> bool:
+        return self._llm.warm
+
+    @property
+    def model(self) -> str:
+        return self._llm.model
+
+    @property
+    def circuit_state(self) -> str:
+        return self._breaker.state
+
+    @property
+    def error_rate(self) -> float:
+        """Exponentially weighted share of recent attempts that failed."""
+        return self._error_rate
+
+    @property
+    def latency_samples(self) -> int:
+        return len(self._latencies)
+
+    def latency_percentile(self, fraction: float) -> float:
+        return _percentile(sorted(self._latencies), fraction)
+
+    async def complete(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> str:
+        attempt = 0
+        while True:
+            self._admit()
+            try:
+                async with self._slots.slot(llm_priority.get()):
+                    started = time.monotonic()
+                    completion = await self._llm.create_completion(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    )
+            except LLMServiceError as exc:
+                delay = self._on_error(exc, attempt)
+                if delay is None:
+                    raise
+            except BaseException:
+                self._breaker.record_neutral()
+                raise
+            else:
+                self._record(True, time.monotonic() - started)
+                self._prompt_tokens += completion.prompt_tokens
+                self._completion_tokens += completion.completion_tokens
+                return completion.content
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def stream(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> AsyncIterator[str]:
+        """Streaming variant; retries only until the first delta arrives."""
+        attempt = 0
+        while True:
+            self._admit()
+            received = False
+            try:
+                async with self._slots.slot(llm_priority.get()):
+                    started = time.monotonic()
+                    async for delta in self._llm.stream(
+                        system_prompt=system_prompt,
+                        user_prompt=user_prompt,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                    ):
+                        received = True
+                        yield delta
+            except LLMServiceError as exc:
+                delay = None if received else self._on_error(exc, attempt)
+                if delay is None:
+                    if received:
+                        self._failures += 1
+                        self._record(False)
+                    raise
+            except BaseException:
+                self._breaker.record_neutral()
+                raise
+            else:
+                self._record(True, time.monotonic() - started)
+                return
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies)
+        return {
+            "provider": self.name,
+            "calls": self._calls,
+            "failures": self._failures,
+            "retries": self._retries,
+            "rejected": self._rejected,
+            "in_flight": self._slots.in_use,
+            "waiting": self._slots.waiting,
+            "circuit_state": self._breaker.state,
+            "prompt_tokens": self._prompt_tokens,
+            "completion_tokens": self._completion_tokens,
+            "latency_p50_ms": _percentile(latencies, 0.5) * 1000,
+            "latency_p95_ms": _percentile(latencies, 0.95) * 1000,
+            "error_rate": self._error_rate,
+        }
+
+    def _record(self, ok: bool, latency: Optional[float] = None) -> None:
+        self._error_rate = self._error_rate * 0.8 + (0.0 if ok else 0.2)
+        if ok:
+            self._breaker.record_success()
+            self._latencies.append(latency)
+        else:
+            self._breaker.record_failure()
+
+    def _admit(self) -> None:
+        try:
+            self._breaker.before_call()
+        except CircuitOpenError:
+            self._rejected += 1
+            raise
+        self._calls += 1
+
+    def _on_error(self, exc: LLMServiceError, attempt: int) -> Optional[float]:
+        """Record a failed attempt; return the retry delay or ``None`` to give up."""
+        self._failures += 1
+        self._error_rate = self._error_rate * 0.8 + 0.2
+        if not exc.retryable:
+            self._breaker.record_neutral()
+            return None
+        # Rate limiting means the provider is up; only outages trip the breaker.
+        if exc.status_code == 429:
+            self._breaker.record_neutral()
+        else:
+            self._breaker.record_failure()
+        if attempt >= self._max_retries or self._breaker.state == CircuitBreaker.OPEN:
+            return None
+        self._retries += 1
+        delay = exc.retry_after
+        if delay is None:
+            delay = random.uniform(0, min(MAX_RETRY_DELAY_SECONDS, 0.5 * 2**attempt))
+        else:
+            # A provider asking for minutes would otherwise park the caller.
+            delay = min(delay, MAX_RETRY_DELAY_SECONDS)
+        logger.info("Retrying LLM call in %.2fs (attempt %s)", delay, attempt + 1)
+        return delay
+
+
+def _percentile(values, fraction: float) -> float:
+    if not values:
+        return 0.0
+    return values[min(int(len(values) * fraction), len(values) - 1)]
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from ..config import get_settings
+from .llm_gateway import CircuitBreaker, LLMGateway
+from .llm_service import LLMService, LLMServiceError
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Fewer samples than this and a provider's p90 is not trusted for hedging.
+MIN_HEDGE_SAMPLES = 10
+# A provider that always fails ranks as if every call took this long.
+ERROR_PENALTY_SECONDS = 30.0
+# Below this many samples a provider's median is replaced by the prior.
+MIN_RANK_SAMPLES = 5
+
+
+class LLMRouter:
+    """Routes completions across several OpenAI-compatible providers.
+
+    Providers are ranked by observed median latency plus a penalty for their
+    recent error rate; providers with an open circuit go last. Until a
+    provider has ``MIN_RANK_SAMPLES`` latencies it is assumed to take
+    ``latency_prior`` seconds, so an untried backup does not outrank a
+    sampled primary and ties keep configuration order. A failed call falls
+    over to the next provider. With hedging on, a second request goes to the
+    runner-up once the first exceeds its own p90 latency, and whichever
+    finishes first wins while the other is cancelled.
+    """
+
+    def __init__(
+        self,
+        gateways: Sequence[LLMGateway],
+        *,
+        hedging: Optional[bool] = None,
+        hedge_min_delay: Optional[float] = None,
+        latency_prior: Optional[float] = None,
+    ) -> None:
+        if not gateways:
+            raise ValueError("LLMRouter needs at least one provider.")
+        self._gateways = list(gateways)
+        self._hedging = hedging if hedging is not None else settings.llm_hedging_enabled
+        self._hedge_min_delay = hedge_min_delay or settings.llm_hedge_min_delay_seconds
+        self._latency_prior = (
+            latency_prior if latency_prior is not None else settings.llm_latency_prior_seconds
+        )
+        self._hedges: Dict[str, int] = {gateway.name: 0 for gateway in self._gateways}
+        self._hedge_wins: Dict[str, int] = {gateway.name: 0 for gateway in self._gateways}
+
+    @property
+    def enabled(self) -> bool:
+        return any(gateway.enabled for gateway in self._gateways)
+
+    @property
+    def warm(self) -> bool:
+        """True once a provider client has been created by a first call."""
+        return any(gateway.warm for gateway in self._gateways)
+
+    @property
+    def model(self) -> str:
+        return self._gateways[0].model
+
+    @property
+    def fingerprint(self) -> str:
+        """Every configured provider and model, in configuration order.
+
+        Any of them may answer a call, so response caches key on this rather
+        than on the primary model alone.
+        """
+        return ",".join(f"{gateway.name}={gateway.model}" for gateway in self._gateways)
+
+    async def complete(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> str:
+        kwargs = dict(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        ranked = self.ranked()
+        if not ranked:
+            raise LLMServiceError("LLM client is not configured.")
+        if self._hedging and len(ranked) > 1:
+            return await self._hedged(ranked[0], ranked[1], kwargs, ranked[2:])
+        return await self._failover(ranked, kwargs)
+
+    async def stream(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> AsyncIterator[str]:
+        """Streams from the best provider, failing over before the first delta."""
+        ranked = self.ranked()
+        if not ranked:
+            raise LLMServiceError("LLM client is not configured.")
+        error: Optional[LLMServiceError] = None
+        for gateway in ranked:
+            received = False
+            try:
+                async for delta in gateway.stream(
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                ):
+                    received = True
+                    yield delta
+                return
+            except LLMServiceError as exc:
+                if received:
+                    raise
+                error = exc
+                logger.info("LLM provider %s failed, trying next: %s", gateway.name, exc)
+        raise error
+
+    def ranked(self) -> List[LLMGateway]:
+        def score(gateway: LLMGateway) -> tuple:
+            is_open = gateway.circuit_state == CircuitBreaker.OPEN
+            if gateway.latency_samples >= MIN_RANK_SAMPLES:
+                latency = gateway.latency_percentile(0.5)
+            else:
+                latency = self._latency_prior
+            return (is_open, latency + gateway.error_rate * ERROR_PENALTY_SECONDS)
+
+        return sorted((g for g in self._gateways if g.enabled), key=score)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                **gateway.stats(),
+                "hedges": self._hedges[gateway.name],
+                "hedge_wins": self._hedge_wins[gateway.name],
+            }
+            for gateway in self._gateways
+        ]
+
+    async def _failover(self, gateways: Sequence[LLMGateway], kwargs: dict) -> str:
+        error: Optional[LLMServiceError] = None
+        for gateway in gateways:
+            try:
+                return await gateway.complete(**kwargs)
+            except LLMServiceError as exc:
+                error = exc
+                logger.info("LLM provider %s failed, trying next: %s", gateway.name, exc)
+        raise error
+
+    async def _hedged(
+        self,
+        primary: LLMGateway,
+        backup: LLMGateway,
+        kwargs: dict,
+        rest: Sequence[LLMGateway],
+    ) -> str:
+        delay = self._hedge_min_delay
+        if primary.latency_samples >= MIN_HEDGE_SAMPLES:
+            delay = max(primary.latency_percentile(0.9), delay)
+        first = asyncio.create_task(primary.complete(**kwargs))
+        tasks = {first: primary}
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+            hedged = not done
+            if hedged:
+                self._hedges[backup.name] += 1
+            elif first.exception() is None:
+                return first.result()
+            else:
+                logger.info("LLM provider %s failed, trying %s", primary.name, backup.name)
+            tasks[asyncio.create_task(backup.complete(**kwargs))] = backup
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if hedged and tasks[task] is backup:
+                            self._hedge_wins[backup.name] += 1
+                        return task.result()
+                    error = task.exception()
+            if rest:
+                return await self._failover(rest, kwargs)
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            for task in tasks:
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await task
+
+
+def build_llm_router() -> LLMRouter:
+    """The configured primary provider followed by ``LLM_PROVIDERS`` entries."""
+    base_url = str(settings.llm_base_url) if settings.llm_base_url else None
+    gateways = [
+        LLMGateway(
+            LLMService(settings.llm_api_key, base_url, settings.llm_model),
+            name=settings.llm_provider,
+        )
+    ]
+    for provider in settings.llm_providers:
+        # Local servers (vLLM, llama.cpp) accept any key but the SDK wants one.
+        llm = LLMService(provider.api_key or "not-needed", provider.base_url, provider.model)
+        gateways.append(
+            LLMGateway(llm, name=provider.name, max_in_flight=provider.max_in_flight)
+        )
+    return LLMRouter(gateways)
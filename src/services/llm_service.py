@@ -1,40 +1,118 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
-from openai import AsyncOpenAI
-from openai import OpenAIError
+import httpx
 
+from ..config import get_settings
 
+if TYPE_CHECKING:  # pragma: no cover
+    from openai import AsyncOpenAI, OpenAIError
+
+
+settings = get_settings()
 logger = logging.getLogger(__name__)
 
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
 
 class LLMServiceError(RuntimeError):
     """Raised when the LLM provider fails or is not configured."""
 
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: Optional[int] = None,
+        retryable: bool = False,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+    @classmethod
+    def from_provider(cls, exc: "OpenAIError") -> "LLMServiceError":
+        from openai import APIConnectionError, APIStatusError
+
+        if isinstance(exc, APIStatusError):
+            return cls(
+                "LLM provider rejected the request.",
+                status_code=exc.status_code,
+                retryable=exc.status_code in RETRYABLE_STATUS,
+                retry_after=_retry_after(exc.response),
+            )
+        # Connection resets and timeouts never reached the model.
+        return cls(
+            "LLM provider rejected the request.",
+            retryable=isinstance(exc, APIConnectionError),
+        )
+
+
+@dataclass
+class LLMCompletion:
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
 
 class LLMService:
-    """Thin wrapper around the OpenAI client with sane defaults."""
+    """Thin wrapper around the OpenAI client with sane defaults.
+
+    Retries are left to ``LLMGateway``; the client itself makes one attempt
+    per call over a connection pool sized to ``llm_max_in_flight``. The SDK
+    is imported and the client built on first use, keeping both off startup.
+    """
 
     def __init__(
         self,
         api_key: Optional[str],
         base_url: Optional[str],
         model: str,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         self._model = model
-        self._client: Optional[AsyncOpenAI] = None
-        if api_key:
-            kwargs = {"api_key": api_key}
-            if base_url:
-                kwargs["base_url"] = base_url
-            self._client = AsyncOpenAI(**kwargs)
+        self._api_key = api_key
+        self._base_url = base_url
+        self._http_client = http_client
+        self._client: Optional["AsyncOpenAI"] = None
 
     @property
     def enabled(self) -> bool:
+        return bool(self._api_key)
+
+    @property
+    def warm(self) -> bool:
         return self._client is not None
 
+    def _get_client(self) -> "AsyncOpenAI":
+        if self._client is not None:
+            return self._client
+        if not self._api_key:
+            raise LLMServiceError("LLM client is not configured.")
+        from openai import AsyncOpenAI
+
+        kwargs = {"api_key": self._api_key, "max_retries": 0}
+        if self._base_url:
+            kwargs["base_url"] = self._base_url
+        kwargs["http_client"] = self._http_client or httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.llm_timeout_seconds, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_in_flight,
+                max_keepalive_connections=settings.llm_max_in_flight,
+                keepalive_expiry=60,
+            ),
+        )
+        self._client = AsyncOpenAI(**kwargs)
+        return self._client
+
+    @property
+    def model(self) -> str:
+        return self._model
+
     async def complete(
         self,
         *,
@@ -43,11 +121,28 @@ class LLMService:
         temperature: float = 0.2,
         max_tokens: int = 800,
     ) -> str:
-        if not self._client:
-            raise LLMServiceError("LLM client is not configured.")
+        completion = await self.create_completion(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return completion.content
+
+    async def create_completion(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> LLMCompletion:
+        """Like ``complete`` but also returns token usage."""
+        client = self._get_client()
+        from openai import OpenAIError
 
         try:
-            response = await self._client.chat.completions.create(
+            response = await client.chat.completions.create(
                 model=self._model,
                 temperature=temperature,
                 max_tokens=max_tokens,
@@ -58,7 +153,7 @@ class LLMService:
             )
         except OpenAIError as exc:  # pragma: no cover - network side effect
             logger.error("LLM completion failed: %s", exc)
-            raise LLMServiceError("LLM provider rejected the request.") from exc
+            raise LLMServiceError.from_provider(exc) from exc
 
         if not response.choices:
             raise LLMServiceError("LLM response did not include any choices.")
@@ -66,4 +161,52 @@ class LLMService:
         message = response.choices[0].message
         if not message or not message.content:
             raise LLMServiceError("LLM response did not include content.")
-        return message.content.strip()
+        usage = response.usage
+        return LLMCompletion(
+            content=message.content.strip(),
+            prompt_tokens=usage.prompt_tokens if usage else 0,
+            completion_tokens=usage.completion_tokens if usage else 0,
+        )
+
+    async def stream(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+    ) -> AsyncIterator[str]:
+        """Yield completion text deltas as the provider produces them."""
+        client = self._get_client()
+        from openai import OpenAIError
+
+        try:
+            response = await client.chat.completions.create(
+                model=self._model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+            )
+            async for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta and delta.content:
+                    yield delta.content
+        except OpenAIError as exc:  # pragma: no cover - network side effect
+            logger.error("LLM streaming completion failed: %s", exc)
+            raise LLMServiceError.from_provider(exc) from exc
+
+
+def _retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    if response is None:
+        return None
+    value = response.headers.get("retry-after")
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
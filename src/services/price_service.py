@@ -1,13 +1,20 @@
 import asyncio
-from dataclasses import dataclass
-from typing import Optional
-
-import httpx
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Optional
 
 from ..config import get_settings
+from .cache import SingleFlightCache
+from .finnhub import FinnhubClient, get_finnhub_client
+from .limits import Priority
+
+if TYPE_CHECKING:
+    from ..streaming.trades import PriceTable
 
 
 settings = get_settings()
+# A live trade only carries the last price, so the previous close comes from a
+# REST quote at most this old.
+REFERENCE_QUOTE_MAX_AGE = 6 * 3600
 
 
 @dataclass
@@ -25,7 +32,29 @@ class PriceService:
     # Shared semaphore to limit concurrency across all instances/requests
     _semaphore = asyncio.Semaphore(5)
 
-    async def fetch_quote(self, symbol: str) -> PriceSnapshot:
+    def __init__(
+        self,
+        client: Optional[FinnhubClient] = None,
+        live_prices: Optional["PriceTable"] = None,
+    ) -> None:
+        self._client = client or get_finnhub_client()
+        self._live_prices = live_prices
+        self._quotes: SingleFlightCache[PriceSnapshot] = SingleFlightCache(
+            ttl=settings.quote_cache_ttl_seconds,
+            stale_ttl=settings.quote_cache_stale_seconds,
+            max_entries=settings.quote_cache_max_entries,
+        )
+
+    def cache_stats(self) -> dict:
+        return self._quotes.stats()
+
+    async def fetch_quote(
+        self, symbol: str, priority: Priority = Priority.INTERACTIVE
+    ) -> PriceSnapshot:
+        normalized = symbol.upper()
+        live = self._live_quote(normalized)
+        if live is not None:
+            return live
         if not settings.finnhub_api_key:
             # Without an API key we still return a deterministic payload so the UI
             # can show placeholders instead of failing outright.
@@ -37,11 +66,31 @@ class PriceService:
                 percent_change=None,
             )
 
-        params = {"symbol": symbol.upper(), "token": settings.finnhub_api_key}
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(str(settings.finnhub_quote_url), params=params)
-            response.raise_for_status()
-            payload = response.json()
+        return await self._quotes.get(
+            normalized, lambda: self._request_quote(normalized, priority)
+        )
+
+    def _live_quote(self, symbol: str) -> Optional[PriceSnapshot]:
+        if self._live_prices is None:
+            return None
+        trade = self._live_prices.get(symbol, settings.trade_price_max_age_seconds)
+        reference = self._quotes.peek(symbol, REFERENCE_QUOTE_MAX_AGE)
+        if trade is None or reference is None:
+            return None
+        percent_change = None
+        if reference.previous_close not in (None, 0):
+            percent_change = (
+                (trade.price - reference.previous_close) / reference.previous_close
+            ) * 100
+        return replace(reference, current=trade.price, percent_change=percent_change)
+
+    async def _request_quote(self, symbol: str, priority: Priority) -> PriceSnapshot:
+        payload = await self._client.get(
+            str(settings.finnhub_quote_url),
+            {"symbol": symbol.upper()},
+            priority=priority,
+            timeout=10,
+        )
 
         current = _safe_float(payload.get("c"))
         open_price = _safe_float(payload.get("o"))
@@ -57,6 +57,63 @@ class PromptManager:
 
         return f"{header}\n\n지시사항:\n{instructions}"
 
+    @staticmethod
+    def build_digest_prompt(
+        symbol: str,
+        article_context: str,
+        price: PriceSnapshot,
+    ) -> str:
+        header = textwrap.dedent(
+            f"""
+            티커: {symbol}
+            변동률: {PromptManager._format_percent(price.percent_change)}
+            기사 컨텍스트:
+            {article_context}
+            """
+        ).strip()
+
+        instructions = textwrap.dedent("""
+            위 기사들을 종합 브리핑에 쓰일 짧은 요약으로 압축하세요.
+            반드시 아래 JSON 형식만 응답하세요. sentiment는 0(매우 부정) ~ 100(매우 긍정)
+            정수, one_liner는 종목 상황을 한 문장(60자 이내)으로 요약, themes는 최대 3개이며
+            각 15자 이내입니다. JSON 안에 주석을 넣지 마세요.
+
+            {
+                "sentiment": 50,
+                "one_liner": "신제품 기대감에 매수세가 이어지고 있습니다.",
+                "themes": ["신제품 출시", "실적 개선"]
+            }
+
+            모든 텍스트는 한국어로 작성하세요.
+        """).strip()
+
+        return f"{header}\n\n지시사항:\n{instructions}"
+
+    @staticmethod
+    def build_article_batch_prompt(articles: List[Dict[str, Any]]) -> str:
+        excerpts = "\n\n".join(
+            f"[{item['id']}] {item['headline']}\n{item['text'] or '(본문 없음)'}"
+            for item in articles
+        )
+        instructions = textwrap.dedent("""
+            위 기사 각각을 투자자 관점에서 요약하세요.
+            반드시 아래 JSON 형식만 응답하세요. 모든 기사 ID를 포함해야 합니다.
+            summary는 핵심 내용 1-2문장(100자 이내, 한국어), sentiment는 해당 종목에 대한
+            영향을 0(매우 부정) ~ 100(매우 긍정) 정수로 표기합니다. JSON 안에 주석을 넣지 마세요.
+
+            {
+                "articles": [
+                    {
+                        "id": 123,
+                        "summary": "실적 가이던스 상향으로 목표주가가 잇따라 올라갔습니다.",
+                        "sentiment": 72
+                    }
+                ]
+            }
+        """).strip()
+
+        return f"기사 목록:\n{excerpts}\n\n지시사항:\n{instructions}"
+
     @staticmethod
     def build_aggregate_prompt(
         aggregate_context: str, 
@@ -107,22 +164,12 @@ class PromptManager:
                 "key_themes": [
                     "AI 기술 발전으로 관련주 상승",
                     "금리 인하 기대감 확산"
-                ],
-                "individual_insights": {
-                    "AAPL": {
-                        "sentiment": 75,
-                        "one_liner": "신제품 발표로 긍정적 흐름"
-                    },
-                    "TSLA": {
-                        "sentiment": 55,
-                        "one_liner": "생산량 감소 우려"
-                    }
-                }
+                ]
             }
 
             주의사항:
             1. key_themes는 2-4개 항목
-            2. individual_insights는 모든 워치리스트 종목 포함
+            2. 종목별 현황은 이미 요약된 값이므로 종목별 의견은 따로 작성하지 마세요
             3. 모든 텍스트는 한국어로 작성
             4. market_indices의 값은 입력된 데이터를 그대로 사용
         """).strip()
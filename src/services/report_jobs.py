@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from ..config import get_settings
+from ..schemas import ReportJobStatus, ReportOut
+from ..util import normalize_symbol
+from .reports import AISummaryService, ReportGenerationError
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+AGGREGATE_SYMBOL = "WATCHLIST"
+
+
+@dataclass
+class ReportJob:
+    kind: str
+    symbol: Optional[str]
+    limit: int
+    force: bool
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: ReportJobStatus = ReportJobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    report: Optional[ReportOut] = None
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, Optional[str], int, bool]:
+        return (self.kind, self.symbol, self.limit, self.force)
+
+
+class ReportJobQueue:
+    """Runs report generation on a bounded worker pool.
+
+    Identical requests (same kind, symbol and parameters) attach to the job
+    already queued or running. Finished jobs are kept for ``ttl_seconds`` and
+    announced through the broadcast backend to ``/ws/news`` subscribers of
+    the report's symbol on every worker.
+
+    Job state lives in this process only: with several workers, polling
+    ``GET /api/reports/jobs/{id}`` must reach the worker that accepted the
+    job (sticky sessions) or rely on the WebSocket announcement instead.
+    """
+
+    def __init__(
+        self,
+        service: AISummaryService,
+        *,
+        notifier=None,
+        workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self._service = service
+        self._notifier = notifier
+        self._worker_count = workers or settings.report_job_workers
+        self._ttl = timedelta(seconds=ttl_seconds or settings.report_job_ttl_seconds)
+        self._queue: asyncio.Queue[ReportJob] = asyncio.Queue(
+            maxsize=queue_size or settings.report_job_queue_size
+        )
+        self._jobs: Dict[str, ReportJob] = {}
+        self._inflight: Dict[Tuple[str, Optional[str], int, bool], ReportJob] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self._worker_count)
+        ]
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def submit(
+        self,
+        kind: str,
+        symbol: Optional[str] = None,
+        limit: int = 20,
+        force: bool = False,
+    ) -> ReportJob:
+        if kind == "aggregate":
+            # The aggregate report ignores limit and force, so they must not
+            # split otherwise identical requests into separate jobs.
+            symbol, limit, force = AGGREGATE_SYMBOL, 0, False
+        elif not symbol:
+            raise ReportGenerationError("리포트를 생성할 심볼을 지정해야 합니다.")
+        job = ReportJob(kind=kind, symbol=normalize_symbol(symbol), limit=limit, force=force)
+        existing = self._inflight.get(job.key)
+        if existing is not None:
+            return existing
+        self._prune()
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull as exc:
+            raise ReportGenerationError(
+                "리포트 생성 요청이 많습니다. 잠시 후 다시 시도해 주세요.", status_code=503
+            ) from exc
+        self._jobs[job.id] = job
+        self._inflight[job.key] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        return self._jobs.get(job_id)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            job.status = ReportJobStatus.RUNNING
+            job.started_at = datetime.now(timezone.utc)
+            try:
+                job.report = await self._run(job)
+                job.status = ReportJobStatus.SUCCEEDED
+            except ReportGenerationError as exc:
+                job.status = ReportJobStatus.FAILED
+                job.error = str(exc)
+            except Exception:
+                logger.exception("Report job %s failed", job.id)
+                job.status = ReportJobStatus.FAILED
+                job.error = "리포트 생성 중 오류가 발생했습니다."
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+                self._inflight.pop(job.key, None)
+                self._queue.task_done()
+            await self._notify(job)
+
+    async def _run(self, job: ReportJob) -> ReportOut:
+        if job.kind == "aggregate":
+            return await self._service.generate_aggregate_report()
+        return await self._service.generate_report(
+            job.symbol, limit=job.limit, force=job.force
+        )
+
+    async def _notify(self, job: ReportJob) -> None:
+        if self._notifier is None or job.symbol is None:
+            return
+        message = {
+            "type": "report_job",
+            "job_id": job.id,
+            "symbol": job.symbol,
+            "status": job.status.value,
+            "report_id": job.report.id if job.report else None,
+        }
+        try:
+            await self._notifier.announce(job.symbol, message)
+        except Exception as exc:
+            logger.warning("Report job notification failed: %s", exc)
+
+    def _prune(self) -> None:
+        cutoff = datetime.now(timezone.utc) - self._ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
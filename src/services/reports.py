@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 import json
-from typing import List, Sequence
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Sequence, Tuple
 
-from sqlalchemy import or_, select
+from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import defer
 
 from ..config import get_settings
 from ..db.models import Article, Report, WatchedSymbol
 from ..schemas import ReportOut, ReportType
 from ..util import normalize_symbol
+from .context_builder import ArticleContextBuilder
+from .digests import SymbolDigestService
+from .llm_cache import complete_validated, stream_validated
 from .llm_service import LLMService, LLMServiceError
 from .price_service import PriceService, PriceSnapshot
 from .prompts import PromptManager
@@ -27,6 +33,17 @@ class ReportGenerationError(Exception):
         self.status_code = status_code
 
 
+@dataclass
+class _ReportPlan:
+    symbol: str
+    articles: Sequence[Article]
+    price: PriceSnapshot
+    article_ids: List[int]
+    system_prompt: str
+    user_prompt: str
+    force: bool = False
+
+
 class AISummaryService:
     """Creates AI-assisted smart briefings anchored on stored article bodies."""
 
@@ -35,18 +52,84 @@ class AISummaryService:
         session_factory: async_sessionmaker[AsyncSession],
         llm_service: LLMService,
         price_service: PriceService,
+        context_builder: ArticleContextBuilder | None = None,
+        digest_service: SymbolDigestService | None = None,
     ) -> None:
         self._sessions = session_factory
         self._llm = llm_service
         self._price_service = price_service
+        self._context_builder = context_builder or ArticleContextBuilder()
+        self._digests = digest_service or SymbolDigestService(llm_service)
 
     async def generate_report(
         self,
         symbol: str,
         report_type: ReportType = ReportType.SMART_BRIEFING,
         limit: int = 20,
+        force: bool = False,
     ) -> ReportOut:
-        normalized = normalize_symbol(symbol)
+        plan = await self._plan_report(normalize_symbol(symbol), limit, force)
+        if isinstance(plan, ReportOut):
+            return plan
+        try:
+            content = await complete_validated(
+                self._llm,
+                self._validated_json,
+                refresh=plan.force,
+                system_prompt=plan.system_prompt,
+                user_prompt=plan.user_prompt,
+                temperature=0.2,
+                max_tokens=1200,
+            )
+        except (LLMServiceError, Exception):
+            content = self._fallback_content(plan.symbol, plan.articles, plan.price)
+            return await self._store_report(plan, content, fallback=True)
+        return await self._store_report(plan, content)
+
+    async def open_report_stream(
+        self,
+        symbol: str,
+        limit: int = 20,
+        force: bool = False,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """Validate inputs up front, then stream ``("delta", text)`` events.
+
+        The iterator ends with ``("report", ReportOut)`` once the completed
+        document has been validated and stored.
+        """
+        plan = await self._plan_report(normalize_symbol(symbol), limit, force)
+        return self._stream_plan(plan)
+
+    async def _stream_plan(
+        self, plan: "_ReportPlan | ReportOut"
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        if isinstance(plan, ReportOut):
+            yield "report", plan
+            return
+        chunks: List[str] = []
+        try:
+            async for delta in stream_validated(
+                self._llm,
+                self._validated_json,
+                refresh=plan.force,
+                system_prompt=plan.system_prompt,
+                user_prompt=plan.user_prompt,
+                temperature=0.2,
+                max_tokens=1200,
+            ):
+                chunks.append(delta)
+                yield "delta", delta
+            content = self._validated_json("".join(chunks).strip())
+        except (LLMServiceError, Exception):
+            content = self._fallback_content(plan.symbol, plan.articles, plan.price)
+            yield "report", await self._store_report(plan, content, fallback=True)
+            return
+        yield "report", await self._store_report(plan, content)
+
+    async def _plan_report(
+        self, normalized: str, limit: int, force: bool
+    ) -> "_ReportPlan | ReportOut":
+        """Gather report inputs, or return the latest report if still current."""
         async with self._sessions() as session:
             await self._ensure_symbol_is_watched(session, normalized)
             articles = await self._fetch_recent_articles(session, normalized, limit)
@@ -54,47 +137,67 @@ class AISummaryService:
                 raise ReportGenerationError(
                     "최근 기사 데이터가 없어 리포트를 생성할 수 없습니다."
                 )
-            try:
-                price = await self._price_service.fetch_quote(normalized)
-            except Exception:
-                price = PriceSnapshot(symbol=normalized, current=None, open_price=None, previous_close=None, percent_change=None)
-            article_context = self._build_article_context(articles)
-            user_prompt = PromptManager.build_report_prompt(
-                normalized, article_context, price, len(articles)
-            )
-            system_prompt = PromptManager.build_system_prompt()
-            try:
-                content = await self._llm.complete(
-                    system_prompt=system_prompt,
-                    user_prompt=user_prompt,
-                    temperature=0.2,
-                    max_tokens=1200,
-                )
-                # Validate JSON structure
-                try:
-                    json.loads(content)
-                except json.JSONDecodeError:
-                    # If LLM returns markdown fenced code block, try to strip it
-                    if "```json" in content:
-                        content = content.split("```json")[1].split("```")[0].strip()
-                        json.loads(content) # Verify again
-                    else:
-                        raise LLMServiceError("LLM did not return valid JSON.")
-            except (LLMServiceError, Exception):
-                content = self._fallback_content(normalized, articles, price)
+            price = await self._quote_or_placeholder(normalized)
+            article_ids = sorted(article.id for article in articles)
+            if not force:
+                latest = await self._latest_report(session, normalized)
+                if latest is not None and self._can_reuse(latest, article_ids, price):
+                    return ReportOut.model_validate(latest)
+        context = self._context_builder.build(articles)
+        return _ReportPlan(
+            symbol=normalized,
+            articles=context.articles,
+            price=price,
+            article_ids=article_ids,
+            system_prompt=PromptManager.build_system_prompt(),
+            user_prompt=PromptManager.build_report_prompt(
+                normalized, context.text, price, len(context.articles)
+            ),
+            force=force,
+        )
 
+    async def _store_report(
+        self, plan: "_ReportPlan", content: str, fallback: bool = False
+    ) -> ReportOut:
+        async with self._sessions() as session:
             # Always force type to SMART_BRIEFING for new reports
-            row = Report(symbol=normalized, type=ReportType.SMART_BRIEFING.value, content=content)
+            row = Report(
+                symbol=plan.symbol,
+                type=ReportType.SMART_BRIEFING.value,
+                content=content,
+                # A placeholder briefing records no inputs, so _can_reuse
+                # never serves it and the next request retries the LLM.
+                article_ids=None if fallback else plan.article_ids,
+                reference_price=plan.price.current,
+            )
             session.add(row)
             await session.commit()
             await session.refresh(row)
             return ReportOut.model_validate(row)
 
+    @staticmethod
+    def _validated_json(content: str) -> str:
+        """Return ``content`` as a JSON document, unwrapping a fenced block."""
+        try:
+            json.loads(content)
+        except json.JSONDecodeError:
+            # If LLM returns markdown fenced code block, try to strip it
+            if "```json" in content:
+                content = content.split("```json")[1].split("```")[0].strip()
+                json.loads(content) # Verify again
+            else:
+                raise LLMServiceError("LLM did not return valid JSON.")
+        return content
+
     async def generate_aggregate_report(self, limit_per_symbol: int = 10) -> ReportOut:
         """Generate an aggregate report for ALL watchlist symbols."""
         async with self._sessions() as session:
             # Fetch all watched symbols except WATCHLIST itself
-            stmt = select(WatchedSymbol.symbol).where(WatchedSymbol.symbol != "WATCHLIST")
+            stmt = (
+                select(WatchedSymbol.symbol)
+                .where(WatchedSymbol.symbol != "WATCHLIST")
+                .order_by(WatchedSymbol.id)
+            )
             result = await session.execute(stmt)
             symbols = result.scalars().all()
 
@@ -104,64 +207,53 @@ class AISummaryService:
             # Ensure WATCHLIST watched symbol exists
             await self._ensure_symbol_is_watched(session, "WATCHLIST")
 
-            # Collect data for each symbol
-            symbol_insights = {}
-            all_articles = []
-            
-            for symbol in symbols:
-                try:
-                    articles = await self._fetch_recent_articles(session, symbol, limit_per_symbol)
-                    if articles:
-                        all_articles.extend(articles)
-                        # Get price for each symbol
-                        try:
-                            price = await self._price_service.fetch_quote(symbol)
-                        except Exception:
-                            price = PriceSnapshot(symbol=symbol, current=None, open_price=None, previous_close=None, percent_change=None)
-                        symbol_insights[symbol] = {
-                            "article_count": len(articles),
-                            "price_change": price.percent_change if price else 0,
-                            "articles": articles,
-                            "price": price
-                        }
-                except Exception as e:
-                    # Skip symbols that fail
-                    print(f"Failed to fetch data for {symbol}: {e}")
-                    continue
-
-            if not all_articles:
+            # One windowed query for every symbol's recent articles, then all
+            # quotes (symbols and market indices) concurrently.
+            articles_by_symbol = await self._fetch_recent_articles_by_symbol(
+                session, symbols, limit_per_symbol
+            )
+            index_names = [("^IXIC", "Nasdaq"), ("^GSPC", "S&P 500")]
+            quoted_symbols = list(articles_by_symbol)
+            quotes = await asyncio.gather(
+                *(self._quote_or_placeholder(symbol) for symbol in quoted_symbols),
+                *(self._quote_or_placeholder(symbol) for symbol, _ in index_names),
+            )
+
+            if not any(articles_by_symbol.values()):
                 raise ReportGenerationError("워치리스트 종목들의 최근 기사가 없습니다.")
 
-            # Fetch market indices
-            indices = {}
-            for symbol, name in [("^IXIC", "Nasdaq"), ("^GSPC", "S&P 500")]:
-                try:
-                    price = await self._price_service.fetch_quote(symbol)
-                    indices[name] = price
-                except Exception:
-                    indices[name] = PriceSnapshot(symbol=symbol, current=None, open_price=None, previous_close=None, percent_change=None)
+            prices = dict(zip(quoted_symbols, quotes))
+            indices = {
+                name: price
+                for (_, name), price in zip(index_names, quotes[len(quoted_symbols):])
+            }
+
+            # Map: per-symbol digests, regenerated only for symbols with new
+            # articles. Reduce: one compact prompt over the digests.
+            digests = await self._digests.digests_for(session, articles_by_symbol, prices)
+            symbol_insights = {
+                symbol: {
+                    "article_count": len(articles_by_symbol[symbol]),
+                    "price_change": prices[symbol].percent_change if prices[symbol] else 0,
+                    "digest": digests[symbol],
+                }
+                for symbol in quoted_symbols
+            }
 
-            # Build aggregate context
             aggregate_context = self._build_aggregate_context(symbol_insights)
             user_prompt = PromptManager.build_aggregate_prompt(aggregate_context, len(symbols), indices)
             system_prompt = PromptManager.build_system_prompt()
 
             try:
-                content = await self._llm.complete(
+                content = await complete_validated(
+                    self._llm,
+                    self._validated_json,
                     system_prompt=system_prompt,
                     user_prompt=user_prompt,
                     temperature=0.2,
-                    max_tokens=2000,
+                    max_tokens=800,
                 )
-                # Validate JSON
-                try:
-                    json.loads(content)
-                except json.JSONDecodeError:
-                    if "```json" in content:
-                        content = content.split("```json")[1].split("```")[0].strip()
-                        json.loads(content)
-                    else:
-                        raise LLMServiceError("LLM did not return valid JSON.")
+                content = self._with_individual_insights(content, symbol_insights)
             except (LLMServiceError, Exception):
                 content = self._fallback_aggregate_content(symbol_insights)
 
@@ -190,12 +282,47 @@ class AISummaryService:
     ) -> List[ReportOut]:
         normalized = normalize_symbol(symbol) if symbol else None
         async with self._sessions() as session:
-            stmt = select(Report).order_by(Report.created_at.desc()).limit(limit)
+            # Plain column rows: skips the reuse bookkeeping columns and the
+            # ORM identity map, neither of which a listing needs.
+            stmt = (
+                select(*(getattr(Report, name) for name in ReportOut.model_fields))
+                .order_by(Report.created_at.desc())
+                .limit(limit)
+            )
             if normalized:
                 stmt = stmt.where(Report.symbol == normalized)
             result = await session.execute(stmt)
-            rows = result.scalars().all()
-            return [ReportOut.model_validate(row) for row in rows]
+            return [ReportOut.model_validate(row) for row in result.all()]
+
+    async def _latest_report(
+        self, session: AsyncSession, symbol: str
+    ) -> Report | None:
+        result = await session.execute(
+            select(Report)
+            .where(Report.symbol == symbol)
+            .order_by(Report.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def _can_reuse(
+        report: Report, article_ids: Sequence[int], price: PriceSnapshot
+    ) -> bool:
+        """True when no new articles arrived and the price barely moved."""
+        if report.article_ids is None or report.created_at is None:
+            return False
+        age = datetime.now(timezone.utc) - report.created_at
+        if age > timedelta(minutes=settings.report_reuse_max_age_minutes):
+            return False
+        if not set(article_ids) <= set(report.article_ids):
+            return False
+        if price.current is None:
+            return True
+        if not report.reference_price:
+            return False
+        moved = abs(price.current - report.reference_price) / report.reference_price * 100
+        return moved < settings.report_reuse_price_threshold_percent
 
     async def _ensure_symbol_is_watched(
         self, session: AsyncSession, symbol: str
@@ -237,21 +364,56 @@ class AISummaryService:
         result = await session.execute(stmt)
         return result.scalars().all()
 
-    @staticmethod
-    def _build_article_context(articles: Sequence[Article]) -> str:
-        lines: List[str] = []
-        for article in articles:
-            timestamp = (
-                article.published_at.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-                if article.published_at
-                else "발행시각 알 수 없음"
+    async def _fetch_recent_articles_by_symbol(
+        self, session: AsyncSession, symbols: Sequence[str], limit: int
+    ) -> Dict[str, List[Article]]:
+        """Top ``limit`` recent articles per symbol in a single query.
+
+        Keys follow the order of ``symbols``; symbols without recent
+        articles are left out.
+        """
+        if not symbols:
+            return {}
+        lookback = datetime.now(timezone.utc) - timedelta(
+            days=settings.report_article_lookback_days
+        )
+        ranked = (
+            select(
+                Article.id,
+                func.row_number()
+                .over(
+                    partition_by=Article.symbol,
+                    order_by=(Article.published_at.desc().nullslast(), Article.id.desc()),
+                )
+                .label("rank"),
             )
-            summary = article.summary or "요약 없음"
-            lines.append(
-                f"[기사#{article.id}] {article.headline} | 출처: {article.source or '정보 없음'} | {timestamp}\n"
-                f"요약: {summary}"
+            .where(Article.symbol.in_(symbols))
+            .where(
+                or_(
+                    Article.published_at.is_(None),
+                    Article.published_at >= lookback,
+                )
             )
-        return "\n".join(lines)
+            .subquery()
+        )
+        stmt = (
+            select(Article)
+            .options(defer(Article.body))
+            .join(ranked, Article.id == ranked.c.id)
+            .where(ranked.c.rank <= limit)
+            .order_by(Article.symbol, ranked.c.rank)
+        )
+        result = await session.execute(stmt)
+        grouped: Dict[str, List[Article]] = {}
+        for article in result.scalars().all():
+            grouped.setdefault(article.symbol, []).append(article)
+        return {symbol: grouped[symbol] for symbol in symbols if symbol in grouped}
+
+    async def _quote_or_placeholder(self, symbol: str) -> PriceSnapshot:
+        try:
+            return await self._price_service.fetch_quote(symbol)
+        except Exception:
+            return PriceSnapshot(symbol=symbol, current=None, open_price=None, previous_close=None, percent_change=None)
 
     def _fallback_content(
         self,
@@ -272,27 +434,41 @@ class AISummaryService:
 
     @staticmethod
     def _build_aggregate_context(symbol_insights: dict) -> str:
-        """Build context for aggregate report from multiple symbols."""
+        """Build context for aggregate report from per-symbol digests."""
         lines: List[str] = []
         for symbol, data in symbol_insights.items():
             price_change = data.get("price_change") or 0.0
             article_count = data.get("article_count", 0)
-            lines.append(f"[{symbol}] 변동률: {price_change:+.2f}%, 기사 수: {article_count}")
-            # Add top 2 article headlines for context
-            for article in data.get("articles", [])[:2]:
-                lines.append(f"  - {article.headline}")
+            digest = data["digest"]
+            line = (
+                f"[{symbol}] 변동률: {price_change:+.2f}%, 기사 수: {article_count}, "
+                f"심리: {digest.sentiment} | {digest.one_liner}"
+            )
+            if digest.themes:
+                line += f" | 테마: {', '.join(digest.themes)}"
+            lines.append(line)
         return "\n".join(lines)
 
+    @staticmethod
+    def _individual_insights(symbol_insights: dict) -> dict:
+        return {
+            symbol: {
+                "sentiment": data["digest"].sentiment,
+                "one_liner": data["digest"].one_liner,
+            }
+            for symbol, data in symbol_insights.items()
+        }
+
+    @classmethod
+    def _with_individual_insights(cls, content: str, symbol_insights: dict) -> str:
+        document = json.loads(content)
+        document["individual_insights"] = cls._individual_insights(symbol_insights)
+        return json.dumps(document, ensure_ascii=False)
+
     @staticmethod
     def _fallback_aggregate_content(symbol_insights: dict) -> str:
         """Fallback content for aggregate reports when LLM fails."""
-        individual_insights = {}
-        for symbol, data in symbol_insights.items():
-            price_change = data.get("price_change") or 0.0
-            individual_insights[symbol] = {
-                "sentiment": 50,
-                "one_liner": f"기사 {data.get('article_count', 0)}건, 변동률 {price_change:+.2f}%"
-            }
+        individual_insights = AISummaryService._individual_insights(symbol_insights)
 
         return json.dumps({
             "overall_sentiment": 50,
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Mapping, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import get_settings
+from ..db.session import init_db
+from .context_builder import preload_encoder
+from .ticker_search import TickerSearchIndex
+from .tickers import last_ticker_sync, sync_tickers_from_finnhub
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Subsystems that must be up before the instance takes traffic; the rest are
+# reported but warm lazily or have a slower fallback.
+REQUIRED = ("database", "services")
+MAX_RETRY_SECONDS = 60.0
+
+
+class StartupWarmup:
+    """Brings the app up in the background so it can serve from the first second.
+
+    Runs once at startup: create the schema (when ``db_create_all``), start
+    the background services, load the tokenizer, then sync tickers unless a sync finished within
+    ``ticker_sync_interval_hours`` and load the ticker search index.
+    ``status`` reports each step plus any lazily warmed ``probes``.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ticker_search: TickerSearchIndex,
+        *,
+        start_services: Callable[[], Awaitable[None]],
+        probes: Optional[Mapping[str, Callable[[], bool]]] = None,
+        create_schema: Optional[bool] = None,
+        sync_interval_hours: Optional[float] = None,
+        retry_seconds: float = 5.0,
+    ) -> None:
+        self._sessions = session_factory
+        self._ticker_search = ticker_search
+        self._start_services = start_services
+        self._probes = dict(probes or {})
+        self._create_schema = (
+            create_schema if create_schema is not None else settings.db_create_all
+        )
+        self._sync_interval = timedelta(
+            hours=sync_interval_hours
+            if sync_interval_hours is not None
+            else settings.ticker_sync_interval_hours
+        )
+        self._warm: Dict[str, bool] = {
+            "database": False,
+            "services": False,
+            "ticker_sync": False,
+        }
+        self._retry_seconds = retry_seconds
+        self.errors: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def ready(self) -> bool:
+        return all(self._warm[name] for name in REQUIRED)
+
+    def status(self) -> Dict[str, bool]:
+        subsystems = dict(self._warm)
+        subsystems["ticker_search"] = self._ticker_search.ready
+        for name, probe in self._probes.items():
+            subsystems[name] = probe()
+        return subsystems
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def run(self) -> None:
+        await self._until_done("database", self._check_database)
+        await self._until_done("services", self._start_services)
+        await preload_encoder()
+
+        # Serve typeahead from the last synced list while Finnhub is queried.
+        await self._refresh_search()
+        try:
+            changed = await self._sync_tickers()
+        except Exception as exc:
+            self.errors["ticker_sync"] = str(exc) or type(exc).__name__
+            logger.warning("Ticker sync failed: %s", exc)
+            changed = False
+        if changed or not self._ticker_search.ready:
+            await self._refresh_search()
+
+    async def _until_done(self, name: str, step: Callable[[], Awaitable[None]]) -> None:
+        """Retry ``step`` with backoff; the last error is reported by ``/api/ready``."""
+        delay = self._retry_seconds
+        while not self._warm[name]:
+            try:
+                await step()
+            except Exception as exc:
+                self.errors[name] = str(exc) or type(exc).__name__
+                logger.exception("Startup step %s failed; retrying in %.0fs", name, delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RETRY_SECONDS)
+            else:
+                self._warm[name] = True
+                self.errors.pop(name, None)
+
+    async def _check_database(self) -> None:
+        if self._create_schema:
+            await init_db()
+        else:
+            async with self._sessions() as session:
+                await session.execute(text("SELECT 1"))
+
+    async def _refresh_search(self) -> None:
+        try:
+            await self._ticker_search.refresh()
+        except Exception as exc:
+            logger.warning("Ticker search index build failed: %s", exc)
+
+    async def _sync_tickers(self) -> bool:
+        """Sync unless a recent run exists; returns whether any ticker changed."""
+        if not settings.finnhub_api_key:
+            logger.warning("FINNHUB_API_KEY missing; ticker sync skipped.")
+            return False
+        async with self._sessions() as session:
+            last = await last_ticker_sync(session)
+            if last is not None and datetime.now(timezone.utc) - last < self._sync_interval:
+                logger.info("Tickers synced at %s; skipping startup sync", last.isoformat())
+                self._warm["ticker_sync"] = True
+                return False
+            result = await sync_tickers_from_finnhub(session)
+        logger.info(
+            "Synced %s tickers (%s new, %s changed, %s delisted)",
+            result.total,
+            result.inserted,
+            result.updated,
+            result.deactivated,
+        )
+        self._warm["ticker_sync"] = True
+        return bool(result.inserted or result.updated or result.deactivated)
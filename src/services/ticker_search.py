@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import logging
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..db.models import Ticker
+from ..schemas import TickerOut
+from .tickers import last_ticker_sync
+
+
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM = re.compile(r"[^0-9A-Z]+")
+# Trigrams shared by more tickers than this ("INC", " CO") say nothing about
+# a match and would make fuzzy lookups scan most of the table.
+MAX_POSTING = 2000
+MAX_PREFIX_MATCHES = 500
+FUZZY_THRESHOLD = 0.5
+# How often a worker checks ``ticker_sync_runs`` for a sync made elsewhere.
+RELOAD_CHECK_SECONDS = 60.0
+
+
+def _normalize(text: str) -> str:
+    return _NON_ALNUM.sub(" ", text.upper()).strip()
+
+
+def _trigrams(text: str) -> Set[str]:
+    grams: Set[str] = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class TickerSearchIndex:
+    """In-memory typeahead over ticker symbols and company names.
+
+    Results are ranked exact symbol, then symbol prefix, then name word
+    prefix, then substring, then trigram-similar (typo tolerant). Prefix
+    lookups bisect sorted arrays and the rest go through a trigram posting
+    index, so a query touches a few hundred entries rather than the table.
+
+    A sync on any worker records a ``ticker_sync_runs`` row; ``reload_if_stale``
+    compares its time with the one loaded here, at most every
+    ``RELOAD_CHECK_SECONDS``, and rebuilds in the background when it moved.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._sessions = session_factory
+        self._lock = asyncio.Lock()
+        self._tickers: List[TickerOut] = []
+        self._search_text: List[str] = []
+        self._symbols: List[Tuple[str, int]] = []
+        self._words: List[Tuple[str, int]] = []
+        self._by_symbol: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = {}
+        self._synced_at: Optional[datetime] = None
+        self._checked_at = 0.0
+        self._reload: Optional[asyncio.Task[None]] = None
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._tickers)
+
+    def __len__(self) -> int:
+        return len(self._tickers)
+
+    async def refresh(self) -> int:
+        """Reload active tickers from the database and swap the index in."""
+        async with self._lock:
+            async with self._sessions() as session:
+                synced_at = await last_ticker_sync(session)
+                result = await session.execute(
+                    select(*(getattr(Ticker, name) for name in TickerOut.model_fields))
+                    .where(Ticker.is_active.is_(True))
+                    .order_by(Ticker.symbol)
+                )
+                tickers = [TickerOut.model_validate(row) for row in result.all()]
+            self.build(tickers)
+            self._synced_at = synced_at
+            self._checked_at = time.monotonic()
+        logger.info("Ticker search index holds %s symbols", len(tickers))
+        return len(tickers)
+
+    def reload_if_stale(self) -> None:
+        """Schedule a rebuild if another worker synced since this index loaded."""
+        now = time.monotonic()
+        if now - self._checked_at < RELOAD_CHECK_SECONDS:
+            return
+        if self._reload is not None and not self._reload.done():
+            return
+        self._checked_at = now
+        self._reload = asyncio.create_task(self._reload_if_synced())
+
+    async def _reload_if_synced(self) -> None:
+        try:
+            async with self._sessions() as session:
+                synced_at = await last_ticker_sync(session)
+            if synced_at is not None and (
+                self._synced_at is None or synced_at > self._synced_at
+            ):
+                await self.refresh()
+        except Exception as exc:
+            logger.warning("Ticker search reload check failed: %s", exc)
+
+    def build(self, tickers: Sequence[TickerOut]) -> None:
+        search_text: List[str] = []
+        symbols: List[Tuple[str, int]] = []
+        words: List[Tuple[str, int]] = []
+        postings: Dict[str, List[int]] = {}
+        for index, ticker in enumerate(tickers):
+            name = _normalize(ticker.name or "")
+            search_text.append(f"{ticker.symbol} {name}")
+            symbols.append((ticker.symbol, index))
+            words.extend((word, index) for word in set(name.split()))
+            for gram in _trigrams(f"{_normalize(ticker.symbol)} {name}"):
+                postings.setdefault(gram, []).append(index)
+        symbols.sort()
+        words.sort()
+        # Attribute assignment is atomic, so readers never see a half-built index.
+        self._tickers = list(tickers)
+        self._search_text = search_text
+        self._symbols = symbols
+        self._words = words
+        self._by_symbol = {ticker.symbol: index for index, ticker in enumerate(tickers)}
+        self._postings = postings
+
+    def list(self, limit: int) -> List[TickerOut]:
+        return [self._tickers[index] for _, index in self._symbols[:limit]]
+
+    def search(self, query: str, limit: int = 20) -> List[TickerOut]:
+        raw = query.strip().upper()
+        term = _normalize(raw)
+        if not term or limit <= 0:
+            return []
+        ranked: List[int] = []
+        seen: Set[int] = set()
+
+        def take(indices) -> bool:
+            for index in indices:
+                if index not in seen:
+                    seen.add(index)
+                    ranked.append(index)
+                    if len(ranked) >= limit:
+                        return True
+            return False
+
+        exact = self._by_symbol.get(raw)
+        if take([exact] if exact is not None else []):
+            return self._result(ranked)
+        if take(self._prefixed(self._symbols, raw, by_length=True)):
+            return self._result(ranked)
+        if take(self._prefixed(self._words, term.split()[0], by_length=False)):
+            return self._result(ranked)
+
+        grams = _trigrams(term)
+        candidates = self._candidates(grams)
+        if len(term) >= 3:
+            substring = sorted(
+                (index for index in candidates if term in self._search_text[index]),
+                key=lambda index: (len(self._tickers[index].symbol), self._tickers[index].symbol),
+            )
+            if take(substring):
+                return self._result(ranked)
+
+        # Share of the query's trigrams found in the entry, like pg_trgm's
+        # word_similarity, so long company names are not penalised.
+        scored = [
+            (-shared / len(grams), len(self._search_text[index]), index)
+            for index, shared in candidates.items()
+            if index not in seen and shared / len(grams) >= FUZZY_THRESHOLD
+        ]
+        scored.sort()
+        take(index for *_, index in scored)
+        return self._result(ranked)
+
+    def _prefixed(
+        self, entries: List[Tuple[str, int]], prefix: str, by_length: bool
+    ) -> List[int]:
+        """Entries starting with ``prefix``, shortest symbol (or name) first."""
+        start = bisect.bisect_left(entries, (prefix,))
+        matches = []
+        for key, index in entries[start:]:
+            if not key.startswith(prefix):
+                break
+            matches.append((len(key) if by_length else len(self._search_text[index]), key, index))
+            if len(matches) >= MAX_PREFIX_MATCHES:
+                break
+        matches.sort()
+        return [index for *_, index in matches]
+
+    def _candidates(self, grams: Set[str]) -> Counter:
+        counts: Counter = Counter()
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting and len(posting) <= MAX_POSTING:
+                counts.update(posting)
+        return counts
+
+    def _result(self, indices: List[int]) -> List[TickerOut]:
+        return [self._tickers[index] for index in indices]
@@ -1,80 +1,155 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
 
-import httpx
-from sqlalchemy import func
-from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import get_settings
-from ..db.models import Ticker
+from ..db.models import TickerSyncRun
 from ..schemas import TickerSyncResult
+from .finnhub import get_finnhub_client
 
 
 settings = get_settings()
-CHUNK_SIZE = 1000  # stay under Postgres' 65535-parameter limit comfortably
+
+STAGING_COLUMNS = ("symbol", "name", "exchange", "mic", "currency", "type", "is_active")
+
+# Dropped at commit; a session-scoped temp table never collides across workers.
+_CREATE_STAGING = text(
+    """
+    CREATE TEMP TABLE ticker_staging (
+        symbol varchar(32) PRIMARY KEY,
+        name varchar(256),
+        exchange varchar(32),
+        mic varchar(32),
+        currency varchar(16),
+        type varchar(64),
+        is_active boolean NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+
+
+def _row_hash(alias: str) -> str:
+    return (
+        f"md5(ROW({alias}.name, {alias}.exchange, {alias}.mic, "
+        f"{alias}.currency, {alias}.type, {alias}.is_active)::text)"
+    )
+
+
+_UPDATE_CHANGED = text(
+    f"""
+    UPDATE tickers AS t
+    SET name = s.name, exchange = s.exchange, mic = s.mic, currency = s.currency,
+        type = s.type, is_active = s.is_active, updated_at = now()
+    FROM ticker_staging AS s
+    WHERE t.symbol = s.symbol AND {_row_hash("t")} <> {_row_hash("s")}
+    """
+)
+_INSERT_NEW = text(
+    """
+    INSERT INTO tickers (symbol, name, exchange, mic, currency, type, is_active)
+    SELECT s.symbol, s.name, s.exchange, s.mic, s.currency, s.type, s.is_active
+    FROM ticker_staging AS s
+    WHERE NOT EXISTS (SELECT 1 FROM tickers AS t WHERE t.symbol = s.symbol)
+    """
+)
+# Symbols that disappeared from the listing are delisted, not deleted:
+# watchlists and reports still reference them.
+_DEACTIVATE_MISSING = text(
+    """
+    UPDATE tickers AS t
+    SET is_active = false, updated_at = now()
+    WHERE t.is_active
+      AND NOT EXISTS (SELECT 1 FROM ticker_staging AS s WHERE s.symbol = t.symbol)
+    """
+)
 
 
 async def sync_tickers_from_finnhub(session: AsyncSession) -> TickerSyncResult:
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.get(
-            str(settings.finnhub_symbol_url),
-            params={
-                "exchange": settings.finnhub_symbol_exchange,
-                "token": settings.finnhub_api_key,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
+    """Merge the Finnhub symbol list into ``tickers``, touching only real changes.
+
+    The payload is streamed with ``COPY`` into a temp staging table and merged
+    in three set-based statements: rows whose content hash differs are
+    updated, unknown symbols inserted and vanished symbols deactivated.
+    Unchanged rows are never rewritten, so a no-op sync writes one
+    ``ticker_sync_runs`` row and nothing else.
+    """
+    started = time.perf_counter()
+    data = await get_finnhub_client().get(
+        str(settings.finnhub_symbol_url),
+        {"exchange": settings.finnhub_symbol_exchange},
+        timeout=30,
+    )
 
     payload = _build_payload(data)
     if not payload:
         return TickerSyncResult(total=0, inserted_or_updated=0)
 
-    total_updated = 0
-    for chunk in _chunk_payload(payload, CHUNK_SIZE):
-        insert_stmt = insert(Ticker).values(list(chunk))
-        update_columns = {
-            "name": insert_stmt.excluded.name,
-            "exchange": insert_stmt.excluded.exchange,
-            "mic": insert_stmt.excluded.mic,
-            "currency": insert_stmt.excluded.currency,
-            "type": insert_stmt.excluded.type,
-            "is_active": insert_stmt.excluded.is_active,
-            "updated_at": func.now(),
-        }
-        upsert_stmt = insert_stmt.on_conflict_do_update(
-            index_elements=[Ticker.symbol], set_=update_columns
-        ).returning(Ticker.symbol)
-        result = await session.execute(upsert_stmt)
-        total_updated += len(result.scalars().all())
+    counts = await _merge_payload(session, payload)
+    counts["unchanged"] = len(payload) - counts["inserted"] - counts["updated"]
+    session.add(
+        TickerSyncRun(
+            exchange=settings.finnhub_symbol_exchange,
+            total=len(payload),
+            duration_ms=int((time.perf_counter() - started) * 1000),
+            **counts,
+        )
+    )
+    await session.commit()
+    return TickerSyncResult(
+        total=len(payload),
+        inserted_or_updated=counts["inserted"] + counts["updated"],
+        **counts,
+    )
+
+
+async def last_ticker_sync(session: AsyncSession) -> Optional[datetime]:
+    return await session.scalar(
+        select(func.max(TickerSyncRun.finished_at)).where(
+            TickerSyncRun.exchange == settings.finnhub_symbol_exchange
+        )
+    )
+
 
-    if total_updated:
-        await session.commit()
-    return TickerSyncResult(total=len(payload), inserted_or_updated=total_updated)
+async def _merge_payload(session: AsyncSession, payload: List[dict]) -> Dict[str, int]:
+    await session.execute(_CREATE_STAGING)
+    # COPY runs on the session's own asyncpg connection, inside its transaction.
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        "ticker_staging",
+        records=[tuple(row[column] for column in STAGING_COLUMNS) for row in payload],
+        columns=STAGING_COLUMNS,
+    )
+    await session.execute(text("ANALYZE ticker_staging"))
+    updated = await session.execute(_UPDATE_CHANGED)
+    inserted = await session.execute(_INSERT_NEW)
+    deactivated = await session.execute(_DEACTIVATE_MISSING)
+    return {
+        "inserted": inserted.rowcount,
+        "updated": updated.rowcount,
+        "deactivated": deactivated.rowcount,
+    }
 
 
 def _build_payload(data: List[dict]) -> List[dict]:
-    payload: List[dict] = []
+    # Keyed by symbol: the staging table's primary key rejects duplicates.
+    payload: Dict[str, dict] = {}
     for item in data:
         symbol = (item.get("symbol") or "").upper()
         if not symbol:
             continue
-        payload.append(
-            {
-                "symbol": symbol,
-                "name": item.get("description"),
-                "exchange": item.get("exchange"),
-                "mic": item.get("mic"),
-                "currency": item.get("currency"),
-                "type": item.get("type"),
-                "is_active": not item.get("delisted"),
-            }
-        )
-    return payload
-
-
-def _chunk_payload(values: List[dict], size: int) -> Iterable[List[dict]]:
-    for index in range(0, len(values), size):
-        yield values[index : index + size]
+        payload[symbol] = {
+            "symbol": symbol,
+            "name": item.get("description"),
+            "exchange": item.get("exchange"),
+            "mic": item.get("mic"),
+            "currency": item.get("currency"),
+            "type": item.get("type"),
+            "is_active": not item.get("delisted"),
+        }
+    return list(payload.values())
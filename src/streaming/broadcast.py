@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from abc import ABC, abstractmethod
+import json
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import get_settings
+from ..db.models import Article
+from ..db.session import asyncpg_dsn
+from ..schemas import ArticleOut
+from .dispatcher import ConnectionManager
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads are capped at 8000 bytes; larger batches are sent as ids
+# and re-read from the database by each listening worker.
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+
+class BroadcastBackend(ABC):
+    """Delivers new articles to every worker's local ConnectionManager."""
+
+    def __init__(self, connections: ConnectionManager) -> None:
+        self._connections = connections
+
+    async def start(self) -> None:
+        return None
+
+    async def stop(self) -> None:
+        return None
+
+    @abstractmethod
+    async def publish(self, symbol: str, articles: Sequence[ArticleOut]) -> None:
+        """Deliver ``articles`` to ``symbol`` subscribers on every worker."""
+
+    @abstractmethod
+    async def announce(self, symbol: str, message: Dict[str, Any]) -> None:
+        """Send a small JSON ``message`` to ``symbol`` subscribers on every worker."""
+
+
+class MemoryBroadcast(BroadcastBackend):
+    """Single-process backend: publishing is a direct local push."""
+
+    async def publish(self, symbol: str, articles: Sequence[ArticleOut]) -> None:
+        await self._connections.push(symbol, articles)
+
+    async def announce(self, symbol: str, message: Dict[str, Any]) -> None:
+        await self._connections.deliver(symbol, json.dumps(message))
+
+
+class PostgresBroadcast(BroadcastBackend):
+    """Fans out across workers and nodes with Postgres LISTEN/NOTIFY.
+
+    Every worker holds one listening connection; the publishing worker sees
+    its own notification too, so local delivery also goes through NOTIFY.
+    """
+
+    def __init__(
+        self,
+        connections: ConnectionManager,
+        session_factory: async_sessionmaker[AsyncSession],
+        channel: Optional[str] = None,
+        reconnect_seconds: float = 5.0,
+    ) -> None:
+        super().__init__(connections)
+        self._sessions = session_factory
+        self._channel = channel or settings.broadcast_channel
+        self._reconnect_seconds = reconnect_seconds
+        self._task: Optional[asyncio.Task[None]] = None
+        self._handlers: Set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        if self._task:
+            return
+        self._task = asyncio.create_task(self._listen_forever())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def publish(self, symbol: str, articles: Sequence[ArticleOut]) -> None:
+        if not articles:
+            return
+        payload = ConnectionManager.encode(symbol, articles)
+        if len(payload.encode()) > NOTIFY_PAYLOAD_LIMIT:
+            payload = json.dumps(
+                {"symbol": symbol, "article_ids": [article.id for article in articles]}
+            )
+        await self._notify(payload)
+
+    async def announce(self, symbol: str, message: Dict[str, Any]) -> None:
+        await self._notify(json.dumps({"symbol": symbol, "message": message}))
+
+    async def _notify(self, payload: str) -> None:
+        async with self._sessions() as session:
+            await session.execute(select(func.pg_notify(self._channel, payload)))
+            await session.commit()
+
+    async def _listen_forever(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(asyncpg_dsn())
+                await connection.add_listener(self._channel, self._on_notify)
+                logger.info("Listening for broadcasts on %s", self._channel)
+                while not connection.is_closed():
+                    await asyncio.sleep(self._reconnect_seconds)
+                    await connection.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Broadcast listener lost connection: %s", exc)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    with contextlib.suppress(Exception):
+                        await connection.close()
+            await asyncio.sleep(self._reconnect_seconds)
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        task = asyncio.create_task(self._handle(payload))
+        self._handlers.add(task)
+        task.add_done_callback(self._handlers.discard)
+
+    async def _handle(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+            symbol = message["symbol"]
+            if "articles" in message:
+                await self._connections.deliver(symbol, payload)
+                return
+            if "message" in message:
+                await self._connections.deliver(symbol, json.dumps(message["message"]))
+                return
+            articles = await self._load_articles(message.get("article_ids") or [])
+            await self._connections.push(symbol, articles)
+        except Exception as exc:
+            logger.warning("Dropping malformed broadcast: %s", exc)
+
+    async def _load_articles(self, article_ids: List[int]) -> List[ArticleOut]:
+        if not article_ids:
+            return []
+        async with self._sessions() as session:
+            # Only the delivered columns: every worker runs this per NOTIFY,
+            # and ``body`` can be many kilobytes per article.
+            result = await session.execute(
+                select(*(getattr(Article, name) for name in ArticleOut.model_fields))
+                .where(Article.id.in_(article_ids))
+                .order_by(Article.id)
+            )
+            return [ArticleOut.model_validate(row) for row in result.all()]
+
+
+def build_broadcast_backend(
+    connections: ConnectionManager,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> BroadcastBackend:
+    backend = settings.broadcast_backend.lower()
+    if backend == "memory":
+        return MemoryBroadcast(connections)
+    if backend == "postgres":
+        return PostgresBroadcast(connections, session_factory)
+    raise ValueError(f"Unknown broadcast backend: {settings.broadcast_backend}")
@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 from datetime import datetime, timezone
 import contextlib
-from typing import Iterable, List, Optional, Sequence, Set
+import json
+import logging
+from typing import FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from fastapi import WebSocket
 from fastapi.encoders import jsonable_encoder
@@ -14,22 +16,41 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from ..config import get_settings
 from ..db.models import Article, WatchedSymbol
 from ..schemas import ArticleOut
-from ..util import normalize_symbol
+from ..util import normalize_symbol, shard_for
 
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class _Subscriber:
+    """Per-connection send queue drained by its own task."""
+
+    __slots__ = ("websocket", "queue", "task")
+
+    def __init__(self, websocket: WebSocket, queue_size: int) -> None:
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task[None]] = None
 
 
 class ConnectionManager:
     """Tracks WebSocket subscribers per ticker symbol."""
 
-    def __init__(self) -> None:
+    def __init__(self, queue_size: Optional[int] = None) -> None:
         self._symbol_map: dict[str, Set[WebSocket]] = {}
         self._client_symbols: dict[WebSocket, Set[str]] = {}
+        self._subscribers: dict[WebSocket, _Subscriber] = {}
+        self._queue_size = queue_size or settings.ws_send_queue_size
+        self._background: Set[asyncio.Task[None]] = set()
         self._lock = asyncio.Lock()
 
     async def register(self, websocket: WebSocket) -> None:
         await websocket.accept()
+        subscriber = _Subscriber(websocket, self._queue_size)
+        subscriber.task = asyncio.create_task(self._drain(subscriber))
+        async with self._lock:
+            self._subscribers[websocket] = subscriber
 
     async def subscribe(self, websocket: WebSocket, symbols: Iterable[str]) -> None:
         normalized = {normalize_symbol(symbol) for symbol in symbols if symbol}
@@ -45,8 +66,11 @@ class ConnectionManager:
 
             self._client_symbols[websocket] = normalized
 
-    async def disconnect(self, websocket: WebSocket, *, close: bool = True) -> None:
+    async def disconnect(
+        self, websocket: WebSocket, *, close: bool = True, code: int = 1000
+    ) -> None:
         async with self._lock:
+            subscriber = self._subscribers.pop(websocket, None)
             symbols = self._client_symbols.pop(websocket, set())
             for symbol in symbols:
                 sockets = self._symbol_map.get(symbol)
@@ -54,24 +78,75 @@ class ConnectionManager:
                     sockets.discard(websocket)
                     if not sockets:
                         self._symbol_map.pop(symbol, None)
+        if (
+            subscriber
+            and subscriber.task
+            and subscriber.task is not asyncio.current_task()
+        ):
+            subscriber.task.cancel()
         if close:
             with contextlib.suppress(RuntimeError):
-                await websocket.close()
+                await websocket.close(code=code)
+
+    async def send(self, websocket: WebSocket, message: dict) -> None:
+        """Queue a message for a single connection behind any pending pushes."""
+        subscriber = self._subscribers.get(websocket)
+        if subscriber is None:
+            return
+        try:
+            subscriber.queue.put_nowait(json.dumps(jsonable_encoder(message)))
+        except asyncio.QueueFull:
+            self._evict(websocket)
 
     async def push(self, symbol: str, articles: Sequence[ArticleOut]) -> None:
         if not articles:
             return
-        message = {
-            "symbol": normalize_symbol(symbol),
-            "articles": jsonable_encoder([article for article in articles]),
-        }
+        await self.deliver(symbol, self.encode(symbol, articles))
+
+    async def deliver(self, symbol: str, message: str) -> None:
+        """Fan an already-encoded message out to every listener of ``symbol``."""
         async with self._lock:
-            listeners = list(self._symbol_map.get(normalize_symbol(symbol), set()))
-        for socket in listeners:
+            listeners = [
+                self._subscribers[socket]
+                for socket in self._symbol_map.get(normalize_symbol(symbol), ())
+                if socket in self._subscribers
+            ]
+        for subscriber in listeners:
+            try:
+                subscriber.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._evict(subscriber.websocket)
+
+    @staticmethod
+    def encode(symbol: str, articles: Sequence[ArticleOut]) -> str:
+        return json.dumps(
+            {
+                "symbol": normalize_symbol(symbol),
+                "articles": jsonable_encoder(list(articles)),
+            }
+        )
+
+    def _evict(self, websocket: WebSocket) -> None:
+        subscriber = self._subscribers.pop(websocket, None)
+        if subscriber is None:
+            return
+        if subscriber.task:
+            subscriber.task.cancel()
+        # Closing can itself stall on a slow peer, so it never runs inline with
+        # the fan-out loop. 1013 tells the client to reconnect later.
+        logger.info("Evicting slow WebSocket consumer")
+        task = asyncio.create_task(self.disconnect(websocket, code=1013))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _drain(self, subscriber: _Subscriber) -> None:
+        while True:
+            message = await subscriber.queue.get()
             try:
-                await socket.send_json(message)
-            except RuntimeError:
-                await self.disconnect(socket, close=False)
+                await subscriber.websocket.send_text(message)
+            except Exception:
+                await self.disconnect(subscriber.websocket, close=False)
+                return
 
 
 class NewsDispatcher:
@@ -81,13 +156,37 @@ class NewsDispatcher:
         self,
         session_factory: async_sessionmaker[AsyncSession],
         fetcher,
-        connection_manager: ConnectionManager,
-        body_fetcher,
+        broadcaster,
+        body_pipeline,
+        concurrency: Optional[int] = None,
+        enricher=None,
     ) -> None:
         self._sessions = session_factory
         self._fetcher = fetcher
-        self._connections = connection_manager
-        self._body_fetcher = body_fetcher
+        self._broadcaster = broadcaster
+        self._body_pipeline = body_pipeline
+        self._enricher = enricher
+        self._concurrency = concurrency or settings.dispatch_concurrency
+        self._shards: Optional[Tuple[FrozenSet[int], int]] = None
+
+    def assign_shard(self, shards: Optional[Iterable[int]], count: int = 1) -> None:
+        """Restrict scheduled polls to symbols hashing to one of ``shards`` of ``count``."""
+        held = frozenset(shards) if shards is not None else None
+        if held is None or count <= 1 or len(held) >= count:
+            self._shards = None
+        else:
+            self._shards = (held, count)
+
+    def owns(self, symbol: str) -> bool:
+        """Whether ``symbol`` falls in one of this process's shards."""
+        if not self._shards:
+            return True
+        held, count = self._shards
+        return shard_for(symbol, count) in held
+
+    async def list_symbols(self) -> List[str]:
+        """Watched symbols this process is responsible for polling."""
+        return [item.symbol for item in await self._load_watched(None)]
 
     async def broadcast_latest(
         self, symbols: Optional[Sequence[str]] = None
@@ -97,17 +196,47 @@ class NewsDispatcher:
             if symbols
             else None
         )
+        watched = await self._load_watched(normalized)
+
+        # Each symbol runs on its own short-lived session so a slow upstream call
+        # only holds back its own symbol; results are collected as they finish.
+        semaphore = asyncio.Semaphore(self._concurrency)
+        tasks = [
+            asyncio.create_task(self._process_symbol_isolated(semaphore, item))
+            for item in watched
+        ]
+        collected: List[ArticleOut] = []
+        try:
+            for finished in asyncio.as_completed(tasks):
+                collected.extend(await finished)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return collected
+
+    async def _load_watched(
+        self, normalized: Optional[Set[str]]
+    ) -> Sequence[WatchedSymbol]:
         async with self._sessions() as session:
             query = select(WatchedSymbol)
             if normalized:
                 query = query.where(WatchedSymbol.symbol.in_(normalized))
             result = await session.execute(query)
-            symbols = result.scalars().all()
-            collected: List[ArticleOut] = []
-            for symbol in symbols:
-                payloads = await self._process_symbol(session, symbol)
-                collected.extend(payloads)
-            return collected
+            watched = result.scalars().all()
+        if self._shards and not normalized:
+            watched = [item for item in watched if self.owns(item.symbol)]
+        return watched
+
+    async def _process_symbol_isolated(
+        self, semaphore: asyncio.Semaphore, watched: WatchedSymbol
+    ) -> List[ArticleOut]:
+        async with semaphore:
+            try:
+                async with self._sessions() as session:
+                    return await self._process_symbol(session, watched)
+            except Exception as exc:
+                logger.warning("Polling %s failed: %s", watched.symbol, exc)
+                return []
 
     async def _process_symbol(
         self, session: AsyncSession, watched: WatchedSymbol
@@ -174,24 +303,11 @@ class NewsDispatcher:
                 )
                 for row in inserted
             ]
-            await self._connections.push(watched.symbol, payloads)
-            await self._populate_article_bodies(session, payloads)
+            await self._broadcaster.publish(watched.symbol, payloads)
+            if self._body_pipeline:
+                self._body_pipeline.submit(payloads)
+            if self._enricher:
+                self._enricher.notify()
             return payloads
 
         return []
-
-    async def _populate_article_bodies(
-        self, session: AsyncSession, payloads: List[ArticleOut]
-    ) -> None:
-        if not self._body_fetcher:
-            return
-        updated = False
-        for item in payloads:
-            body = await self._body_fetcher.fetch(item.url)
-            if body:
-                await session.execute(
-                    update(Article).where(Article.id == item.id).values(body=body)
-                )
-                updated = True
-        if updated:
-            await session.commit()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import get_settings
+from ..db.models import WatchedSymbol
+from .broadcast import BroadcastBackend
+
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class LastTrade:
+    price: float
+    volume: float  # accumulated since this process subscribed
+    timestamp: float  # epoch seconds of the latest trade
+
+
+class PriceTable:
+    """Compact in-memory last-price/volume table fed by the trade stream."""
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, LastTrade] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def update(self, symbol: str, price: float, volume: float, timestamp_ms: float) -> None:
+        row = self._rows.get(symbol)
+        timestamp = timestamp_ms / 1000
+        if row is None:
+            self._rows[symbol] = LastTrade(price, volume, timestamp)
+            return
+        row.volume += volume
+        # Trades can arrive slightly out of order inside a batch.
+        if timestamp >= row.timestamp:
+            row.price = price
+            row.timestamp = timestamp
+
+    def get(self, symbol: str, max_age: Optional[float] = None) -> Optional[LastTrade]:
+        row = self._rows.get(symbol)
+        if row is None:
+            return None
+        if max_age is not None and time.time() - row.timestamp > max_age:
+            return None
+        return row
+
+
+class TradeStreamIngestor:
+    """Keeps one upstream trade subscription covering every watched symbol.
+
+    Trades update the shared ``PriceTable``; symbols that traded are announced
+    through the broadcast backend to ``/ws/news`` subscribers on every worker
+    as ``{"type": "price", ...}`` ticks at most once per ``tick_interval``.
+    Finnhub limits connections per key, so only one process should run this:
+    ``PollerElection`` starts it alongside poller shard 0.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        table: PriceTable,
+        notifier: BroadcastBackend,
+        *,
+        url: Optional[str] = None,
+        tick_interval: Optional[float] = None,
+        reconnect_seconds: float = 5.0,
+    ) -> None:
+        self._sessions = session_factory
+        self._table = table
+        self._notifier = notifier
+        self._url = url or self._default_url()
+        self._tick_interval = tick_interval or settings.trade_tick_interval_seconds
+        self._reconnect_seconds = reconnect_seconds
+        self._subscribed: Set[str] = set()
+        self._dirty: Set[str] = set()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._task:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self._task:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        from websockets.asyncio.client import connect
+
+        while True:
+            try:
+                async with connect(self._url) as upstream:
+                    self._subscribed = set()
+                    await self._sync_subscriptions(upstream)
+                    workers = [
+                        asyncio.create_task(self._read(upstream)),
+                        asyncio.create_task(self._refresh_subscriptions(upstream)),
+                        asyncio.create_task(self._flush_ticks()),
+                    ]
+                    try:
+                        done, _ = await asyncio.wait(
+                            workers, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for task in done:
+                            task.result()
+                    finally:
+                        for task in workers:
+                            task.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("Trade stream disconnected: %s", exc)
+            await asyncio.sleep(self._reconnect_seconds)
+
+    async def _read(self, upstream) -> None:
+        async for raw in upstream:
+            message = json.loads(raw)
+            if message.get("type") != "trade":
+                continue
+            for trade in message.get("data") or []:
+                symbol = trade.get("s")
+                if not symbol or trade.get("p") is None:
+                    continue
+                self._table.update(
+                    symbol, float(trade["p"]), float(trade.get("v") or 0), trade.get("t") or 0
+                )
+                self._dirty.add(symbol)
+
+    async def _refresh_subscriptions(self, upstream) -> None:
+        while True:
+            await asyncio.sleep(settings.watchlist_refresh_seconds)
+            await self._sync_subscriptions(upstream)
+
+    async def _sync_subscriptions(self, upstream) -> None:
+        async with self._sessions() as session:
+            result = await session.execute(select(WatchedSymbol.symbol))
+            wanted = set(result.scalars().all())
+        for symbol in sorted(wanted - self._subscribed):
+            await upstream.send(json.dumps({"type": "subscribe", "symbol": symbol}))
+        for symbol in sorted(self._subscribed - wanted):
+            await upstream.send(json.dumps({"type": "unsubscribe", "symbol": symbol}))
+        self._subscribed = wanted
+
+    async def _flush_ticks(self) -> None:
+        while True:
+            await asyncio.sleep(self._tick_interval)
+            dirty, self._dirty = self._dirty, set()
+            for symbol in dirty:
+                row = self._table.get(symbol)
+                if row is None:
+                    continue
+                await self._notifier.announce(
+                    symbol,
+                    {
+                        "type": "price",
+                        "symbol": symbol,
+                        "price": row.price,
+                        "volume": row.volume,
+                        "timestamp": row.timestamp,
+                    },
+                )
+
+    @staticmethod
+    def _default_url() -> str:
+        return f"{settings.finnhub_ws_url}?token={settings.finnhub_api_key or ''}"
@@ -0,0 +1,38 @@
+import contextlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def session_factory():
+    """Build a fake ``async_sessionmaker`` around one shared ``AsyncMock`` session.
+
+    ``session_factory(scalars=..., rows=..., scalar=...)`` returns ``(factory, session)``;
+    every ``execute`` answers ``result.scalars().all()``, ``result.all()`` and
+    ``result.scalar_one_or_none()`` with those values, and ``factory.open`` counts
+    sessions currently in use.
+    """
+
+    def build(*, scalars=(), rows=(), scalar=None):
+        session = AsyncMock()
+        session.add = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(scalars)
+        result.all.return_value = list(rows)
+        result.scalar_one_or_none.return_value = scalar
+        session.execute.return_value = result
+
+        @contextlib.asynccontextmanager
+        async def open_session():
+            factory.open += 1
+            try:
+                yield session
+            finally:
+                factory.open -= 1
+
+        factory = MagicMock(side_effect=open_session)
+        factory.open = 0
+        return factory, session
+
+    return build
@@ -1,7 +1,12 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from datetime import datetime
+from datetime import datetime, timezone
 
+from src.db.models import Report
+from src.services.llm_cache import CachedLLMService
+from src.services.llm_service import LLMServiceError
+from src.services.price_service import PriceSnapshot
 from src.services.reports import AISummaryService
 from src.schemas import ReportType
 
@@ -24,6 +29,7 @@ async def test_generate_report_smart_briefing():
     
     # Mock internal methods
     service._ensure_symbol_is_watched = AsyncMock()
+    service._latest_report = AsyncMock(return_value=None)
     service._fetch_recent_articles = AsyncMock()
     service._fetch_recent_articles.return_value = [
         MagicMock(id=1, headline="Test Article", summary="Summary", published_at=datetime.now(), source="Test", url="http://test.com")
@@ -43,3 +49,117 @@ async def test_generate_report_smart_briefing():
     assert report.type == ReportType.SMART_BRIEFING
     assert "summary" in report.content
     assert "sentiment_score" in report.content
+
+
+@pytest.mark.asyncio
+async def test_generate_report_reuses_latest_when_nothing_changed():
+    mock_session_factory = MagicMock()
+    mock_session_factory.return_value.__aenter__.return_value = AsyncMock()
+    mock_llm = AsyncMock()
+    mock_price_service = AsyncMock()
+    mock_price_service.fetch_quote.return_value = MagicMock(current=100.4)
+
+    service = AISummaryService(mock_session_factory, mock_llm, mock_price_service)
+    service._ensure_symbol_is_watched = AsyncMock()
+    service._fetch_recent_articles = AsyncMock(return_value=[MagicMock(id=2), MagicMock(id=1)])
+    latest = Report(
+        id=7,
+        symbol="AAPL",
+        type=ReportType.SMART_BRIEFING.value,
+        content="{}",
+        article_ids=[1, 2],
+        reference_price=100.0,
+        created_at=datetime.now(timezone.utc),
+    )
+    service._latest_report = AsyncMock(return_value=latest)
+
+    report = await service.generate_report("AAPL")
+
+    assert report.id == 7
+    mock_llm.complete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_articles_by_symbol_use_one_windowed_query_in_watchlist_order(session_factory):
+    from sqlalchemy.dialects import postgresql
+
+    factory, session = session_factory(
+        scalars=[
+            MagicMock(id=1, symbol="AAPL"),
+            MagicMock(id=2, symbol="MSFT"),
+            MagicMock(id=3, symbol="MSFT"),
+        ]
+    )
+    service = AISummaryService(factory, AsyncMock(), AsyncMock())
+
+    grouped = await service._fetch_recent_articles_by_symbol(session, ["MSFT", "NVDA", "AAPL"], 5)
+
+    assert list(grouped) == ["MSFT", "AAPL"]
+    assert [article.id for article in grouped["MSFT"]] == [2, 3]
+    compiled = session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+    sql = " ".join(str(compiled).split())
+    assert "row_number() OVER (PARTITION BY articles.symbol ORDER BY" in sql
+    assert "anon_1.rank <= %(rank_1)s" in sql
+    assert compiled.params["rank_1"] == 5
+
+
+@pytest.mark.asyncio
+async def test_aggregate_report_falls_back_to_placeholder_quotes(session_factory):
+    factory, session = session_factory(scalars=["MSFT", "AAPL"])
+
+    async def refresh(row):
+        row.id = 9
+        row.created_at = datetime.now(timezone.utc)
+
+    session.refresh.side_effect = refresh
+    prices = AsyncMock()
+    prices.fetch_quote.side_effect = RuntimeError("quote API down")
+    llm = AsyncMock()
+    llm.complete.return_value = '{"overall_sentiment": 60}'
+    digests = MagicMock()
+    digests.digests_for = AsyncMock(
+        side_effect=lambda session, articles, quotes: {
+            symbol: MagicMock(sentiment="neutral", one_liner=symbol, themes=[])
+            for symbol in articles
+        }
+    )
+    service = AISummaryService(factory, llm, prices, digest_service=digests)
+    service._fetch_recent_articles_by_symbol = AsyncMock(
+        return_value={"MSFT": [MagicMock(id=2)], "AAPL": [MagicMock(id=1)]}
+    )
+
+    report = await service.generate_aggregate_report()
+
+    quotes = digests.digests_for.await_args.args[2]
+    assert all(quote.current is None for quote in quotes.values())
+    assert prices.fetch_quote.await_count == 4
+    assert list(json.loads(report.content)["individual_insights"]) == ["MSFT", "AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_fallback_report_is_not_reusable_and_force_bypasses_llm_cache(session_factory):
+    factory, session = session_factory()
+
+    async def refresh(row):
+        row.id = 3
+        row.created_at = datetime.now(timezone.utc)
+
+    session.refresh.side_effect = refresh
+    llm = CachedLLMService(MagicMock(), session_factory()[0], model="gpt")
+    llm.complete = AsyncMock(side_effect=LLMServiceError("provider down"))
+    prices = AsyncMock()
+    prices.fetch_quote.return_value = PriceSnapshot(
+        symbol="AAPL", current=100.0, open_price=99.0, previous_close=98.0, percent_change=2.0
+    )
+    service = AISummaryService(factory, llm, prices)
+    service._ensure_symbol_is_watched = AsyncMock()
+    service._fetch_recent_articles = AsyncMock(return_value=[MagicMock(id=1, headline="h")])
+    service._context_builder = MagicMock()
+    service._context_builder.build.return_value = MagicMock(articles=[], text="")
+
+    await service.generate_report("AAPL", force=True)
+
+    row = session.add.call_args.args[0]
+    assert row.article_ids is None
+    assert not AISummaryService._can_reuse(row, [1], prices.fetch_quote.return_value)
+    assert llm.complete.await_args.kwargs["refresh"] is True
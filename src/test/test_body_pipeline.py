@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.news.body_pipeline import ArticleBodyPipeline
+
+
+@pytest.mark.asyncio
+async def test_pipeline_writes_bodies_in_batches(session_factory):
+    factory, session = session_factory()
+    fetcher = AsyncMock()
+    fetcher.fetch.side_effect = lambda url: None if "broken" in url else f"body of {url}"
+    pipeline = ArticleBodyPipeline(
+        factory, fetcher, workers=2, queue_size=10, batch_size=2, flush_interval=60
+    )
+    articles = [
+        MagicMock(id=1, url="https://a.test/1"),
+        MagicMock(id=2, url="https://a.test/broken"),
+        MagicMock(id=3, url="https://a.test/3"),
+    ]
+
+    await pipeline.start()
+    assert pipeline.submit(articles) == 3
+    await asyncio.wait_for(pipeline._queue.join(), timeout=1)
+    await pipeline.stop()
+
+    rows = session.execute.await_args.args[1]
+    assert sorted(row["id"] for row in rows) == [1, 3]
+    stats = pipeline.stats()
+    assert stats["succeeded"] == 2
+    assert stats["failed"] == 1
+    assert stats["written"] == 2
+    assert stats["queue_depth"] == 0
+
+
+def test_submit_drops_when_queue_is_full(session_factory):
+    factory, _ = session_factory()
+    pipeline = ArticleBodyPipeline(factory, AsyncMock(), queue_size=1)
+    articles = [MagicMock(id=1, url="https://a.test/1"), MagicMock(id=2, url="https://a.test/2")]
+
+    assert pipeline.submit(articles) == 1
+    assert pipeline.stats()["dropped"] == 1
+
+
+def test_articles_without_url_are_skipped_without_a_drop_warning(caplog, session_factory):
+    factory, _ = session_factory()
+    pipeline = ArticleBodyPipeline(factory, AsyncMock(), queue_size=5)
+    articles = [MagicMock(id=1, url=None), MagicMock(id=2, url="https://a.test/2")]
+
+    with caplog.at_level("WARNING", logger="src.news.body_pipeline"):
+        assert pipeline.submit(articles) == 1
+
+    assert pipeline.stats()["dropped"] == 0
+    assert "dropped" not in caplog.text
@@ -0,0 +1,52 @@
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.briefings import BriefingScheduler, next_run_at
+from src.services.limits import Priority
+from src.services.llm_gateway import llm_priority
+
+
+SEOUL = ZoneInfo("Asia/Seoul")
+
+
+def test_next_run_skips_weekends_and_applies_lead():
+    friday_night = datetime(2026, 3, 6, 23, 0, tzinfo=SEOUL)
+
+    run = next_run_at(friday_night, [time(22, 30)], timedelta(minutes=15))
+
+    assert run == datetime(2026, 3, 9, 22, 15, tzinfo=SEOUL)
+
+
+def test_next_run_same_day_when_still_ahead():
+    monday = datetime(2026, 3, 9, 9, 0, tzinfo=SEOUL)
+
+    run = next_run_at(monday, [time(8, 0), time(22, 30)], timedelta(minutes=15))
+
+    assert run == datetime(2026, 3, 9, 22, 15, tzinfo=SEOUL)
+
+
+@pytest.mark.asyncio
+async def test_run_once_generates_symbols_then_watchlist_at_background_priority():
+    priorities = []
+    service = MagicMock()
+
+    async def generate_report(symbol):
+        priorities.append(llm_priority.get())
+
+    service.generate_report = AsyncMock(side_effect=generate_report)
+    service.generate_aggregate_report = AsyncMock()
+    dispatcher = MagicMock()
+    dispatcher.list_symbols = AsyncMock(return_value=["AAPL", "MSFT", "WATCHLIST"])
+    dispatcher.owns.return_value = True
+    scheduler = BriefingScheduler(service, dispatcher, SEOUL, times=["22:30"])
+
+    generated = await scheduler.run_once()
+
+    assert generated == 3
+    assert [call.args[0] for call in service.generate_report.await_args_list] == ["AAPL", "MSFT"]
+    assert priorities == [Priority.BACKGROUND, Priority.BACKGROUND]
+    service.generate_aggregate_report.assert_awaited_once()
+    assert llm_priority.get() == Priority.INTERACTIVE
@@ -0,0 +1,147 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.schemas import ArticleOut
+from src.streaming import broadcast
+from src.streaming.broadcast import (
+    NOTIFY_PAYLOAD_LIMIT,
+    BroadcastBackend,
+    MemoryBroadcast,
+    PostgresBroadcast,
+)
+
+
+class FakePostgres:
+    """One LISTEN connection and a session factory whose NOTIFYs reach it."""
+
+    def __init__(self, stored_articles=()):
+        self.listeners = {}
+        self.notifications = []
+        self.selects = []
+        self.stored_articles = list(stored_articles)
+        self.listening = asyncio.Event()
+        self.connection = MagicMock()
+        self.connection.is_closed.return_value = False
+        self.connection.execute = AsyncMock()
+        self.connection.close = AsyncMock()
+        self.connection.add_listener = AsyncMock(side_effect=self._add_listener)
+        session = AsyncMock()
+        session.execute.side_effect = self._execute
+        self.sessions = MagicMock()
+        self.sessions.return_value.__aenter__.return_value = session
+
+    async def connect(self, dsn):
+        return self.connection
+
+    async def _add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+        self.listening.set()
+
+    async def _execute(self, statement):
+        compiled = statement.compile(dialect=postgresql.dialect())
+        result = MagicMock()
+        if "pg_notify" in str(compiled):
+            channel, payload = compiled.params.values()
+            self.notifications.append(payload)
+            self.listeners[channel](self.connection, 1234, channel, payload)
+        else:
+            self.selects.append(str(compiled))
+            result.all.return_value = self.stored_articles
+        return result
+
+
+def _article(article_id, headline="Apple beats estimates"):
+    return ArticleOut(
+        id=article_id,
+        symbol="AAPL",
+        headline=headline,
+        url=f"https://example.com/{article_id}",
+        summary=None,
+        source="Reuters",
+        published_at=datetime(2026, 3, 2, tzinfo=timezone.utc),
+    )
+
+
+async def _started(monkeypatch, fake):
+    connections = MagicMock()
+    connections.deliver = AsyncMock()
+    connections.push = AsyncMock()
+    monkeypatch.setattr(broadcast.asyncpg, "connect", fake.connect)
+    monkeypatch.setattr(broadcast, "asyncpg_dsn", lambda: "postgresql://test")
+    backend = PostgresBroadcast(connections, fake.sessions, channel="news", reconnect_seconds=60)
+    await backend.start()
+    await asyncio.wait_for(fake.listening.wait(), 1)
+    return backend, connections
+
+
+async def _drain(backend):
+    await asyncio.gather(*list(backend._handlers))
+
+
+def test_backend_is_abstract():
+    with pytest.raises(TypeError):
+        BroadcastBackend(MagicMock())
+    assert isinstance(MemoryBroadcast(MagicMock()), BroadcastBackend)
+
+
+@pytest.mark.asyncio
+async def test_notify_round_trip_delivers_encoded_articles(monkeypatch):
+    fake = FakePostgres()
+    backend, connections = await _started(monkeypatch, fake)
+
+    await backend.publish("aapl", [_article(1)])
+    await _drain(backend)
+    await backend.stop()
+
+    (payload,) = fake.notifications
+    assert json.loads(payload)["articles"][0]["id"] == 1
+    connections.deliver.assert_awaited_once_with("AAPL", payload)
+    fake.connection.close.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_oversized_batch_is_sent_as_ids_and_refetched(monkeypatch):
+    stored = [
+        SimpleNamespace(**_article(article_id).model_dump())
+        for article_id in (1, 2)
+    ]
+    fake = FakePostgres(stored_articles=stored)
+    backend, connections = await _started(monkeypatch, fake)
+    articles = [_article(article_id, headline="x" * 5000) for article_id in (1, 2)]
+
+    await backend.publish("AAPL", articles)
+    await _drain(backend)
+    await backend.stop()
+
+    (payload,) = fake.notifications
+    assert len(payload.encode()) < NOTIFY_PAYLOAD_LIMIT
+    assert json.loads(payload) == {"symbol": "AAPL", "article_ids": [1, 2]}
+    connections.deliver.assert_not_awaited()
+    symbol, delivered = connections.push.await_args.args
+    assert symbol == "AAPL"
+    assert [article.id for article in delivered] == [1, 2]
+    (query,) = fake.selects
+    assert "articles.headline" in query and "articles.body" not in query
+
+
+@pytest.mark.asyncio
+async def test_announce_reaches_subscribers_through_notify(monkeypatch):
+    fake = FakePostgres()
+    backend, connections = await _started(monkeypatch, fake)
+    message = {"type": "report_job", "job_id": "abc", "status": "succeeded"}
+
+    await backend.announce("AAPL", message)
+    await _drain(backend)
+    await backend.stop()
+
+    assert len(fake.notifications) == 1
+    symbol, delivered = connections.deliver.await_args.args
+    assert symbol == "AAPL"
+    assert json.loads(delivered) == message
+    connections.push.assert_not_awaited()
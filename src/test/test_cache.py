@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from src.services.cache import SingleFlightCache
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load():
+    cache = SingleFlightCache(ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    results = await asyncio.gather(*(cache.get("AAPL", loader) for _ in range(10)))
+
+    assert results == [1] * 10
+    assert calls == 1
+    assert cache.stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_revalidating():
+    cache = SingleFlightCache(ttl=0, stale_ttl=60)
+    cache.put("AAPL", "old")
+    refreshed = asyncio.Event()
+
+    async def loader():
+        refreshed.set()
+        return "new"
+
+    assert await cache.get("AAPL", loader) == "old"
+    await asyncio.wait_for(refreshed.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert cache.peek("AAPL") == "new"
+
+
+def test_lru_eviction_keeps_size_bounded():
+    cache = SingleFlightCache(ttl=60, max_entries=2)
+    cache.put("A", 1)
+    cache.put("B", 2)
+    cache.put("C", 3)
+
+    assert cache.peek("A") is None
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_begin_and_finish_share_a_load_without_a_loader():
+    cache = SingleFlightCache(ttl=60)
+    assert cache.lookup("AAPL") is None
+
+    future, leader = cache.begin("AAPL")
+    joined, follower_leads = cache.begin("AAPL")
+    cache.finish("AAPL", future, "quote")
+
+    assert leader and not follower_leads and joined is future
+    assert await joined == "quote"
+    assert cache.lookup("AAPL") == "quote"
+    assert cache.stats() == {
+        "entries": 1,
+        "hits": 1,
+        "stale_hits": 0,
+        "misses": 1,
+        "coalesced": 1,
+        "inflight": 0,
+    }
+
+    failed, _ = cache.begin("MSFT")
+    cache.finish("MSFT", failed, error=RuntimeError("down"))
+    assert cache.peek("MSFT") is None
+    with pytest.raises(RuntimeError):
+        await failed
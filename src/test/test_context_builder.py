@@ -0,0 +1,83 @@
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from src.services import context_builder
+from src.services.context_builder import ArticleContextBuilder, count_tokens, preload_encoder
+
+
+NOW = datetime(2026, 3, 2, 15, 0, tzinfo=timezone.utc)
+
+
+def _article(article_id, headline, summary, source="Reuters", hours_ago=1):
+    return SimpleNamespace(
+        id=article_id,
+        headline=headline,
+        summary=summary,
+        source=source,
+        published_at=NOW - timedelta(hours=hours_ago),
+        digest=None,
+        sentiment=None,
+    )
+
+
+def _builder(**kwargs):
+    kwargs.setdefault("budget_tokens", 2000)
+    kwargs.setdefault("summary_max_tokens", 60)
+    kwargs.setdefault("duplicate_similarity", 0.8)
+    return ArticleContextBuilder(model="test-model", **kwargs)
+
+
+def test_syndicated_copies_are_dropped():
+    summary = "Apple reported record quarterly revenue driven by strong iPhone sales in China."
+    articles = [
+        _article(1, "Apple posts record revenue", summary, source="Reuters"),
+        _article(2, "Apple posts record revenue", summary + " (Syndicated)", source="Zacks"),
+        _article(3, "Fed holds rates steady", "The Federal Reserve left rates unchanged."),
+    ]
+
+    context = _builder().build(articles, now=NOW)
+
+    assert [article.id for article in context.articles] == [1, 3]
+    assert context.dropped_duplicates == 1
+
+
+def test_context_respects_budget_and_prefers_recent_trusted_sources():
+    articles = [
+        _article(i, f"Headline number {i} about earnings",
+                 " ".join(f"Sentence {i}-{n} covers guidance for segment {n * i}." for n in range(40)),
+                 source="Benzinga" if i % 2 else "Bloomberg", hours_ago=i)
+        for i in range(1, 30)
+    ]
+    builder = _builder(budget_tokens=400)
+
+    context = builder.build(articles, now=NOW)
+
+    assert context.tokens <= 400
+    assert count_tokens(context.text, "test-model") <= 400
+    assert context.articles[0].id == 2
+    assert context.dropped_duplicates == 0
+    assert 1 < len(context.articles) < len(articles)
+
+
+@pytest.mark.asyncio
+async def test_encoder_loads_off_the_event_loop_and_estimates_when_offline(monkeypatch):
+    threads = []
+
+    def offline(name):
+        threads.append(threading.current_thread())
+        raise ConnectionError("no network")
+
+    fake = SimpleNamespace(encoding_for_model=offline, get_encoding=offline)
+    monkeypatch.setitem(sys.modules, "tiktoken", fake)
+    context_builder._encoder.cache_clear()
+    try:
+        assert await preload_encoder("offline-model") is False
+        assert threads and threads[0] is not threading.main_thread()
+        assert count_tokens("abcdefgh", "offline-model") == 2
+        assert len(threads) == 1
+    finally:
+        context_builder._encoder.cache_clear()
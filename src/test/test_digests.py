@@ -0,0 +1,67 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.digests import SymbolDigestService
+from src.services.price_service import PriceSnapshot
+
+
+def _article(article_id, symbol):
+    return SimpleNamespace(
+        id=article_id,
+        symbol=symbol,
+        headline=f"{symbol} headline {article_id}",
+        summary="summary",
+        source="Reuters",
+        published_at=None,
+        digest=None,
+        sentiment=None,
+    )
+
+
+def _price(symbol):
+    return PriceSnapshot(
+        symbol=symbol, current=10.0, open_price=10.0, previous_close=10.0, percent_change=0.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_symbols_with_new_articles_are_redigested():
+    stored = [
+        SimpleNamespace(
+            symbol=symbol, article_ids=[i], sentiment=60, one_liner=f"{symbol} stored", themes=[]
+        )
+        for i, symbol in enumerate(["AAPL", "MSFT", "NVDA"], start=1)
+    ]
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = stored
+    session.execute.return_value = result
+    llm = AsyncMock()
+    llm.complete.return_value = json.dumps(
+        {"sentiment": 80, "one_liner": "NVDA fresh", "themes": ["AI"]}
+    )
+    articles = {
+        "AAPL": [_article(1, "AAPL")],
+        "MSFT": [_article(2, "MSFT")],
+        "NVDA": [_article(3, "NVDA"), _article(9, "NVDA")],
+    }
+
+    digests = await SymbolDigestService(llm).digests_for(
+        session, articles, {symbol: _price(symbol) for symbol in articles}
+    )
+
+    assert llm.complete.await_count == 1
+    assert "NVDA" in llm.complete.await_args.kwargs["user_prompt"]
+    # Models copy the JSON example; comments in it would break json.loads.
+    prompt = llm.complete.await_args.kwargs["user_prompt"]
+    example = prompt[prompt.rindex("{", 0, prompt.index('"sentiment"')) : prompt.rindex("}") + 1]
+    assert "//" not in prompt
+    assert json.loads(example)["sentiment"] == 50
+    assert digests["AAPL"].one_liner == "AAPL stored"
+    assert digests["NVDA"].one_liner == "NVDA fresh"
+    assert digests["NVDA"].article_ids == [3, 9]
+    # One load plus one upsert for the regenerated digest.
+    assert session.execute.await_count == 2
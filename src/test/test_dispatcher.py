@@ -0,0 +1,87 @@
+import asyncio
+import json
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.schemas import ArticleOut
+from src.streaming.dispatcher import ConnectionManager, NewsDispatcher
+
+
+@pytest.mark.asyncio
+async def test_broadcast_latest_respects_concurrency_and_completion_order(session_factory):
+    watched = [MagicMock(symbol=symbol) for symbol in ("SLOW", "FAST", "MID")]
+    delays = {"SLOW": 0.05, "FAST": 0.0, "MID": 0.02}
+    in_flight = 0
+    peak = 0
+
+    dispatcher = NewsDispatcher(
+        session_factory(scalars=watched)[0], None, MagicMock(), None, concurrency=2
+    )
+
+    async def fake_process(session, item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(delays[item.symbol])
+        in_flight -= 1
+        return [item.symbol]
+
+    dispatcher._process_symbol = fake_process
+
+    collected = await dispatcher.broadcast_latest()
+
+    assert peak == 2
+    assert collected == ["FAST", "MID", "SLOW"]
+
+
+@pytest.mark.asyncio
+async def test_broadcast_latest_isolates_symbol_failures(session_factory):
+    watched = [MagicMock(symbol="OK"), MagicMock(symbol="BAD")]
+    dispatcher = NewsDispatcher(session_factory(scalars=watched)[0], None, MagicMock(), None)
+
+    async def fake_process(session, item):
+        if item.symbol == "BAD":
+            raise RuntimeError("upstream down")
+        return [item.symbol]
+
+    dispatcher._process_symbol = fake_process
+
+    assert await dispatcher.broadcast_latest() == ["OK"]
+
+
+class _FakeSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sent = []
+        self.closed_with = None
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        await asyncio.sleep(self.delay)
+        self.sent.append(message)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+@pytest.mark.asyncio
+async def test_push_fans_out_and_evicts_slow_consumers():
+    manager = ConnectionManager(queue_size=1)
+    fast, slow = _FakeSocket(), _FakeSocket(delay=10)
+    for socket in (fast, slow):
+        await manager.register(socket)
+        await manager.subscribe(socket, ["aapl"])
+    article = ArticleOut(id=1, symbol="AAPL", headline="Hi", url="https://a.test/1")
+
+    for _ in range(3):
+        await manager.push("AAPL", [article])
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.01)
+
+    assert len(fast.sent) == 3
+    assert json.loads(fast.sent[0])["articles"][0]["id"] == 1
+    assert slow.closed_with == 1013
+    assert slow not in manager._subscribers
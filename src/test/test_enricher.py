@@ -0,0 +1,81 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from src.news.enricher import ArticleEnricher
+from src.services.limits import Priority
+from src.services.llm_gateway import llm_priority
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _row(article_id, body=None, summary="raw summary"):
+    return SimpleNamespace(id=article_id, headline=f"headline {article_id}", summary=summary, body=body)
+
+
+@pytest.mark.asyncio
+async def test_batch_is_summarised_in_one_call_and_written_back(session_factory):
+    rows = [_row(1, body="x" * 5000), _row(2), _row(3)]
+    factory, session = session_factory(rows=rows)
+    priorities = []
+    llm = MagicMock()
+
+    async def complete(**kwargs):
+        priorities.append(llm_priority.get())
+        # The lease is committed first: no session, transaction or row lock
+        # is held while the model runs.
+        assert factory.open == 0
+        return json.dumps(
+            {
+                "articles": [
+                    {"id": 1, "summary": "실적 호조", "sentiment": 80},
+                    {"id": 2, "summary": "규제 우려", "sentiment": 130},
+                ]
+            },
+            ensure_ascii=False,
+        )
+
+    llm.complete = AsyncMock(side_effect=complete)
+    enricher = ArticleEnricher(factory, llm, batch_size=20, settle_seconds=0, body_chars=500)
+
+    claimed = await enricher.enrich_next_batch()
+
+    assert claimed == 3
+    claim_sql = _sql(session.execute.await_args_list[0].args[0])
+    assert "SET enriching_at=" in claim_sql and "FOR UPDATE SKIP LOCKED" in claim_sql
+    # Only the report lookback window is enriched, not the historical backlog.
+    assert "articles.created_at >= " in claim_sql
+    assert llm.complete.await_count == 1
+    assert priorities == [Priority.BACKGROUND]
+    assert "x" * 501 not in llm.complete.await_args.kwargs["user_prompt"]
+    # Comments in the JSON example get copied by the model and break json.loads.
+    assert "//" not in llm.complete.await_args.kwargs["user_prompt"]
+    updates = session.execute.await_args_list[-1].args[1]
+    by_id = {row["id"]: row for row in updates}
+    assert by_id[1]["digest"] == "실적 호조"
+    assert by_id[2]["sentiment"] == 100
+    assert by_id[3]["digest"] is None and by_id[3]["enriched_at"] is not None
+    assert by_id[1]["enriching_at"] is None
+    assert session.commit.await_count == 2
+    assert enricher.stats()["enriched"] == 2
+
+
+@pytest.mark.asyncio
+async def test_unparseable_response_leaves_rows_for_retry(session_factory):
+    factory, session = session_factory(rows=[_row(1)])
+    llm = MagicMock()
+    llm.complete = AsyncMock(return_value="not json")
+    enricher = ArticleEnricher(factory, llm, settle_seconds=0)
+
+    assert await enricher.enrich_next_batch() == 0
+    release_sql = _sql(session.execute.await_args_list[-1].args[0])
+    assert "SET enriching_at=%(enriching_at)s" in release_sql
+    assert session.execute.await_args_list[-1].args[0].compile().params["enriching_at"] is None
+    # Claim and release commit; no results are written.
+    assert session.commit.await_count == 2
+    assert enricher.stats()["failed_batches"] == 1
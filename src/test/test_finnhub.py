@@ -0,0 +1,75 @@
+import asyncio
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.services import finnhub
+from src.services.finnhub import MAX_RETRY_DELAY_SECONDS, FinnhubClient
+from src.services.limits import Priority, TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_serves_interactive_waiters_first():
+    bucket = TokenBucket(rate_per_minute=600, burst=1)
+    await bucket.acquire()
+    order = []
+
+    async def take(name, priority):
+        await bucket.acquire(priority)
+        order.append(name)
+
+    background = asyncio.create_task(take("background", Priority.BACKGROUND))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(take("interactive", Priority.INTERACTIVE))
+    await asyncio.wait_for(asyncio.gather(background, interactive), timeout=1)
+
+    assert order == ["interactive", "background"]
+
+
+@pytest.mark.asyncio
+async def test_client_retries_after_429_and_sends_token():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"c": 1.0})
+
+    client = FinnhubClient(
+        "secret", calls_per_minute=6000, burst=5, transport=httpx.MockTransport(handler)
+    )
+    payload = await client.get("https://finnhub.test/quote", {"symbol": "AAPL"})
+    await client.close()
+
+    assert payload == {"c": 1.0}
+    assert len(calls) == 2
+    assert calls[0].url.params["token"] == "secret"
+    assert client.stats()["throttled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_oversized_retry_after_is_capped(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(finnhub.asyncio, "sleep", fake_sleep)
+    responses = iter(
+        [httpx.Response(429, headers={"Retry-After": "86400"}), httpx.Response(200, json={})]
+    )
+    client = FinnhubClient(
+        "secret",
+        calls_per_minute=6000,
+        burst=5,
+        transport=httpx.MockTransport(lambda request: next(responses)),
+    )
+    client._bucket.pause = MagicMock()
+
+    await client.get("https://finnhub.test/quote", {"symbol": "AAPL"})
+    await client.close()
+
+    client._bucket.pause.assert_called_once_with(MAX_RETRY_DELAY_SECONDS)
+    assert sleeps == [MAX_RETRY_DELAY_SECONDS]
@@ -0,0 +1,174 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.news import leader
+from src.news.leader import MEMBER_SLOT, PollerElection
+from src.streaming.dispatcher import NewsDispatcher
+from src.util import shard_for
+
+
+def make_election(shard_count=3):
+    loop = MagicMock()
+    loop.start = AsyncMock()
+    loop.stop = AsyncMock()
+    dispatcher = MagicMock()
+    election = PollerElection(
+        loop,
+        dispatcher,
+        lock_key=1,
+        shard_count=shard_count,
+        retry_seconds=0.01,
+        orphan_grace_seconds=60,
+    )
+    return election, loop, dispatcher
+
+
+class FakeLocks:
+    """Advisory locks shared by several fake asyncpg connections."""
+
+    def __init__(self):
+        self.owners = {}
+        self.members = set()
+
+    def connection(self):
+        connection = MagicMock()
+
+        async def execute(query, *args):
+            if "lock_shared" in query:
+                self.members.add(connection)
+            elif "unlock" in query and self.owners.get(args[1]) is connection:
+                del self.owners[args[1]]
+
+        async def fetchval(query, key, shard):
+            if shard in self.owners:
+                return self.owners[shard] is connection
+            self.owners[shard] = connection
+            return True
+
+        async def fetch(query, key):
+            slots = [MEMBER_SLOT] * len(self.members) + list(self.owners)
+            return [{"objid": slot} for slot in slots]
+
+        connection.execute = AsyncMock(side_effect=execute)
+        connection.fetchval = AsyncMock(side_effect=fetchval)
+        connection.fetch = AsyncMock(side_effect=fetch)
+        connection.is_closed.return_value = False
+        connection.close = AsyncMock()
+        return connection
+
+    def kill(self, connection):
+        """Postgres releases every lock of a closed session."""
+        self.members.discard(connection)
+        self.owners = {s: c for s, c in self.owners.items() if c is not connection}
+
+
+async def _cancel(*tasks):
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_two_processes_split_the_shards():
+    locks = FakeLocks()
+    first, _, _ = make_election(shard_count=4)
+    second, _, second_dispatcher = make_election(shard_count=4)
+    first_connection, second_connection = locks.connection(), locks.connection()
+
+    # Alone at first, the first process takes everything...
+    first_task = asyncio.create_task(first._hold(first_connection))
+    await asyncio.sleep(0.005)
+    assert first.shards == {0, 1, 2, 3}
+    # ...then hands half over once a second process joins.
+    second_task = asyncio.create_task(second._hold(second_connection))
+    await asyncio.sleep(0.05)
+    await _cancel(first_task, second_task)
+
+    assert len(first.shards) == len(second.shards) == 2
+    assert first.shards | second.shards == {0, 1, 2, 3}
+    assert second_dispatcher.assign_shard.call_args.args == (second.shards, 4)
+
+    # When one process dies the survivor's fair share covers every shard.
+    locks.kill(second_connection)
+    first_task = asyncio.create_task(first._hold(first_connection))
+    await asyncio.sleep(0.03)
+    await _cancel(first_task)
+    assert first.shards == {0, 1, 2, 3}
+
+
+@pytest.mark.asyncio
+async def test_orphaned_shard_beyond_share_is_claimed_after_grace():
+    locks = FakeLocks()
+    locks.members.add(object())  # alive but never claims a shard
+    election, _, _ = make_election(shard_count=2)
+    election._grace = 0.05
+
+    task = asyncio.create_task(election._hold(locks.connection()))
+    await asyncio.sleep(0.03)
+    assert len(election.shards) == 1
+    await asyncio.sleep(0.06)
+    await _cancel(task)
+
+    assert election.shards == {0, 1}
+
+
+@pytest.mark.asyncio
+async def test_lost_connection_steps_down_and_closes(monkeypatch):
+    election, loop, dispatcher = make_election(shard_count=2)
+    connection = FakeLocks().connection()
+    lock_calls = connection.execute.side_effect
+
+    async def execute(query, *args):
+        if query == "SELECT 1":
+            raise ConnectionError("server closed the connection")
+        return await lock_calls(query, *args)
+
+    connection.execute.side_effect = execute
+    connected = asyncio.Event()
+
+    async def connect(dsn):
+        if connected.is_set():
+            await asyncio.Event().wait()
+        connected.set()
+        return connection
+
+    monkeypatch.setattr(leader.asyncpg, "connect", connect)
+    monkeypatch.setattr(leader, "asyncpg_dsn", lambda: "postgresql://test")
+    await election.start()
+    await asyncio.sleep(0.05)
+    await election.stop()
+
+    assert election.shards == set()
+    assert not election.is_leader
+    dispatcher.assign_shard.assert_called_with(None)
+    loop.stop.assert_awaited()
+    connection.close.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_singletons_follow_shard_zero():
+    locks = FakeLocks()
+    ingestor = MagicMock(start=AsyncMock(), stop=AsyncMock())
+    election, _, _ = make_election(shard_count=2)
+    election._singletons = [ingestor]
+    connection = locks.connection()
+
+    await election._lead({1})
+    ingestor.start.assert_not_awaited()
+    await election._lead({0})
+    await election._lead(set())
+    ingestor.start.assert_awaited_once()
+    await election._release(connection, [0])
+    ingestor.stop.assert_awaited_once()
+
+
+def test_dispatcher_owns_symbols_of_all_held_shards():
+    dispatcher = NewsDispatcher(MagicMock(), MagicMock(), MagicMock(), MagicMock())
+    symbols = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META"]
+
+    dispatcher.assign_shard({0, 2}, 3)
+    assert [dispatcher.owns(s) for s in symbols] == [shard_for(s, 3) in {0, 2} for s in symbols]
+    dispatcher.assign_shard({0, 1, 2}, 3)
+    assert all(dispatcher.owns(s) for s in symbols)
@@ -0,0 +1,190 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import Insert
+
+from src.services.llm_cache import CachedLLMService, complete_validated, prompt_fingerprint
+from src.services.llm_service import LLMServiceError
+
+
+def _statements(session):
+    return [call.args[0] for call in session.execute.await_args_list]
+
+
+def _inserts(session):
+    return [statement for statement in _statements(session) if isinstance(statement, Insert)]
+
+
+def _llm(content='{"summary": "ok"}'):
+    llm = MagicMock()
+    llm.complete = AsyncMock(return_value=content)
+    return llm
+
+
+def _strict(content):
+    if not content.startswith("{"):
+        raise LLMServiceError("LLM did not return valid JSON.")
+    return content
+
+
+PROMPT = dict(system_prompt="system", user_prompt="user", temperature=0.2)
+
+
+def test_key_covers_model_temperature_and_max_tokens():
+    base = prompt_fingerprint("gpt", 0.2, 800, "s", "u")
+
+    assert base == prompt_fingerprint("gpt", 0.2, 800, "s", "u")
+    assert base != prompt_fingerprint("gpt", 0.2, 1200, "s", "u")
+    assert base != prompt_fingerprint("gpt", 0.7, 800, "s", "u")
+    assert base != prompt_fingerprint("llama", 0.2, 800, "s", "u")
+
+
+@pytest.mark.asyncio
+async def test_validated_response_is_stored_in_both_tiers_with_ttl(session_factory):
+    factory, session = session_factory()
+    llm = _llm()
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600, max_entries=10)
+
+    first = await cache.complete(**PROMPT, max_tokens=800, validate=_strict)
+    second = await cache.complete(**PROMPT, max_tokens=800, validate=_strict)
+
+    assert first == second == '{"summary": "ok"}'
+    assert llm.complete.await_count == 1
+    (insert,) = _inserts(session)
+    params = insert.compile(dialect=postgresql.dialect()).params
+    remaining = (params["expires_at"] - datetime.now(timezone.utc)).total_seconds()
+    assert 590 < remaining <= 600
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["db_hits"], stats["misses"]) == (1, 0, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_rejected_response_is_never_cached(session_factory):
+    factory, session = session_factory()
+    llm = _llm("Sorry, I can't")
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600)
+
+    for _ in range(2):
+        with pytest.raises(LLMServiceError):
+            await complete_validated(cache, _strict, **PROMPT, max_tokens=800)
+
+    assert llm.complete.await_count == 2
+    assert _inserts(session) == []
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_database_tier_answers_without_calling_the_provider(session_factory):
+    factory, session = session_factory(scalar='{"summary": "from db"}')
+    llm = _llm()
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600)
+
+    assert await cache.complete(**PROMPT, max_tokens=800) == '{"summary": "from db"}'
+    llm.complete.assert_not_awaited()
+    assert cache.stats()["db_hits"] == 1
+    read = str(_statements(session)[0].compile(dialect=postgresql.dialect()))
+    assert "llm_cache.expires_at >" in read
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_prompts_share_one_provider_call(session_factory):
+    factory, _ = session_factory()
+    llm = _llm()
+
+    async def slow(**kwargs):
+        await asyncio.sleep(0.01)
+        return '{"summary": "ok"}'
+
+    llm.complete.side_effect = slow
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600)
+
+    results = await asyncio.gather(
+        *(cache.complete(**PROMPT, max_tokens=800, validate=_strict) for _ in range(5))
+    )
+
+    assert set(results) == {'{"summary": "ok"}'}
+    assert llm.complete.await_count == 1
+    assert cache.stats()["memory_hits"] == 4
+
+
+def _streaming_llm(*deltas, delay=0.0):
+    llm = MagicMock()
+    calls = []
+
+    async def stream(**kwargs):
+        calls.append(kwargs)
+        for delta in deltas:
+            await asyncio.sleep(delay)
+            yield delta
+
+    llm.stream = stream
+    return llm, calls
+
+
+async def _collect(iterator):
+    return [delta async for delta in iterator]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_streams_share_one_provider_stream(session_factory):
+    factory, session = session_factory()
+    llm, calls = _streaming_llm('{"summary"', ': "ok"}', delay=0.01)
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600)
+
+    results = await asyncio.gather(
+        *(_collect(cache.stream(**PROMPT, max_tokens=800, validate=_strict)) for _ in range(3))
+    )
+
+    assert len(calls) == 1
+    assert sorted(results, key=len) == [
+        ['{"summary": "ok"}'],
+        ['{"summary": "ok"}'],
+        ['{"summary"', ': "ok"}'],
+    ]
+    assert len(_inserts(session)) == 1
+    assert await _collect(cache.stream(**PROMPT, max_tokens=800)) == ['{"summary": "ok"}']
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"]) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_rejected_stream_is_never_cached(session_factory):
+    factory, session = session_factory()
+    llm, calls = _streaming_llm("Sorry, ", "I can't")
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600)
+
+    for _ in range(2):
+        with pytest.raises(LLMServiceError):
+            await _collect(cache.stream(**PROMPT, max_tokens=800, validate=_strict))
+
+    assert len(calls) == 2
+    assert _inserts(session) == []
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_both_tiers_and_overwrites_them(session_factory):
+    factory, session = session_factory(scalar='{"summary": "old"}')
+    llm = _llm('{"summary": "new"}')
+    cache = CachedLLMService(llm, factory, model="gpt", ttl_seconds=600)
+
+    assert await cache.complete(**PROMPT, max_tokens=800) == '{"summary": "old"}'
+    fresh = await complete_validated(cache, _strict, refresh=True, **PROMPT, max_tokens=800)
+
+    assert fresh == '{"summary": "new"}'
+    assert llm.complete.await_count == 1
+    assert len(_inserts(session)) == 1
+    assert await cache.complete(**PROMPT, max_tokens=800) == '{"summary": "new"}'
+
+    stream_llm, calls = _streaming_llm('{"summary": "newer"}')
+    streaming = CachedLLMService(stream_llm, factory, model="gpt", ttl_seconds=600)
+    streaming._memory.put(
+        prompt_fingerprint("gpt", 0.2, 800, "system", "user"), '{"summary": "old"}'
+    )
+    deltas = await _collect(streaming.stream(**PROMPT, max_tokens=800, refresh=True))
+    assert deltas == ['{"summary": "newer"}'] and len(calls) == 1
+    assert await _collect(streaming.stream(**PROMPT, max_tokens=800)) == ['{"summary": "newer"}']
@@ -0,0 +1,111 @@
+import asyncio
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.limits import Priority, PrioritySemaphore
+from src.services.llm_gateway import CircuitOpenError, LLMGateway
+from src.services.llm_service import LLMCompletion, LLMService, LLMServiceError
+
+
+def _flaky_openai_server(failures: int) -> Starlette:
+    calls = {"count": 0}
+
+    async def chat_completions(request):
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            return JSONResponse(
+                {"error": {"message": "slow down"}}, status_code=429, headers={"Retry-After": "0"}
+            )
+        return JSONResponse(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "test-model",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 12, "completion_tokens": 3, "total_tokens": 15},
+            }
+        )
+
+    return Starlette(routes=[Route("/v1/chat/completions", chat_completions, methods=["POST"])])
+
+
+@pytest.mark.asyncio
+async def test_gateway_retries_rate_limits_and_records_usage():
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=_flaky_openai_server(2)))
+    llm = LLMService("test-key", "http://fake-llm.local/v1", "test-model", http_client=client)
+    gateway = LLMGateway(llm, max_retries=3)
+
+    content = await gateway.complete(system_prompt="s", user_prompt="u")
+
+    stats = gateway.stats()
+    assert content == "ok"
+    assert stats["retries"] == 2
+    assert stats["prompt_tokens"] == 12
+    assert stats["completion_tokens"] == 3
+    assert stats["circuit_state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_fails_fast():
+    llm = MagicMock()
+    llm.create_completion = AsyncMock(
+        side_effect=LLMServiceError("down", status_code=503, retryable=True, retry_after=0)
+    )
+    gateway = LLMGateway(llm, max_retries=5, failure_threshold=2, reset_seconds=60)
+
+    with pytest.raises(LLMServiceError):
+        await gateway.complete(system_prompt="s", user_prompt="u")
+    with pytest.raises(CircuitOpenError):
+        await gateway.complete(system_prompt="s", user_prompt="u")
+
+    assert llm.create_completion.await_count == 2
+    assert gateway.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gateway_passes_through_successful_calls():
+    llm = MagicMock()
+    llm.create_completion = AsyncMock(return_value=LLMCompletion("done", 5, 1))
+
+    assert await LLMGateway(llm).complete(system_prompt="s", user_prompt="u") == "done"
+
+
+def test_retry_after_is_capped():
+    gateway = LLMGateway(MagicMock(), max_retries=3)
+    throttled = LLMServiceError("slow down", status_code=429, retryable=True, retry_after=3600)
+
+    assert gateway._on_error(throttled, 0) == 30.0
+
+
+@pytest.mark.asyncio
+async def test_priority_semaphore_serves_interactive_waiters_first():
+    semaphore = PrioritySemaphore(1)
+    await semaphore.acquire()
+    order = []
+
+    async def waiter(name, priority):
+        async with semaphore.slot(priority):
+            order.append(name)
+
+    tasks = [
+        asyncio.create_task(waiter("background", Priority.BACKGROUND)),
+        asyncio.create_task(waiter("interactive", Priority.INTERACTIVE)),
+    ]
+    await asyncio.sleep(0)
+    semaphore.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["interactive", "background"]
+    assert semaphore.in_use == 0
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.services.llm_cache import CachedLLMService
+from src.services.llm_gateway import LLMGateway
+from src.services.llm_router import LLMRouter
+from src.services.llm_service import LLMCompletion, LLMServiceError
+
+
+def _gateway(name, *, delay=0.0, error=None):
+    llm = MagicMock()
+    llm.enabled = True
+    llm.model = f"{name}-model"
+    llm.cancelled = False
+
+    async def create_completion(**kwargs):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            llm.cancelled = True
+            raise
+        if error is not None:
+            raise error
+        return LLMCompletion(name)
+
+    llm.create_completion = create_completion
+    return LLMGateway(llm, name=name, max_retries=0), llm
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_cancelled():
+    slow, slow_llm = _gateway("hosted", delay=5)
+    fast, _ = _gateway("local", delay=0.01)
+    router = LLMRouter([slow, fast], hedging=True, hedge_min_delay=0.05)
+
+    result = await asyncio.wait_for(router.complete(system_prompt="s", user_prompt="u"), 1)
+
+    assert result == "local"
+    assert slow_llm.cancelled
+    local = next(stats for stats in router.stats() if stats["provider"] == "local")
+    assert local["hedges"] == 1
+    assert local["hedge_wins"] == 1
+    assert slow.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_provider_falls_over_and_ranks_last():
+    broken, _ = _gateway("hosted", error=LLMServiceError("bad gateway", status_code=502, retryable=True))
+    healthy, _ = _gateway("local")
+    router = LLMRouter([broken, healthy], hedging=False)
+
+    assert await router.complete(system_prompt="s", user_prompt="u") == "local"
+    assert [gateway.name for gateway in router.ranked()] == ["local", "hosted"]
+
+
+@pytest.mark.asyncio
+async def test_unsampled_backup_does_not_outrank_sampled_primary():
+    primary, _ = _gateway("hosted", delay=0.001)
+    backup, _ = _gateway("local")
+    router = LLMRouter([primary, backup], hedging=False, latency_prior=5.0)
+
+    await router.complete(system_prompt="s", user_prompt="u")
+    assert [gateway.name for gateway in router.ranked()] == ["hosted", "local"]
+
+    for _ in range(5):
+        await router.complete(system_prompt="s", user_prompt="u")
+    assert [gateway.name for gateway in router.ranked()] == ["hosted", "local"]
+    # Once sampled, a primary slower than the prior lets the backup be tried.
+    slow_prior = LLMRouter([primary, backup], hedging=False, latency_prior=0.0)
+    assert [gateway.name for gateway in slow_prior.ranked()] == ["local", "hosted"]
+
+
+def test_cache_keys_on_the_ordered_provider_set():
+    hosted, _ = _gateway("hosted")
+    local, _ = _gateway("local")
+
+    single = CachedLLMService(LLMRouter([hosted]), MagicMock())
+    both = CachedLLMService(LLMRouter([hosted, local]), MagicMock())
+
+    assert single._model == "hosted=hosted-model"
+    assert both._model == "hosted=hosted-model,local=local-model"
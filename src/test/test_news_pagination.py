@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from unittest.mock import AsyncMock, MagicMock
+
+from src.api.routes import list_news
+from src.util import decode_cursor, encode_cursor
+
+
+def _article(article_id, published_at):
+    return SimpleNamespace(
+        id=article_id,
+        symbol="AAPL",
+        headline=f"headline {article_id}",
+        url="https://example.com/a",
+        summary=None,
+        digest=None,
+        sentiment=None,
+        source="Reuters",
+        published_at=published_at,
+    )
+
+
+def _session(*pages):
+    session = AsyncMock()
+    results = []
+    for page in pages:
+        result = MagicMock()
+        result.all.return_value = page
+        results.append(result)
+    session.execute.side_effect = results
+    return session
+
+
+def _sql(statement):
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_full_page_returns_cursor_for_last_row():
+    published = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    session = _session([_article(9, published), _article(8, published)])
+
+    response = await list_news(symbols="aapl", limit=2, cursor=None, session=session)
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert [article["id"] for article in json.loads(response.body)] == [9, 8]
+    assert "articles.body" not in sql
+    # Must match the indexes' null ordering or Postgres sorts the whole range.
+    assert "ORDER BY articles.published_at DESC NULLS LAST, articles.id DESC" in sql
+    assert decode_cursor(response.headers["X-Next-Cursor"]) == (published, 8)
+    assert session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_page_after_cursor_uses_keyset_and_tops_up_with_undated_rows():
+    published = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    session = _session([_article(5, published)], [_article(3, None)])
+
+    response = await list_news(
+        symbols=None, limit=3, cursor=encode_cursor(published, 6), session=session
+    )
+
+    dated_sql = _sql(session.execute.await_args_list[0].args[0])
+    undated_sql = _sql(session.execute.await_args_list[1].args[0])
+    assert "(articles.published_at, articles.id) < (" in dated_sql
+    assert "articles.published_at IS NULL" in undated_sql
+    assert [article["id"] for article in json.loads(response.body)] == [5, 3]
+    assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_malformed_cursor_is_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        await list_news(symbols=None, limit=10, cursor="%%%", session=AsyncMock())
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_several_symbols_merge_one_ordered_branch_per_symbol():
+    published = datetime(2026, 3, 2, tzinfo=timezone.utc)
+    session = _session([_article(9, published), _article(7, published)])
+
+    await list_news(symbols="AAPL,MSFT", limit=2, cursor=None, session=session)
+
+    sql = _sql(session.execute.await_args.args[0])
+    assert "UNION ALL" in sql
+    assert sql.count("articles.symbol = ") == 2
+    assert " IN (" not in sql
+    assert "ORDER BY anon_1.published_at DESC NULLS LAST, anon_1.id DESC" in sql
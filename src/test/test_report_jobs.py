@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.schemas import ReportJobStatus
+from src.services.report_jobs import ReportJobQueue
+from src.services.reports import ReportGenerationError
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_job():
+    release = asyncio.Event()
+    report = MagicMock(id=7)
+
+    async def generate(symbol, limit, force):
+        await release.wait()
+        return report
+
+    service = MagicMock()
+    service.generate_report = AsyncMock(side_effect=generate)
+    notifier = AsyncMock()
+    queue = ReportJobQueue(service, notifier=notifier, workers=2)
+    await queue.start()
+
+    first = queue.submit("symbol", "aapl")
+    second = queue.submit("symbol", "AAPL")
+    await asyncio.sleep(0)
+    release.set()
+    for _ in range(50):
+        if first.status == ReportJobStatus.SUCCEEDED:
+            break
+        await asyncio.sleep(0.01)
+    await queue.stop()
+
+    assert second is first
+    assert service.generate_report.await_count == 1
+    assert queue.get(first.id).report is report
+    symbol, message = notifier.announce.await_args.args
+    assert symbol == "AAPL"
+    assert message == {
+        "type": "report_job",
+        "job_id": first.id,
+        "symbol": "AAPL",
+        "status": "succeeded",
+        "report_id": 7,
+    }
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_new_jobs():
+    queue = ReportJobQueue(MagicMock(), queue_size=1)
+    queue.submit("symbol", "AAPL")
+
+    with pytest.raises(ReportGenerationError) as exc_info:
+        queue.submit("symbol", "MSFT")
+
+    assert exc_info.value.status_code == 503
+
+
+def test_aggregate_requests_share_one_job_regardless_of_parameters():
+    queue = ReportJobQueue(MagicMock())
+
+    first = queue.submit("aggregate", limit=20)
+    second = queue.submit("aggregate", limit=50, force=True)
+
+    assert second is first
+    assert first.symbol == "WATCHLIST"
@@ -0,0 +1,99 @@
+import json
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from unittest.mock import AsyncMock, MagicMock
+
+from src.services.llm_cache import CachedLLMService
+from src.services.llm_service import LLMService
+from src.services.reports import AISummaryService, _ReportPlan
+
+
+PIECES = ['{"summary": ["A", "B", "C"], ', '"sentiment_score": 70}']
+
+
+def _fake_openai_server() -> Starlette:
+    """Minimal OpenAI-compatible chat completions endpoint that streams."""
+
+    async def chat_completions(request):
+        body = await request.json()
+
+        async def events():
+            for piece in PIECES:
+                chunk = {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": body["model"],
+                    "choices": [
+                        {"index": 0, "delta": {"content": piece}, "finish_reason": None}
+                    ],
+                }
+                yield f"data: {json.dumps(chunk)}\n\n"
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return Starlette(routes=[Route("/v1/chat/completions", chat_completions, methods=["POST"])])
+
+
+def _llm() -> LLMService:
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=_fake_openai_server()))
+    return LLMService("test-key", "http://fake-llm.local/v1", "test-model", http_client=client)
+
+
+@pytest.mark.asyncio
+async def test_llm_service_streams_deltas():
+    deltas = [delta async for delta in _llm().stream(system_prompt="s", user_prompt="u")]
+
+    assert deltas == PIECES
+
+
+def _plan() -> _ReportPlan:
+    return _ReportPlan(
+        symbol="AAPL",
+        articles=[],
+        price=MagicMock(current=100.0),
+        article_ids=[1],
+        system_prompt="s",
+        user_prompt="u",
+    )
+
+
+@pytest.mark.asyncio
+async def test_report_stream_forwards_deltas_then_stores_report():
+    service = AISummaryService(MagicMock(), _llm(), AsyncMock())
+    stored = MagicMock()
+    service._store_report = AsyncMock(return_value=stored)
+    plan = _plan()
+
+    events = [event async for event in service._stream_plan(plan)]
+
+    assert events[:-1] == [("delta", piece) for piece in PIECES]
+    assert events[-1] == ("report", stored)
+    content = service._store_report.await_args.args[1]
+    assert json.loads(content)["sentiment_score"] == 70
+
+
+@pytest.mark.asyncio
+async def test_cached_report_stream_does_not_store_invalid_output(session_factory):
+    async def prose(**kwargs):
+        yield "Sorry, no JSON today."
+
+    llm = MagicMock()
+    llm.stream = prose
+    sessions, session = session_factory()
+    cache = CachedLLMService(llm, sessions, model="test-model", ttl_seconds=600)
+    service = AISummaryService(MagicMock(), cache, AsyncMock())
+    service._store_report = AsyncMock(return_value=MagicMock())
+    service._fallback_content = MagicMock(return_value="fallback")
+
+    events = [event async for event in service._stream_plan(_plan())]
+
+    assert events[0] == ("delta", "Sorry, no JSON today.")
+    assert service._store_report.await_args.args[1] == "fallback"
+    assert cache.stats()["entries"] == 0
+    session.commit.assert_not_awaited()
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from src.news.scheduler import AdaptivePollScheduler, market_session_factor
+
+
+# Wednesday 2024-01-10, 15:00 UTC == 10:00 in New York (regular session).
+MARKET_OPEN = datetime(2024, 1, 10, 15, 0, tzinfo=timezone.utc)
+
+
+def _scheduler():
+    return AdaptivePollScheduler(base_interval=300, min_interval=30, max_interval=3600)
+
+
+def test_market_session_factor():
+    assert market_session_factor(MARKET_OPEN) == 0.5
+    assert market_session_factor(MARKET_OPEN + timedelta(hours=12)) == 3.0
+    assert market_session_factor(datetime(2024, 1, 13, 15, 0, tzinfo=timezone.utc)) == 6.0
+
+
+def test_new_symbols_are_due_immediately_and_removed_ones_are_skipped():
+    scheduler = _scheduler()
+    scheduler.sync(["AAPL", "MSFT"], MARKET_OPEN)
+    scheduler.sync(["AAPL"], MARKET_OPEN)
+
+    assert scheduler.due(MARKET_OPEN) == ["AAPL"]
+    assert scheduler.seconds_until_next(MARKET_OPEN) is None
+
+
+def test_busy_symbols_are_polled_more_often_than_quiet_ones():
+    scheduler = _scheduler()
+    scheduler.sync(["HOT", "COLD"], MARKET_OPEN)
+    now = MARKET_OPEN
+    for _ in range(5):
+        now += timedelta(minutes=5)
+        scheduler.record("HOT", 3, now)
+        scheduler.record("COLD", 0, now)
+
+    assert scheduler.interval_for("HOT", now) == 30
+    assert scheduler.interval_for("COLD", now) == 150
+    assert scheduler.due(now + timedelta(seconds=31)) == ["HOT"]
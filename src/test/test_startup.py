@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import Response
+
+from src.api.routes import ready
+from src.schemas import TickerSyncResult
+from src.services import startup
+from src.services.startup import StartupWarmup
+
+
+def make_warmup(monkeypatch, session_factory, *, last_sync, sync_result=None):
+    monkeypatch.setattr(startup.settings, "finnhub_api_key", "key")
+    monkeypatch.setattr(startup, "last_ticker_sync", AsyncMock(return_value=last_sync))
+    sync = AsyncMock(return_value=sync_result)
+    monkeypatch.setattr(startup, "sync_tickers_from_finnhub", sync)
+    factory, _ = session_factory()
+    index = MagicMock()
+    index.ready = True
+    index.refresh = AsyncMock()
+    services = AsyncMock()
+    warmup = StartupWarmup(
+        factory,
+        index,
+        start_services=services,
+        probes={"body_fetcher": lambda: False},
+        create_schema=False,
+        sync_interval_hours=24,
+    )
+    return warmup, sync, index, services
+
+
+@pytest.mark.asyncio
+async def test_recent_sync_is_skipped(monkeypatch, session_factory):
+    recent = datetime.now(timezone.utc) - timedelta(hours=1)
+    warmup, sync, index, services = make_warmup(monkeypatch, session_factory, last_sync=recent)
+    assert not warmup.ready
+
+    await warmup.run()
+
+    assert warmup.ready
+    services.assert_awaited_once()
+    sync.assert_not_awaited()
+    index.refresh.assert_awaited_once()
+    assert warmup.status() == {
+        "database": True,
+        "services": True,
+        "ticker_sync": True,
+        "ticker_search": True,
+        "body_fetcher": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_stale_sync_runs_and_rebuilds_index_on_changes(monkeypatch, session_factory):
+    stale = datetime.now(timezone.utc) - timedelta(days=2)
+    result = TickerSyncResult(total=10, inserted_or_updated=1, inserted=1, unchanged=9)
+    warmup, sync, index, _ = make_warmup(monkeypatch, session_factory, last_sync=stale, sync_result=result)
+
+    await warmup.run()
+
+    sync.assert_awaited_once()
+    assert index.refresh.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_ready_endpoint_returns_503_until_warm(monkeypatch, session_factory):
+    warmup, *_ = make_warmup(monkeypatch, session_factory, last_sync=None)
+    request = SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(warmup=warmup)))
+    response = Response()
+
+    body = await ready(request, response)
+
+    assert response.status_code == 503
+    assert body.ready is False and body.subsystems["database"] is False
+
+
+@pytest.mark.asyncio
+async def test_service_start_failure_is_reported_and_retried(monkeypatch, session_factory):
+    warmup, _, _, services = make_warmup(monkeypatch, session_factory, last_sync=None)
+    services.side_effect = [RuntimeError("broadcast listener down"), None]
+    sleeps = []
+
+    async def record_sleep(delay):
+        sleeps.append(delay)
+        assert warmup.errors == {"services": "broadcast listener down"}
+        assert not warmup.ready
+
+    monkeypatch.setattr(startup.asyncio, "sleep", record_sleep)
+
+    await warmup.run()
+
+    assert services.await_count == 2
+    assert sleeps == [5.0]
+    assert warmup.ready
+    assert "services" not in warmup.errors
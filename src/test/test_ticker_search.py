@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.schemas import TickerOut
+from src.services import ticker_search
+from src.services.ticker_search import TickerSearchIndex
+
+
+TICKERS = [
+    TickerOut(symbol="AAPL", name="Apple Inc"),
+    TickerOut(symbol="APLE", name="Apple Hospitality REIT Inc"),
+    TickerOut(symbol="A", name="Agilent Technologies Inc"),
+    TickerOut(symbol="AA", name="Alcoa Corp"),
+    TickerOut(symbol="MSFT", name="Microsoft Corp"),
+    TickerOut(symbol="PINE", name="Alpine Income Property Trust"),
+    TickerOut(symbol="BRK.B", name="Berkshire Hathaway Inc-Cl B"),
+]
+
+
+def build_index() -> TickerSearchIndex:
+    index = TickerSearchIndex(MagicMock())
+    index.build(TICKERS)
+    return index
+
+
+def symbols(results):
+    return [ticker.symbol for ticker in results]
+
+
+def test_exact_symbol_then_prefix_by_length():
+    index = build_index()
+
+    assert symbols(index.search("a", 3)) == ["A", "AA", "AAPL"]
+    assert symbols(index.search("aapl"))[0] == "AAPL"
+    assert symbols(index.search("brk.b")) == ["BRK.B"]
+
+
+def test_name_prefix_ranks_above_substring_and_fuzzy():
+    index = build_index()
+
+    assert symbols(index.search("apple")) == ["AAPL", "APLE"]
+    assert symbols(index.search("micro")) == ["MSFT"]
+    # "pine" is an exact symbol; the substring hit in "Alpine" comes after it.
+    assert symbols(index.search("pine")) == ["PINE"]
+    assert symbols(index.search("lpine")) == ["PINE"]
+
+
+def test_fuzzy_match_tolerates_typos():
+    index = build_index()
+
+    assert symbols(index.search("microsfot"))[:1] == ["MSFT"]
+    assert index.search("zzzz") == []
+
+
+def test_list_returns_symbols_in_order():
+    index = build_index()
+
+    assert symbols(index.list(3)) == ["A", "AA", "AAPL"]
+    assert len(index) == len(TICKERS)
+
+
+@pytest.mark.asyncio
+async def test_refresh_loads_active_tickers(session_factory):
+    factory, session = session_factory(
+        rows=[
+            {"symbol": "AAPL", "name": "Apple Inc", "exchange": "US", "mic": None, "currency": "USD", "type": None}
+        ]
+    )
+    session.scalar.return_value = None
+    index = TickerSearchIndex(factory)
+
+    assert not index.ready
+    assert await index.refresh() == 1
+    assert index.ready
+    assert symbols(index.search("apple")) == ["AAPL"]
+
+
+@pytest.mark.asyncio
+async def test_index_reloads_after_a_sync_on_another_worker(monkeypatch):
+    loaded_at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    last_sync = AsyncMock(return_value=loaded_at)
+    monkeypatch.setattr(ticker_search, "last_ticker_sync", last_sync)
+    monkeypatch.setattr(ticker_search, "RELOAD_CHECK_SECONDS", 0)
+    index = build_index()
+    index._synced_at = loaded_at
+    index.refresh = AsyncMock()
+
+    index.reload_if_stale()
+    await index._reload
+    index.refresh.assert_not_awaited()
+
+    last_sync.return_value = loaded_at + timedelta(hours=1)
+    index.reload_if_stale()
+    await index._reload
+    index.refresh.assert_awaited_once()
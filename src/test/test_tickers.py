@@ -0,0 +1,78 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.db.models import TickerSyncRun
+from src.services import tickers
+from src.services.tickers import STAGING_COLUMNS, sync_tickers_from_finnhub
+
+
+def make_session(rowcounts):
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock()
+    raw = MagicMock()
+    raw.driver_connection = driver
+    connection = MagicMock()
+    connection.get_raw_connection = AsyncMock(return_value=raw)
+    results = iter(rowcounts)
+
+    async def execute(statement):
+        result = MagicMock()
+        result.rowcount = next(results, 0)
+        return result
+
+    session = MagicMock()
+    session.execute = AsyncMock(side_effect=execute)
+    session.connection = AsyncMock(return_value=connection)
+    session.commit = AsyncMock()
+    return session, driver
+
+
+@pytest.mark.asyncio
+async def test_sync_copies_deduplicated_payload_and_reports_counts(monkeypatch):
+    client = MagicMock()
+    client.get = AsyncMock(
+        return_value=[
+            {"symbol": "aapl", "description": "APPLE INC", "currency": "USD"},
+            {"symbol": "AAPL", "description": "APPLE INC", "currency": "USD"},
+            {"symbol": "MSFT", "description": "MICROSOFT CORP", "delisted": False},
+            {"symbol": "OLD", "description": "GONE CORP", "delisted": True},
+            {"symbol": "", "description": "no symbol"},
+        ]
+    )
+    monkeypatch.setattr(tickers, "get_finnhub_client", lambda: client)
+    # CREATE TEMP TABLE, ANALYZE, then UPDATE changed / INSERT new / deactivate missing.
+    session, driver = make_session([0, 0, 1, 1, 4])
+
+    result = await sync_tickers_from_finnhub(session)
+
+    driver.copy_records_to_table.assert_awaited_once()
+    args, kwargs = driver.copy_records_to_table.call_args
+    assert args == ("ticker_staging",)
+    assert kwargs["columns"] == STAGING_COLUMNS
+    assert kwargs["records"] == [
+        ("AAPL", "APPLE INC", None, None, "USD", None, True),
+        ("MSFT", "MICROSOFT CORP", None, None, None, None, True),
+        ("OLD", "GONE CORP", None, None, None, None, False),
+    ]
+    assert result.total == 3
+    assert (result.updated, result.inserted, result.deactivated, result.unchanged) == (1, 1, 4, 1)
+    assert result.inserted_or_updated == 2
+    run = session.add.call_args.args[0]
+    assert isinstance(run, TickerSyncRun)
+    assert (run.total, run.inserted, run.updated, run.deactivated) == (3, 1, 1, 4)
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_empty_payload_skips_merge(monkeypatch):
+    client = MagicMock()
+    client.get = AsyncMock(return_value=[])
+    monkeypatch.setattr(tickers, "get_finnhub_client", lambda: client)
+    session, _ = make_session([])
+
+    result = await sync_tickers_from_finnhub(session)
+
+    assert result.total == 0
+    session.execute.assert_not_awaited()
+
@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.price_service import PriceService, PriceSnapshot
+from src.test.trade_stub import FakeTradeServer
+from src.streaming.trades import PriceTable, TradeStreamIngestor
+
+
+@pytest.mark.asyncio
+async def test_ingestor_fills_price_table_from_stand_in_server(session_factory):
+    from websockets.asyncio.server import serve
+
+    factory, _ = session_factory(scalars=["AAPL"])
+    table = PriceTable()
+    notifier = AsyncMock()
+    async with serve(FakeTradeServer(interval=0.01).handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        ingestor = TradeStreamIngestor(
+            factory,
+            table,
+            notifier,
+            url=f"ws://127.0.0.1:{port}",
+            tick_interval=0.02,
+        )
+        await ingestor.start()
+        for _ in range(100):
+            if notifier.announce.await_count:
+                break
+            await asyncio.sleep(0.01)
+        await ingestor.stop()
+
+    assert table.get("AAPL") is not None
+    symbol, message = notifier.announce.await_args.args
+    assert symbol == "AAPL"
+    assert message["type"] == "price"
+
+
+@pytest.mark.asyncio
+async def test_price_service_overlays_live_trades_on_reference_quote():
+    table = PriceTable()
+    service = PriceService(client=AsyncMock(), live_prices=table)
+    service._quotes.put(
+        "AAPL",
+        PriceSnapshot(
+            symbol="AAPL", current=100.0, open_price=99.0, previous_close=100.0, percent_change=0.0
+        ),
+    )
+    table.update("AAPL", 110.0, 10, time.time() * 1000)
+
+    snapshot = await service.fetch_quote("AAPL")
+
+    assert snapshot.current == 110.0
+    assert snapshot.percent_change == pytest.approx(10.0)
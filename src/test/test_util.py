@@ -1,4 +1,8 @@
-from src.util import normalize_symbol, parse_symbols
+from datetime import datetime, timezone
+
+import pytest
+
+from src.util import decode_cursor, encode_cursor, normalize_symbol, parse_symbols, shard_for
 
 
 def test_normalize_symbol():
@@ -7,3 +11,17 @@ def test_normalize_symbol():
 
 def test_parse_symbols_removes_duplicates():
     assert parse_symbols("aapl, AAPL, msft") == ["AAPL", "MSFT"]
+
+
+def test_shard_for_is_stable_and_normalized():
+    assert shard_for("aapl ", 4) == shard_for("AAPL", 4)
+    assert {shard_for(symbol, 4) for symbol in ("AAPL", "MSFT", "NVDA", "TSLA", "AMZN")} <= {0, 1, 2, 3}
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    published = datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc)
+
+    assert decode_cursor(encode_cursor(published, 42)) == (published, 42)
+    assert decode_cursor(encode_cursor(None, 7)) == (None, 7)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
@@ -0,0 +1,58 @@
+"""Stand-in for Finnhub's trade WebSocket, for tests and local development.
+
+Run ``python -m src.test.trade_stub`` and point ``FINNHUB_WS_URL`` at
+``ws://127.0.0.1:8765``. Subscribed symbols receive random-walk trades.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import time
+from typing import Dict, Set
+
+
+class FakeTradeServer:
+    def __init__(self, interval: float = 0.5, start_price: float = 100.0) -> None:
+        self._interval = interval
+        self._start_price = start_price
+        self._prices: Dict[str, float] = {}
+
+    async def handler(self, connection) -> None:
+        symbols: Set[str] = set()
+        sender = asyncio.create_task(self._send_trades(connection, symbols))
+        try:
+            async for raw in connection:
+                message = json.loads(raw)
+                symbol = message.get("symbol")
+                if message.get("type") == "subscribe" and symbol:
+                    symbols.add(symbol)
+                elif message.get("type") == "unsubscribe":
+                    symbols.discard(symbol)
+        finally:
+            sender.cancel()
+
+    async def _send_trades(self, connection, symbols: Set[str]) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            if not symbols:
+                continue
+            now_ms = int(time.time() * 1000)
+            data = []
+            for symbol in list(symbols):
+                price = self._prices.get(symbol, self._start_price)
+                price = round(price * (1 + random.uniform(-0.002, 0.002)), 2)
+                self._prices[symbol] = price
+                data.append({"s": symbol, "p": price, "v": random.randint(1, 500), "t": now_ms})
+            await connection.send(json.dumps({"type": "trade", "data": data}))
+
+
+async def main(host: str = "127.0.0.1", port: int = 8765) -> None:
+    from websockets.asyncio.server import serve
+
+    async with serve(FakeTradeServer().handler, host, port) as server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+import base64
+import json
+import zlib
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
 
 
 def normalize_symbol(symbol: str) -> str:
@@ -25,3 +29,26 @@ def parse_symbols(raw: str | None) -> List[str]:
 def ensure_list(symbols: Iterable[str]) -> List[str]:
     """Return normalized list from any iterable of symbols."""
     return [normalize_symbol(symbol) for symbol in symbols if symbol]
+
+
+def shard_for(symbol: str, shard_count: int) -> int:
+    """Stable shard index for a symbol (same on every process and restart)."""
+    return zlib.crc32(normalize_symbol(symbol).encode()) % shard_count
+
+
+def encode_cursor(published_at: Optional[datetime], row_id: int) -> str:
+    """Opaque keyset cursor for the ``(published_at, id)`` sort position."""
+    payload = json.dumps(
+        [published_at.isoformat() if published_at else None, row_id], separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[Optional[datetime], int]:
+    """Inverse of ``encode_cursor``; raises ``ValueError`` on malformed input."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        published, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(published) if published else None, int(row_id))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("invalid cursor") from exc